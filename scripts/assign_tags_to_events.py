@@ -1,104 +1,179 @@
 #!/usr/bin/env python3
 """
 Assign tags to events for testing the filtering functionality.
+
+Tags are inferred with the scraper's keyword rules (scrape/sources.yaml),
+see keyword_tagger.py.
+
+Runs are incremental: only approved events updated since the last run's
+watermark (.cache/assign_tags_state.json) are considered, events whose
+inferred tag is already their primary tag are skipped, and the rest are
+written with one `update ... in (ids)` request per tag and batch. A change
+to the tag rules or to the tags table forces a full run, as does --full.
+
+Usage:
+    python scripts/assign_tags_to_events.py
+    python scripts/assign_tags_to_events.py --full --dry-run
 """
 
+import argparse
+import hashlib
+import json
 import sys
+from collections import defaultdict
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.lib.supabase import get_supabase_client
+from keyword_tagger import SOURCES_PATH, KeywordTagger, resolve_tag_ids
+
+STATE_PATH = project_root / '.cache' / 'assign_tags_state.json'
+PAGE_SIZE = 1000
+# ids per `in` filter; keeps the request URL well under PostgREST limits
+UPDATE_BATCH_SIZE = 150
+
+
+def rules_fingerprint(tags):
+    """Hash of the tag rules and tags table; a change invalidates the watermark."""
+    digest = hashlib.sha256(SOURCES_PATH.read_bytes())
+    for tag in sorted(tags, key=lambda tag: tag['id']):
+        digest.update(f"{tag['id']}\0{tag['name']}\0".encode())
+    return digest.hexdigest()
+
+
+def load_state():
+    try:
+        with open(STATE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state):
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_PATH, 'w') as f:
+        json.dump(state, f, indent=2)
+
+
+def watermark_value(stamps, default=None):
+    """Latest of PostgREST timestamp strings, as UTC ISO with a Z suffix."""
+    parsed = [datetime.fromisoformat(stamp.replace('Z', '+00:00')) for stamp in stamps if stamp]
+    if not parsed:
+        return default
+    latest = max(parsed).astimezone(timezone.utc)
+    return latest.isoformat(timespec='microseconds').replace('+00:00', 'Z')
+
+
+def fetch_events(supabase, since=None):
+    """Approved events (updated after `since`, if given), fetched page by page."""
+    events = []
+    start = 0
+    while True:
+        query = (supabase.table('events')
+                 .select('id, title, description, location_id, primary_tag_id, updated_at')
+                 .eq('status', 'approved'))
+        if since:
+            query = query.gt('updated_at', since)
+        page = query.order('id').range(start, start + PAGE_SIZE - 1).execute().data or []
+        events.extend(page)
+        if len(page) < PAGE_SIZE:
+            return events
+        start += PAGE_SIZE
+
+
+def write_assignments(supabase, changes, dry_run=False):
+    """Set primary_tag_id with one request per tag and batch; returns (updated, failed) counts."""
+    by_tag = defaultdict(list)
+    for event_id, tag_id in changes:
+        by_tag[tag_id].append(event_id)
 
-def assign_tags_to_events():
-    """Assign tags to some events for testing."""
+    updated = failed = 0
+    for tag_id, event_ids in by_tag.items():
+        for start in range(0, len(event_ids), UPDATE_BATCH_SIZE):
+            batch = event_ids[start:start + UPDATE_BATCH_SIZE]
+            if dry_run:
+                updated += len(batch)
+                continue
+            try:
+                result = supabase.table('events').update({
+                    'primary_tag_id': tag_id
+                }).in_('id', batch).execute()
+                updated += len(result.data or [])
+                failed += len(batch) - len(result.data or [])
+            except Exception as e:
+                print(f"Error assigning tag {tag_id} to {len(batch)} events: {e}")
+                failed += len(batch)
+    return updated, failed
+
+
+def assign_tags_to_events(full=False, dry_run=False):
+    """Assign inferred primary tags to approved events changed since the last run."""
+    # Deferred so --help does not pay for the supabase client import
+    from src.lib.supabase import get_supabase_client
     supabase = get_supabase_client()
-    
+
     # Get all tags
     tags_result = supabase.table('tags').select('id, name').execute()
     if not tags_result.data:
         print("No tags found in database")
         return
-    
-    tags = {tag['name']: tag['id'] for tag in tags_result.data}
-    print(f"Available tags: {list(tags.keys())}")
-    
-    # Get all events
-    events_result = supabase.table('events').select('id, title').eq('status', 'approved').execute()
-    if not events_result.data:
-        print("No events found in database")
+
+    print(f"Available tags: {[tag['name'] for tag in tags_result.data]}")
+
+    state = load_state()
+    fingerprint = rules_fingerprint(tags_result.data)
+    since = None
+    if not full and state.get('fingerprint') == fingerprint:
+        since = state.get('watermark')
+    elif not full and state:
+        print("Tag rules or tags changed since the last run; considering all events")
+
+    events = fetch_events(supabase, since)
+    print(f"Found {len(events)} events" + (f" updated since {since}" if since else ""))
+    if not events:
         return
-    
-    events = events_result.data
-    print(f"Found {len(events)} events")
-    
-    # Assign tags based on event titles (simple keyword matching)
-    tag_assignments = []
-    
-    for event in events:
-        title = event['title'].lower()
-        
-        # Simple keyword-based tag assignment
-        if any(word in title for word in ['music', 'concert', 'band', 'festival']):
-            if 'Arts+Culture' in tags:
-                tag_assignments.append({
-                    'id': event['id'],
-                    'primary_tag_id': tags['Arts+Culture']
-                })
-        elif any(word in title for word in ['sports', 'ride', 'marathon']):
-            if 'Sports' in tags:
-                tag_assignments.append({
-                    'id': event['id'],
-                    'primary_tag_id': tags['Sports']
-                })
-        elif any(word in title for word in ['family', 'kids', 'children']):
-            if 'Family' in tags:
-                tag_assignments.append({
-                    'id': event['id'],
-                    'primary_tag_id': tags['Family']
-                })
-        elif any(word in title for word in ['nature', 'outdoor', 'trail']):
-            if 'Nature' in tags:
-                tag_assignments.append({
-                    'id': event['id'],
-                    'primary_tag_id': tags['Nature']
-                })
-        elif any(word in title for word in ['school', 'library', 'education']):
-            if 'School' in tags:
-                tag_assignments.append({
-                    'id': event['id'],
-                    'primary_tag_id': tags['School']
-                })
-        elif any(word in title for word in ['town', 'community', 'market']):
-            if 'Town' in tags:
-                tag_assignments.append({
-                    'id': event['id'],
-                    'primary_tag_id': tags['Town']
-                })
-        elif any(word in title for word in ['civic', 'committee', 'advisory']):
-            if 'Civic' in tags:
-                tag_assignments.append({
-                    'id': event['id'],
-                    'primary_tag_id': tags['Civic']
-                })
-    
-    # Update events with tag assignments
-    for assignment in tag_assignments:
-        try:
-            result = supabase.table('events').update({
-                'primary_tag_id': assignment['primary_tag_id']
-            }).eq('id', assignment['id']).execute()
-            
-            if result.data:
-                print(f"Assigned tag to event: {assignment['id']}")
-            else:
-                print(f"Failed to assign tag to event: {assignment['id']}")
-        except Exception as e:
-            print(f"Error assigning tag to event {assignment['id']}: {e}")
-    
-    print(f"Assigned tags to {len(tag_assignments)} events")
+
+    # Location names for the venue_tags fallback
+    locations_result = supabase.table('locations').select('id, name').execute()
+    location_names = {location['id']: location['name'] for location in locations_result.data or []}
+
+    # Assign tags with the tag_keywords / venue_tags rules from scrape/sources.yaml
+    tagger = KeywordTagger.from_sources()
+    tag_names = tagger.infer_many(events, location_names)
+    tag_ids = resolve_tag_ids(tag_names, tags_result.data)
+
+    missing = sorted({name for name, tag_id in zip(tag_names, tag_ids) if name and not tag_id})
+    if missing:
+        print(f"Inferred tags not in database: {missing}")
+
+    changes = [
+        (event['id'], tag_id)
+        for event, tag_id in zip(events, tag_ids)
+        if tag_id and tag_id != event.get('primary_tag_id')
+    ]
+    unchanged = sum(1 for tag_id in tag_ids if tag_id) - len(changes)
+
+    updated, failed = write_assignments(supabase, changes, dry_run)
+    print(f"{'Would assign' if dry_run else 'Assigned'} tags to {updated} events "
+          f"({unchanged} already tagged, {failed} failed)")
+
+    # Only advance when every change landed, so failed events are retried next run.
+    # The writes above bump updated_at, so their events are re-read (and skipped) once.
+    if not dry_run and not failed:
+        watermark = watermark_value((event.get('updated_at') for event in events), since)
+        save_state({'fingerprint': fingerprint, 'watermark': watermark})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Assign inferred primary tags to approved events')
+    parser.add_argument('--full', action='store_true', help='Ignore the watermark and consider every event')
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing them')
+    args = parser.parse_args()
+    assign_tags_to_events(full=args.full, dry_run=args.dry_run)
+
 
 if __name__ == "__main__":
-    assign_tags_to_events() 
\ No newline at end of file
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark event model validation.
+
+Compares two ways of validating the same synthetic CSV-style rows with the
+Event model from models.py:
+
+- per-row: Event.model_validate(row) for each row
+- batch: validate_events(rows), a single EventListAdapter call for the whole list
+
+Usage:
+    python scripts/benchmark_models.py --rows 20000
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from models import Event, validate_events
+
+
+def make_rows(count: int, seed: int = 42) -> List[Dict[str, str]]:
+    """Generate CSV-style event rows (strings, '' and \\N for nulls)."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        hour = rng.randint(8, 18)
+        rows.append({
+            'title': f'Event {i}',
+            'description': rng.choice(['A community event.', '', '\\N']),
+            'start_date': f'2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+            'end_date': '',
+            'start_time': f'{hour:02d}:00:00',
+            'end_time': rng.choice([f'{hour + 1:02d}:30:00', '']),
+            'location_id': '\\N',
+            'organization_id': '',
+            'website': rng.choice(['https://example.com/event', '']),
+            'registration_link': '\\N',
+            'featured': rng.choice(['t', 'f', 'true', 'false']),
+            'exclude_from_calendar': 'f',
+            'registration': rng.choice(['yes', 'no']),
+            'cost': rng.choice(['Free', '$10', '']),
+            'status': rng.choice(['approved', 'Pending']),
+        })
+    return rows
+
+
+def time_call(fn: Callable[[], object], repeat: int) -> float:
+    """Best wall-clock time in seconds over `repeat` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark event model validation')
+    parser.add_argument('--rows', type=int, default=20000, help='Number of rows to validate')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per strategy (best is reported)')
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    strategies = [
+        ('per-row', lambda: [Event.model_validate(row) for row in rows]),
+        ('batch', lambda: validate_events(rows)),
+    ]
+
+    print(f'Validating {args.rows} rows (best of {args.repeat})')
+    baseline = None
+    for name, fn in strategies:
+        seconds = time_call(fn, args.repeat)
+        per_row_us = seconds / args.rows * 1e6
+        baseline = baseline or per_row_us
+        print(f'  {name:<10} {seconds:8.3f}s  {per_row_us:7.2f} us/row  {baseline / per_row_us:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
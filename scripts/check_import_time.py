@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Import-time regression check for the Python CLIs.
+
+Runs each entry point under `python -X importtime` with arguments that only
+print usage, sums the cumulative time of its top-level imports, subtracts
+interpreter startup (`python -X importtime -c pass`) and compares the median
+over several runs with a per-entry-point budget. Exits non-zero if any budget
+is exceeded, an entry point exits with an error (e.g. a failing import), or a
+script in scripts/ with a `__main__` block is neither budgeted nor listed in
+UNBUDGETED.
+
+Usage:
+    python scripts/check_import_time.py
+    python scripts/check_import_time.py --runs 5 --top 10
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+project_root = Path(__file__).parent.parent
+
+# Entry point -> (arguments that exit after printing usage, budget in ms)
+BUDGETS: Dict[str, Tuple[List[str], float]] = {
+    'scripts/data_manager.py': (['--help'], 60),
+    'scripts/dev_utils.py': (['--help'], 40),
+    'scripts/seed_staged_data.py': (['--help'], 120),
+    'scripts/seed_local_base.py': (['--help'], 120),
+    'scripts/rebase_local_dates.py': (['--help'], 120),
+    'scripts/promote_staged_events.py': (['--help'], 120),
+    'scripts/benchmark_models.py': (['--help'], 400),
+    'scripts/assign_tags_to_events.py': (['--help'], 60),
+    'scripts/tag_classifier.py': (['--help'], 200),
+    'scripts/link_checker.py': (['--help'], 400),
+    'scripts/search_index.py': (['--help'], 60),
+    'scripts/clean_seed_data.py': (['--help'], 100),
+    'scripts/fixture_bundles.py': (['--help'], 160),
+    'scripts/check_payload_parity.py': (['--help'], 350),
+}
+
+# Scripts with a `__main__` block that are deliberately not measured
+UNBUDGETED: Dict[str, str] = {
+    'scripts/check_import_time.py': 'this check',
+    'scripts/test_link_checker.py': 'runs its tests for any arguments',
+    'scripts/seed_database.py': 'no usage-only arguments, seeds on start',
+}
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def unbudgeted_entry_points() -> List[str]:
+    """Scripts with a `__main__` block missing from both BUDGETS and UNBUDGETED."""
+    missing = []
+    for path in sorted((project_root / 'scripts').glob('*.py')):
+        script = path.relative_to(project_root).as_posix()
+        if script in BUDGETS or script in UNBUDGETED:
+            continue
+        source = path.read_text()
+        if "__name__ == '__main__'" in source or '__name__ == "__main__"' in source:
+            missing.append(script)
+    return missing
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Return (module, cumulative_us, depth) for every -X importtime line."""
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            _, cumulative, indent, module = match.groups()
+            entries.append((module, int(cumulative), len(indent) // 2))
+    return entries
+
+
+def measure(args: List[str]) -> List[Tuple[str, int, int]]:
+    """Import times for one run; raises RuntimeError if the command exits non-zero."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + args,
+        cwd=project_root, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if line and not IMPORT_LINE.match(line)]
+        detail = errors[-1] if errors else 'no error output'
+        raise RuntimeError(f'exited with status {result.returncode}: {detail}')
+    return parse_importtime(result.stderr)
+
+
+def total_ms(entries: List[Tuple[str, int, int]]) -> float:
+    """Sum of top-level cumulative import times in milliseconds."""
+    return sum(cumulative for _, cumulative, depth in entries if depth == 0) / 1000
+
+
+def median_of(args: List[str], runs: int) -> Tuple[float, List[Tuple[str, int, int]]]:
+    """Median of `runs` measurements, after one untimed run to warm the import caches.
+
+    Returns the median in ms and the entries of the run closest to it.
+    """
+    measure(args)
+    samples = [(total_ms(entries), entries) for entries in (measure(args) for _ in range(runs))]
+    median = statistics.median(ms for ms, _ in samples)
+    return median, min(samples, key=lambda sample: abs(sample[0] - median))[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check CLI import time against per-entry-point budgets')
+    parser.add_argument('--runs', type=int, default=5, help='Measurements per entry point (median is used)')
+    parser.add_argument('--top', type=int, default=5, help='Slowest top-level imports to list per entry point')
+    args = parser.parse_args()
+
+    baseline_ms, baseline_entries = median_of(['-c', 'pass'], args.runs)
+    baseline_modules = {module for module, _, _ in baseline_entries}
+    print(f'Interpreter startup: {baseline_ms:.1f} ms (subtracted)')
+
+    failed = unbudgeted_entry_points()
+    for script in failed:
+        print(f'{script:<34} FAIL (entry point has no budget)')
+    for script, (script_args, budget_ms) in BUDGETS.items():
+        try:
+            ms, entries = median_of([script] + script_args, args.runs)
+        except RuntimeError as e:
+            print(f'{script:<34} FAIL ({e})')
+            failed.append(script)
+            continue
+        ms = max(ms - baseline_ms, 0.0)
+        status = 'ok' if ms <= budget_ms else 'OVER BUDGET'
+        print(f'{script:<34} {ms:8.1f} ms  (budget {budget_ms:.0f} ms)  {status}')
+        top_level = sorted(
+            ((module, cumulative) for module, cumulative, depth in entries
+             if depth == 0 and module not in baseline_modules),
+            key=lambda item: item[1], reverse=True
+        )
+        for module, cumulative in top_level[:args.top]:
+            print(f'    {cumulative / 1000:8.1f} ms  {module}')
+        if ms > budget_ms:
+            failed.append(script)
+
+    if failed:
+        print(f'\n{len(failed)} entry point(s) failed or over budget: {", ".join(failed)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
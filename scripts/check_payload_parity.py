@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Regression check for the trusted record path in records.py.
+
+Runs `check_payload_parity` (validated model payload vs trusted record
+payload) over:
+
+- SAMPLE_ROWS: rows shaped like PostgREST / backup output, covering the
+  conversions the record types reimplement (nulls, '+00', '+00:00' and 'Z'
+  timestamps, dates and times, URLs, enum statuses, extra columns)
+- the fixture bundles (fixture_bundles.py), including the generated
+  load-test bundle
+- any backup files given on the command line
+
+Exits non-zero on any mismatch or on a row the models reject.
+
+Usage:
+    python scripts/check_payload_parity.py
+    python scripts/check_payload_parity.py backups/db_backup_20250101_120000.json
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List
+
+from fixture_bundles import DEFINITIONS, load_bundle
+from records import RECORD_TYPES, check_payload_parity
+
+SAMPLE_ROWS: Dict[str, List[Dict[str, Any]]] = {
+    'locations': [
+        {'id': '0b1f8a1e-1d2c-4c47-9a55-1f4f3c3f0a01', 'name': 'Community Center',
+         'address': '123 Main St', 'website': 'https://communitycenter.example.com',
+         'phone': '(509) 555-0100', 'latitude': 47.6062, 'longitude': -122.3321,
+         'parent_location_id': None, 'status': 'approved',
+         'created_at': '2025-01-02T03:04:05.123456+00:00', 'updated_at': '2025-01-02T03:04:05Z'},
+        {'id': '0b1f8a1e-1d2c-4c47-9a55-1f4f3c3f0a02', 'name': 'Trailhead',
+         'address': None, 'website': None, 'phone': None, 'latitude': None, 'longitude': None,
+         'parent_location_id': '0b1f8a1e-1d2c-4c47-9a55-1f4f3c3f0a01', 'status': 'pending',
+         'created_at': None, 'updated_at': None},
+    ],
+    'organizations': [
+        {'id': '6a3b0e2c-5f7d-4f1b-8f0e-2b8f5d1c9e01', 'name': 'Arts Council',
+         'description': 'Promoting arts and culture', 'website': 'https://arts.example.org/about',
+         'phone': '509-555-0400', 'email': 'arts@example.org',
+         'location_id': '0b1f8a1e-1d2c-4c47-9a55-1f4f3c3f0a01', 'parent_organization_id': None,
+         'status': 'approved', 'created_at': '2025-03-04T05:06:07Z', 'updated_at': '2025-03-04T05:06:07Z'},
+    ],
+    'events': [
+        {'id': '9c2e4d6f-8a1b-4c3d-9e5f-7a9b1c3d5e01', 'title': 'Art Walk',
+         'description': 'Monthly art walk', 'start_date': '2025-06-20', 'end_date': '2025-06-20',
+         'start_time': '18:00:00', 'end_time': '21:00:00',
+         'location_id': '0b1f8a1e-1d2c-4c47-9a55-1f4f3c3f0a01',
+         'organization_id': '6a3b0e2c-5f7d-4f1b-8f0e-2b8f5d1c9e01', 'email': 'artwalk@example.org',
+         'website': 'https://artwalk.example.org', 'registration_link': None,
+         'primary_tag_id': None, 'secondary_tag_id': None, 'image_id': None,
+         'external_image_url': 'https://images.example.org/artwalk.jpg', 'featured': True,
+         'parent_event_id': None, 'exclude_from_calendar': False, 'registration': False,
+         'cost': 'Free', 'status': 'approved', 'source_id': None,
+         'details_outdated_checked_at': '2025-06-01 12:00:00.5+00',
+         'created_at': '2025-05-01T00:00:00+00:00', 'updated_at': '2025-05-02T00:00:00+00:00'},
+        # Multi-day, untimed, with columns the record does not mirror
+        {'id': '9c2e4d6f-8a1b-4c3d-9e5f-7a9b1c3d5e02', 'title': 'Harvest Festival',
+         'description': None, 'start_date': '2025-09-26', 'end_date': '2025-09-28',
+         'start_time': None, 'end_time': None, 'location_id': None, 'organization_id': None,
+         'email': None, 'website': None, 'registration_link': 'https://example.org/register?id=7',
+         'featured': False, 'exclude_from_calendar': True, 'registration': True,
+         'cost': None, 'status': 'pending', 'details_outdated_checked_at': None,
+         'created_at': None, 'updated_at': None,
+         'location_added': 'Riverside Park', 'comments': 'imported'},
+    ],
+}
+
+
+def print_report(label: str, report: Dict[str, Any]) -> bool:
+    """Print one parity report; returns True if it found a problem."""
+    print(f"{label:<28} {report['rows']:6} rows  {len(report['mismatches'])} mismatches  "
+          f"{report['url_normalized']} URL normalizations  {report['invalid']} invalid")
+    for mismatch in report['mismatches'][:10]:
+        print(f"    {mismatch['id']} {mismatch['column']}: "
+              f"{mismatch['trusted']!r} != {mismatch['validated']!r}")
+    return bool(report['mismatches'] or report['invalid'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check trusted vs validated payload parity')
+    parser.add_argument('backup_files', nargs='*', help='JSON backups written by data_manager.py backup')
+    args = parser.parse_args()
+
+    failed = False
+    for table, rows in SAMPLE_ROWS.items():
+        failed |= print_report(f'sample/{table}', check_payload_parity(table, rows))
+
+    for name in DEFINITIONS:
+        bundle = load_bundle(name)
+        for table, data in bundle['tables'].items():
+            if table not in RECORD_TYPES:
+                continue
+            rows = [dict(zip(data['columns'], row)) for row in data['rows']]
+            failed |= print_report(f'{name}/{table}', check_payload_parity(table, rows))
+
+    for path in args.backup_files:
+        with open(path) as f:
+            backup = json.load(f)
+        for table in RECORD_TYPES:
+            if table in backup:
+                failed |= print_report(f'{path}/{table}', check_payload_parity(table, backup[table]))
+
+    if failed:
+        print('\nTrusted record payloads differ from validated model payloads')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
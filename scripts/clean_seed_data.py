@@ -1,62 +1,149 @@
 #!/usr/bin/env python3
 """
 Clean seed data CSV files by replacing PostgreSQL \\N values with empty strings.
+
+Each file is streamed row by row into a temporary file next to it, which
+replaces the original with os.replace only after it is completely written,
+so an interrupted run never leaves a truncated CSV. Files are cleaned in
+parallel, files without \\N cells are left untouched, and the SHA-256 of
+every clean file is recorded in .cache/clean_seed_data.json so unchanged
+files are skipped on later runs without being parsed.
 """
 
+import argparse
 import csv
+import hashlib
+import json
 import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, Optional
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
 seed_data_dir = project_root / "seed_data"
+manifest_path = project_root / ".cache" / "clean_seed_data.json"
+
+# List of CSV files to clean
+csv_files = [
+    "locations.csv",
+    "organizations.csv",
+    "tags.csv",
+    "events.csv",
+    "community_announcements.csv"
+]
+
+
+def file_hash(file_path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
 
+def clean_csv_file(file_path: Path, known_hash: Optional[str] = None) -> Dict:
+    """
+    Clean a CSV file by replacing \\N with empty strings.
+
+    Returns a summary with the file's hash after cleaning; `skipped` is set
+    when the hash matched `known_hash` and the file was not parsed.
+    """
+    current_hash = file_hash(file_path)
+    if current_hash == known_hash:
+        return {"name": file_path.name, "skipped": True, "hash": current_hash}
+
+    rows = cleaned_cells = 0
+    fd, temp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as source, \
+                os.fdopen(fd, 'w', encoding='utf-8', newline='') as target:
+            writer = csv.writer(target)
+            for row in csv.reader(source):
+                for i, cell in enumerate(row):
+                    if cell == '\\N':
+                        row[i] = ''
+                        cleaned_cells += 1
+                writer.writerow(row)
+                rows += 1
+            target.flush()
+            os.fsync(target.fileno())
+
+        if cleaned_cells:
+            shutil.copymode(file_path, temp_name)
+            os.replace(temp_name, file_path)
+            current_hash = file_hash(file_path)
+        else:
+            # Already clean: keep the original bytes
+            os.unlink(temp_name)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
 
-def clean_csv_file(file_path: Path):
-    """Clean a CSV file by replacing \\N with empty strings."""
-    print(f"Cleaning {file_path.name}...")
-    
-    # Read the original file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        rows = list(reader)
-    
-    # Clean the data
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [cell.replace('\\N', '') if cell == '\\N' else cell for cell in row]
-        cleaned_rows.append(cleaned_row)
-    
-    # Write back to the file
-    with open(file_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(cleaned_rows)
-    
-    print(f"  ✓ Cleaned {len(rows)} rows")
+    return {"name": file_path.name, "skipped": False, "rows": rows,
+            "cleaned_cells": cleaned_cells, "hash": current_hash}
+
+
+def load_manifest() -> Dict[str, str]:
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: Dict[str, str]) -> None:
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = manifest_path.with_suffix(".tmp")
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temp_path, manifest_path)
 
 
 def main():
     """Clean all CSV files in the seed_data directory."""
+    parser = argparse.ArgumentParser(description="Replace \\N values in seed data CSV files")
+    parser.add_argument("--workers", type=int, help="Parallel worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Re-check files even if their hash is recorded")
+    args = parser.parse_args()
+
     print("Cleaning seed data CSV files...")
-    
-    # List of CSV files to clean
-    csv_files = [
-        "locations.csv",
-        "organizations.csv", 
-        "tags.csv",
-        "events.csv",
-        "community_announcements.csv"
-    ]
-    
+
+    manifest = {} if args.force else load_manifest()
+    paths = []
     for filename in csv_files:
         file_path = seed_data_dir / filename
         if file_path.exists():
-            clean_csv_file(file_path)
+            paths.append(file_path)
         else:
             print(f"  ⚠️  File not found: {filename}")
-    
+
+    if paths:
+        workers = min(args.workers or os.cpu_count() or 1, len(paths))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(clean_csv_file, path, manifest.get(str(path.relative_to(project_root))))
+                       for path in paths]
+            for path, future in zip(paths, futures):
+                try:
+                    result = future.result()
+                except (OSError, UnicodeDecodeError, csv.Error) as e:
+                    print(f"  ✗ {path.name}: {e}")
+                    continue
+                manifest[str(path.relative_to(project_root))] = result["hash"]
+                if result["skipped"]:
+                    print(f"  - {path.name} unchanged since last clean, skipped")
+                elif not result["cleaned_cells"]:
+                    print(f"  ✓ {path.name} already clean ({result['rows']} rows)")
+                else:
+                    print(f"  ✓ Cleaned {path.name}: {result['rows']} rows, "
+                          f"{result['cleaned_cells']} \\N values replaced")
+        save_manifest(manifest)
+
     print("\n✅ Seed data cleaning completed!")
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
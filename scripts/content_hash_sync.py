@@ -0,0 +1,165 @@
+"""
+Content-hash based reloads for CSV-seeded tables.
+
+Every seeded row is identified by a stable key (its CSV `id` or a natural key)
+and fingerprinted with a hash of its source row (not of values derived from
+the current date, such as shifted event dates). Hashes and the database id
+each row was written to are kept in `seed_meta.row_hashes`, so a reload only
+touches rows whose source changed and deletes only rows that disappeared from
+the source, keeping existing ids (and anything referencing them) intact.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.lib.db import execute_batch_values, insert_values
+
+HASH_TABLE = 'seed_meta.row_hashes'
+
+
+@dataclass
+class SyncResult:
+    """Row counts for one table sync."""
+    table: str
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    stale_ids: List[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        return (f'{self.table}: {self.inserted} inserted, {self.updated} updated, '
+                f'{self.unchanged} unchanged, {self.deleted} deleted')
+
+
+def ensure_hash_table(cur) -> None:
+    """Create the hash bookkeeping table (kept out of the public API schema)."""
+    cur.execute('CREATE SCHEMA IF NOT EXISTS seed_meta')
+    cur.execute(f'''
+        CREATE TABLE IF NOT EXISTS {HASH_TABLE} (
+            table_name text NOT NULL,
+            row_key text NOT NULL,
+            content_hash text NOT NULL,
+            row_id uuid NOT NULL,
+            PRIMARY KEY (table_name, row_key)
+        )
+    ''')
+
+
+def clear_hashes(cur, table: str) -> None:
+    """Forget stored hashes for a table (used when the table is rebuilt from scratch)."""
+    cur.execute(f'DELETE FROM {HASH_TABLE} WHERE table_name = %s', (table,))
+
+
+def content_hash(row: Dict) -> str:
+    """Stable hash of a row's column values."""
+    payload = json.dumps(row, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def make_keys(rows: Iterable[Dict], columns: Sequence[str]) -> List[str]:
+    """Build unique row keys from key columns, numbering repeated keys in order."""
+    seen: Dict[str, int] = {}
+    keys = []
+    for row in rows:
+        base = '\x1f'.join(str(row.get(col) or '').strip() for col in columns)
+        count = seen.get(base, 0)
+        seen[base] = count + 1
+        keys.append(base if count == 0 else f'{base}#{count}')
+    return keys
+
+
+def _update(cur, table: str, row_id: str, row: Dict) -> bool:
+    assignments = ','.join(f'{col} = %s' for col in row if col != 'id')
+    values = [value for col, value in row.items() if col != 'id']
+    cur.execute(f'UPDATE {table} SET {assignments} WHERE id = %s', values + [row_id])
+    return cur.rowcount > 0
+
+
+def _insert_new(cur, table: str, new_rows: List[Tuple[str, str, Dict]]) -> List[Tuple[str, str, str, str]]:
+    """Bulk insert new rows (grouped by column set) and return their hash records."""
+    groups: Dict[Tuple[str, ...], List[Tuple[str, str, Dict]]] = {}
+    for item in new_rows:
+        groups.setdefault(tuple(item[2].keys()), []).append(item)
+
+    records = []
+    for columns, group in groups.items():
+        if 'id' in columns:
+            # Repeated CSV ids would hit the same row twice in one upsert; the last row wins
+            last = {row['id']: row for _, _, row in group}
+            updates = ','.join(f'{col} = EXCLUDED.{col}' for col in columns)
+            insert_values(
+                cur, table, columns,
+                [[row[col] for col in columns] for row in last.values()],
+                on_conflict=f'ON CONFLICT (id) DO UPDATE SET {updates}'
+            )
+            records += [(table, key, digest, row['id']) for key, digest, row in group]
+            continue
+        ids = insert_values(
+            cur, table, columns,
+            [[row[col] for col in columns] for _, _, row in group],
+            returning='id'
+        )
+        records += [(table, key, digest, row_id) for (key, digest, _), (row_id,) in zip(group, ids)]
+    return records
+
+
+def upsert_changed(cur, table: str, keyed_rows: List[Tuple[str, Dict]],
+                   hash_sources: Optional[Sequence[Dict]] = None) -> SyncResult:
+    """
+    Insert new rows and update changed ones; unchanged rows are skipped.
+
+    Rows are compared by the hash of `hash_sources` (parallel to `keyed_rows`)
+    when given, else by the hash of the rows themselves, so values that are
+    recomputed on every run (e.g. dates shifted relative to today) do not make
+    an unchanged source row look changed.
+
+    Rows whose keys are no longer present are returned in `stale_ids` but not
+    deleted yet, so callers can delete children before parents.
+    """
+    result = SyncResult(table)
+    cur.execute(f'SELECT row_key, content_hash, row_id FROM {HASH_TABLE} WHERE table_name = %s', (table,))
+    stored = {row_key: (digest, str(row_id)) for row_key, digest, row_id in cur.fetchall()}
+
+    records = []
+    new_rows = []
+    for index, (key, row) in enumerate(keyed_rows):
+        digest = content_hash(hash_sources[index] if hash_sources is not None else row)
+        previous = stored.pop(key, None)
+        if previous and previous[0] == digest:
+            result.unchanged += 1
+        elif previous and _update(cur, table, previous[1], row):
+            records.append((table, key, digest, previous[1]))
+            result.updated += 1
+        else:
+            new_rows.append((key, digest, row))
+
+    if new_rows:
+        records += _insert_new(cur, table, new_rows)
+        result.inserted = len(new_rows)
+    if records:
+        execute_batch_values(
+            cur,
+            f'''INSERT INTO {HASH_TABLE} (table_name, row_key, content_hash, row_id) VALUES %s
+                ON CONFLICT (table_name, row_key)
+                DO UPDATE SET content_hash = EXCLUDED.content_hash, row_id = EXCLUDED.row_id''',
+            records
+        )
+
+    if stored:
+        result.stale_ids = [row_id for _, row_id in stored.values()]
+        cur.execute(
+            f'DELETE FROM {HASH_TABLE} WHERE table_name = %s AND row_key = ANY(%s)',
+            (table, list(stored.keys()))
+        )
+    return result
+
+
+def delete_stale(cur, result: SyncResult) -> None:
+    """Delete rows that were removed from the source since the last sync."""
+    if not result.stale_ids:
+        return
+    cur.execute(f'DELETE FROM {result.table} WHERE id = ANY(%s::uuid[])', (result.stale_ids,))
+    result.deleted = cur.rowcount
@@ -6,7 +6,6 @@ Provides CSV validation, test data generation, backup/restore, and duplicate det
 
 import argparse
 import csv
-import json
 import os
 import sys
 from datetime import datetime, timedelta
@@ -18,10 +17,11 @@ import uuid
 # Add the scripts directory to the path so we can import other modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    from supabase import create_client, Client
-    from models import Event, Location, Organization, Tag, Announcement
-except ImportError as e:
+# Ids per `.in_()` filter, keeps the PostgREST request URL short
+ID_BATCH_SIZE = 150
+
+
+def _import_error(e: ImportError) -> None:
     print(f"Error importing required modules: {e}")
     print("Please install required dependencies: pip install supabase pydantic")
     sys.exit(1)
@@ -31,7 +31,7 @@ class DataManager:
     def __init__(self):
         self.supabase_url = os.getenv('SUPABASE_URL', 'http://127.0.0.1:54321')
         self.supabase_key = os.getenv('SUPABASE_KEY', 'your-anon-key-here')
-        self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
+        self._supabase = None
         
         # Sample data for realistic test data generation
         self.sample_locations = [
@@ -60,6 +60,17 @@ class DataManager:
             "Farmers Market", "Holiday Celebration", "Educational Seminar"
         ]
 
+    @property
+    def supabase(self):
+        """Supabase client, created on first use so local-only commands skip the import."""
+        if self._supabase is None:
+            try:
+                from supabase import create_client
+            except ImportError as e:
+                _import_error(e)
+            self._supabase = create_client(self.supabase_url, self.supabase_key)
+        return self._supabase
+
     def validate_csv(self, file_path: str, entity_type: str) -> Dict[str, Any]:
         """Validate CSV file with detailed error reporting."""
         errors = []
@@ -109,6 +120,19 @@ class DataManager:
             'row_count': row_count
         }
 
+    def validate_csv_constraints(self, file_path: str, entity_type: str,
+                                 workers: Optional[int] = None) -> Any:
+        """Validate CSV rows against the database constraints across worker processes.
+
+        Returns a `validation.ValidationSummary`.
+        """
+        # Deferred: validation imports pydantic
+        from validation import validate_csv_data_parallel
+        
+        with open(file_path, 'r', encoding='utf-8') as file:
+            rows = list(csv.DictReader(file))
+        return validate_csv_data_parallel(rows, entity_type, workers=workers)
+
     def _validate_event_row(self, row: Dict[str, str], row_num: int, errors: List[str], warnings: List[str]):
         """Validate event-specific fields."""
         # Validate date format
@@ -272,6 +296,8 @@ class DataManager:
 
     def backup_database(self, backup_dir: str = "backups") -> str:
         """Create a backup of the current database state."""
+        import serialization
+        
         os.makedirs(backup_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = os.path.join(backup_dir, f"db_backup_{timestamp}.sql")
@@ -289,8 +315,8 @@ class DataManager:
                 'announcements': self.supabase.table('announcements').select('*').execute().data,
             }
             
-            with open(backup_file.replace('.sql', '.json'), 'w') as f:
-                json.dump(backup_data, f, indent=2, default=str)
+            with open(backup_file.replace('.sql', '.json'), 'wb') as f:
+                serialization.dump(backup_data, f, indent=True)
             
             print(f"Database backup created: {backup_file.replace('.sql', '.json')}")
             return backup_file.replace('.sql', '.json')
@@ -299,34 +325,76 @@ class DataManager:
             print(f"Error creating backup: {e}")
             return ""
 
+    def restore_database(self, backup_file: str, validate: bool = False, chunk_size: int = 500) -> Dict[str, int]:
+        """
+        Restore a JSON backup created by backup_database.
+
+        Backup rows came out of our own database, so by default they are
+        upserted through the trusted record path without model validation;
+        pass validate=True to re-validate events, locations and organizations.
+        """
+        # Deferred: records pulls in pydantic and the models
+        import serialization
+        from records import trusted_payloads, validated_payloads
+        
+        with open(backup_file, 'rb') as f:
+            backup_data = serialization.load(f)
+
+        build_payloads = validated_payloads if validate else trusted_payloads
+        restored = {}
+        # Parents before children so foreign keys resolve
+        for table in ['tags', 'locations', 'organizations', 'events', 'events_staged', 'announcements']:
+            rows = backup_data.get(table) or []
+            payloads = build_payloads(table, rows)
+            for start in range(0, len(payloads), chunk_size):
+                self.supabase.table(table).upsert(payloads[start:start + chunk_size]).execute()
+            restored[table] = len(payloads)
+            print(f"Restored {len(payloads)} rows into {table}")
+        return restored
+
+    def _rows_by_id(self, table: str, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch full rows of `table` for the given ids, keyed by id."""
+        rows = {}
+        for start in range(0, len(ids), ID_BATCH_SIZE):
+            batch = ids[start:start + ID_BATCH_SIZE]
+            for row in self.supabase.table(table).select('*').in_('id', batch).execute().data:
+                rows[row['id']] = row
+        return rows
+
     def detect_duplicates(self, entity_type: str = 'events') -> List[Dict[str, Any]]:
         """Detect exact duplicates in the database."""
         duplicates = []
         
         try:
             if entity_type == 'events':
-                # Get all events and check for exact title matches
-                events = self.supabase.table('events').select('*').execute().data
-                staged_events = self.supabase.table('events_staged').select('*').execute().data
-                all_events = events + staged_events
+                # Columnar batch keeps large event sets compact (requires numpy)
+                from event_batch import COLUMNS, EventBatch
                 
-                title_counts = {}
-                for event in all_events:
-                    title = event.get('title', '').strip().lower()
-                    if title in title_counts:
-                        title_counts[title].append(event)
-                    else:
-                        title_counts[title] = [event]
+                # Get all events and check for exact title matches
+                columns = ','.join(COLUMNS)
+                events = self.supabase.table('events').select(columns).execute().data
+                staged_events = self.supabase.table('events_staged').select(columns).execute().data
+                batch = EventBatch.from_rows(events + staged_events)
+                del events, staged_events
                 
                 # Find duplicates
-                for title, event_list in title_counts.items():
-                    if len(event_list) > 1:
-                        duplicates.append({
-                            'type': 'title_duplicate',
-                            'value': title,
-                            'count': len(event_list),
-                            'events': event_list
-                        })
+                groups = batch.group_by_keys(batch.normalized_titles(), min_size=2)
+                group_ids = {title: [row['id'] for row in batch.to_rows(positions)]
+                             for title, positions in groups.items()}
+                del batch
+                
+                # The batch only holds the compared columns; report full rows
+                ids = [event_id for event_ids in group_ids.values() for event_id in event_ids]
+                full_rows = {}
+                for table in ('events', 'events_staged'):
+                    full_rows.update(self._rows_by_id(table, ids))
+                for title, event_ids in group_ids.items():
+                    duplicates.append({
+                        'type': 'title_duplicate',
+                        'value': title,
+                        'count': len(event_ids),
+                        'events': [full_rows[event_id] for event_id in event_ids if event_id in full_rows]
+                    })
             
             elif entity_type == 'locations':
                 locations = self.supabase.table('locations').select('*').execute().data
@@ -392,13 +460,18 @@ class DataManager:
 def main():
     parser = argparse.ArgumentParser(description='Der Town Data Management Tool')
     parser.add_argument('command', choices=[
-        'validate-csv', 'generate-test-data', 'backup', 'detect-duplicates', 'cleanup'
+        'validate-csv', 'generate-test-data', 'backup', 'restore', 'detect-duplicates', 'cleanup'
     ], help='Command to execute')
-    parser.add_argument('--file', help='CSV file to validate (for validate-csv)')
+    parser.add_argument('--file', help='CSV file to validate (for validate-csv) or backup file (for restore)')
     parser.add_argument('--entity-type', choices=['events', 'locations', 'organizations', 'tags', 'announcements'], 
                        help='Entity type for validation or duplicate detection')
     parser.add_argument('--count', type=int, default=50, help='Number of test events to generate')
     parser.add_argument('--backup-dir', default='backups', help='Backup directory')
+    parser.add_argument('--validate', action='store_true',
+                       help='Re-validate rows with the Pydantic models on restore (default: trusted fast path)')
+    parser.add_argument('--workers', type=int,
+                       help='validate-csv: also check rows against the database constraints '
+                            'in this many processes (0 = one per CPU)')
     
     args = parser.parse_args()
     
@@ -409,6 +482,22 @@ def main():
             print("Error: --file and --entity-type are required for validate-csv")
             sys.exit(1)
         
+        if args.workers is not None:
+            if args.entity_type == 'tags':
+                print("Error: --workers is not supported for tags")
+                sys.exit(1)
+            if args.workers < 0:
+                print("Error: --workers must be 0 or more")
+                sys.exit(1)
+            try:
+                summary = manager.validate_csv_constraints(args.file, args.entity_type, args.workers or None)
+            except FileNotFoundError:
+                print(f"Error: File not found: {args.file}")
+                sys.exit(1)
+            print(summary.format())
+            if not summary.valid:
+                sys.exit(1)
+        
         result = manager.validate_csv(args.file, args.entity_type)
         if result['valid']:
             print(f"✅ CSV validation passed! {result['row_count']} rows processed.")
@@ -434,6 +523,14 @@ def main():
             print("❌ Backup failed")
             sys.exit(1)
     
+    elif args.command == 'restore':
+        if not args.file:
+            print("Error: --file is required for restore")
+            sys.exit(1)
+        
+        restored = manager.restore_database(args.file, validate=args.validate)
+        print(f"✅ Restore completed: {sum(restored.values())} rows")
+    
     elif args.command == 'detect-duplicates':
         if not args.entity_type:
             print("Error: --entity-type is required for detect-duplicates")
@@ -15,17 +15,17 @@ import json
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-try:
-    from supabase import create_client, Client
-    from scripts.models import Event, Organization, Location, Tag, Announcement
-except ImportError as e:
-    print(f"Import error: {e}")
-    print("Please install required dependencies: pip install supabase pydantic")
-    sys.exit(1)
 
-
-def get_supabase_client() -> Client:
+def get_supabase_client():
     """Get Supabase client for database operations."""
+    # Imported on first use so `validate` and usage output don't pay for supabase
+    try:
+        from supabase import create_client
+    except ImportError as e:
+        print(f"Import error: {e}")
+        print("Please install required dependencies: pip install supabase pydantic")
+        sys.exit(1)
+    
     url = os.getenv("SUPABASE_URL")
     key = os.getenv("SUPABASE_KEY")
     
@@ -37,151 +37,219 @@ def get_supabase_client() -> Client:
     return create_client(url, key)
 
 
-def reset_dev_db():
-    """Reset local database with sample data."""
+# Tables cleared by `reset`; every table referencing them is cleared (and snapshotted) too
+RESET_TABLES = ["tags", "locations", "organizations", "events", "announcements"]
+SNAPSHOT_DIR = project_root / ".cache" / "dev_snapshot"
+
+# Snapshot rows a table's constraints may reject by the time `reset` restores them. Each
+# table is restored through a temp copy; the DELETE conditions run on it until none
+# removes a row ({table} is the temp copy), and only the remaining rows are inserted.
+RESTORE_PRUNE = {
+    "events_staged": [
+        # events_staged_start_date_future: staged events that have started since the snapshot
+        "start_date < CURRENT_DATE",
+        # events_staged_parent_event_id_fkey: children of pruned events
+        "parent_event_id IS NOT NULL AND parent_event_id NOT IN (SELECT id FROM {table})",
+    ],
+}
+
+
+def _reset_closure(cur) -> List[str]:
+    """RESET_TABLES plus every public table that references them, parents before children."""
+    from graphlib import TopologicalSorter
+
+    cur.execute(
+        "SELECT child.relname, parent.relname FROM pg_constraint "
+        "JOIN pg_class child ON child.oid = conrelid JOIN pg_class parent ON parent.oid = confrelid "
+        "WHERE contype = 'f' AND connamespace = 'public'::regnamespace "
+        "AND parent.relnamespace = 'public'::regnamespace"
+    )
+    edges = [(child, parent) for child, parent in cur.fetchall() if child != parent]
+    tables = set(RESET_TABLES)
+    grew = True
+    while grew:
+        children = {child for child, parent in edges if parent in tables}
+        grew = not children <= tables
+        tables |= children
+    graph = {table: set() for table in tables}
+    for child, parent in edges:
+        if child in tables and parent in tables:
+            graph[child].add(parent)
+    return list(TopologicalSorter(graph).static_order())
+
+
+def _copy_columns(cur, table: str) -> List[str]:
+    """Columns COPY can write (generated columns excluded)."""
+    cur.execute(
+        "SELECT attname FROM pg_attribute WHERE attrelid = ('public.' || quote_ident(%s))::regclass "
+        "AND attnum > 0 AND NOT attisdropped AND attgenerated = '' ORDER BY attnum",
+        (table,)
+    )
+    return [row[0] for row in cur.fetchall()]
+
+
+def _copy_statement(table: str, columns: List[str], direction: str, schema: str = "public"):
+    """Binary COPY of `columns` of `schema`.`table` TO STDOUT or FROM STDIN, identifiers quoted."""
+    from psycopg2 import sql
+
+    return sql.SQL("COPY {} ({}) {} WITH (FORMAT binary)").format(
+        sql.Identifier(schema, table),
+        sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+        sql.SQL(direction),
+    )
+
+
+def _restore_pruned(cur, entry: Dict[str, Any], conditions: List[str]) -> int:
+    """Restore one snapshot table through a temp copy, dropping rows matching `conditions`.
+
+    Returns the number of snapshot rows that were not restored.
+    """
+    from psycopg2 import sql
+
+    table, columns = entry["name"], entry["columns"]
+    staging = sql.Identifier("pg_temp", f"restore_{table}")
+    cur.execute(sql.SQL("CREATE TABLE {} (LIKE {}) ON COMMIT DROP").format(
+        staging, sql.Identifier("public", table)
+    ))
+    with open(SNAPSHOT_DIR / entry["file"], "rb") as f:
+        cur.copy_expert(_copy_statement(f"restore_{table}", columns, "FROM STDIN", "pg_temp").as_string(cur), f)
+
+    pruned = 0
+    while True:
+        removed = 0
+        for condition in conditions:
+            cur.execute(sql.SQL("DELETE FROM {table} WHERE " + condition).format(table=staging))
+            removed += cur.rowcount
+        if not removed:
+            break
+        pruned += removed
+
+    column_list = sql.SQL(", ").join(sql.Identifier(column) for column in columns)
+    cur.execute(sql.SQL("INSERT INTO {} ({}) OVERRIDING SYSTEM VALUE SELECT {} FROM {}").format(
+        sql.Identifier("public", table), column_list, column_list, staging
+    ))
+    return pruned
+
+
+def _confirm_extra_tables(tables: List[str]) -> bool:
+    """Ask before emptying tables outside RESET_TABLES that no snapshot will refill."""
+    print("Reset would also empty these tables, which reference the reset tables:")
+    for table in tables:
+        print(f"  {table}")
+    if not sys.stdin.isatty():
+        print("Refusing without confirmation: run `snapshot` first, or pass --yes to empty them anyway")
+        return False
+    return input("Empty them? [y/N] ").strip().lower() in ("y", "yes")
+
+
+def snapshot_dev_db() -> None:
+    """Save the current contents of the reset tables as binary COPY files."""
+    from src.lib.db import get_cursor
+
+    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {"tables": []}
+    with get_cursor() as cur:
+        for table in _reset_closure(cur):
+            columns = _copy_columns(cur, table)
+            path = SNAPSHOT_DIR / f"{table}.bin"
+            with open(path, "wb") as f:
+                cur.copy_expert(_copy_statement(table, columns, "TO STDOUT").as_string(cur), f)
+            manifest["tables"].append({"name": table, "columns": columns, "file": path.name})
+    with open(SNAPSHOT_DIR / "manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Snapshot of {len(manifest['tables'])} tables saved to {SNAPSHOT_DIR}")
+
+
+def reset_dev_db(assume_yes: bool = False) -> bool:
+    """
+    Empty the reset tables with one TRUNCATE and reload the snapshot.
+
+    Public tables that reference the reset tables are emptied too. If any of
+    them is outside RESET_TABLES and not in the snapshot, the reset asks
+    first (and refuses when not interactive) unless `assume_yes` is set. The
+    TRUNCATE names every table instead of using CASCADE, so a reference from
+    another schema fails the reset rather than emptying that table.
+
+    Tables in RESTORE_PRUNE are restored without the snapshot rows their
+    constraints would now reject (e.g. staged events that have started).
+
+    Returns True if a snapshot was restored; False means the tables were
+    only emptied (run `snapshot` after seeding to make resets self-contained).
+    Exits with status 1 if the reset is cancelled or fails.
+    """
+    from psycopg2 import sql
+
+    from src.lib.db import get_cursor
+
     print("Resetting development database...")
-    
-    # This would typically call supabase db reset
-    # For now, we'll just clear existing data and seed
-    client = get_supabase_client()
-    
+    manifest_path = SNAPSHOT_DIR / "manifest.json"
+    manifest = None
+    if manifest_path.exists():
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    # Exit only after get_cursor() has committed or rolled back
     try:
-        # Clear existing data (in reverse dependency order)
-        client.table("events").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
-        client.table("announcements").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
-        client.table("organizations").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
-        client.table("locations").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
-        client.table("tags").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
-        
-        print("Database reset complete")
-        
+        with get_cursor() as cur:
+            tables = _reset_closure(cur)
+            saved = {entry["name"] for entry in manifest["tables"]} if manifest else set()
+            unsaved = [table for table in tables if table not in RESET_TABLES and table not in saved]
+            confirmed = not unsaved or assume_yes or _confirm_extra_tables(unsaved)
+            if confirmed:
+                cur.execute(sql.SQL("TRUNCATE {}").format(
+                    sql.SQL(", ").join(sql.Identifier("public", table) for table in tables)
+                ))
+            if confirmed and manifest:
+                for table in tables:
+                    if table not in saved:
+                        print(f"Warning: {table} is not in the snapshot and was left empty")
+                for entry in manifest["tables"]:
+                    if entry["name"] in RESTORE_PRUNE:
+                        pruned = _restore_pruned(cur, entry, RESTORE_PRUNE[entry["name"]])
+                        if pruned:
+                            print(f"Skipped {pruned} {entry['name']} rows its constraints no longer accept")
+                        continue
+                    with open(SNAPSHOT_DIR / entry["file"], "rb") as f:
+                        cur.copy_expert(
+                            _copy_statement(entry["name"], entry["columns"], "FROM STDIN").as_string(cur), f
+                        )
     except Exception as e:
         print(f"Error resetting database: {e}")
         sys.exit(1)
 
+    if not confirmed:
+        print("Reset cancelled; nothing was changed")
+        sys.exit(1)
+
+    print("Database reset complete" + (" (snapshot restored)" if manifest else ""))
+    return manifest is not None
+
+
+def seed_test_data(bundle: str = "demo"):
+    """
+    Seed database with a fixture bundle (minimal, demo or load-test).
+
+    Each table is loaded in one bulk operation: COPY over the direct database
+    connection `reset` uses, or, if that cannot connect, multi-row inserts
+    through the Supabase client.
+    """
+    import psycopg2
+
+    from fixture_bundles import copy_bundle, insert_bundle, load_bundle
+    from src.lib.db import get_cursor
+
+    print(f"Seeding database with the '{bundle}' fixture bundle...")
 
-def seed_test_data():
-    """Seed database with test data for development."""
-    print("Seeding database with test data...")
-    
-    client = get_supabase_client()
-    
     try:
-        # Create sample tags
-        tags_data = [
-            {"name": "Community", "calendar_id": "community_calendar_id", "share_id": "community_share_id"},
-            {"name": "Arts & Culture", "calendar_id": "arts_calendar_id", "share_id": "arts_share_id"},
-            {"name": "Sports & Recreation", "calendar_id": "sports_calendar_id", "share_id": "sports_share_id"},
-            {"name": "Education", "calendar_id": "education_calendar_id", "share_id": "education_share_id"},
-        ]
-        
-        for tag_data in tags_data:
-            client.table("tags").insert(tag_data).execute()
-        
-        # Create sample locations
-        locations_data = [
-            {
-                "name": "Community Center",
-                "address": "123 Main St, Der Town, WA 98826",
-                "website": "https://communitycenter.example.com",
-                "phone": "(509) 555-0100",
-                "latitude": 47.6062,
-                "longitude": -122.3321,
-                "status": "approved"
-            },
-            {
-                "name": "Public Library",
-                "address": "456 Oak Ave, Der Town, WA 98826",
-                "website": "https://library.example.com",
-                "phone": "(509) 555-0200",
-                "latitude": 47.6063,
-                "longitude": -122.3322,
-                "status": "approved"
-            },
-        ]
-        
-        for location_data in locations_data:
-            client.table("locations").insert(location_data).execute()
-        
-        # Create sample organizations
-        organizations_data = [
-            {
-                "name": "Der Town Community Association",
-                "description": "Local community organization promoting events and activities",
-                "website": "https://dertown.org",
-                "phone": "(509) 555-0300",
-                "email": "info@dertown.org",
-                "status": "approved"
-            },
-            {
-                "name": "Arts Council",
-                "description": "Promoting arts and culture in Der Town",
-                "website": "https://arts.dertown.org",
-                "phone": "(509) 555-0400",
-                "email": "arts@dertown.org",
-                "status": "approved"
-            },
-        ]
-        
-        for org_data in organizations_data:
-            client.table("organizations").insert(org_data).execute()
-        
-        # Create sample events
-        events_data = [
-            {
-                "title": "Community Picnic",
-                "description": "Annual community picnic in the park",
-                "start_date": "2024-07-15",
-                "end_date": "2024-07-15",
-                "start_time": "12:00:00",
-                "end_time": "16:00:00",
-                "email": "picnic@dertown.org",
-                "website": "https://picnic.dertown.org",
-                "featured": True,
-                "registration": False,
-                "cost": "Free",
-                "status": "approved"
-            },
-            {
-                "title": "Art Walk",
-                "description": "Monthly art walk featuring local artists",
-                "start_date": "2024-06-20",
-                "end_date": "2024-06-20",
-                "start_time": "18:00:00",
-                "end_time": "21:00:00",
-                "email": "artwalk@dertown.org",
-                "website": "https://artwalk.dertown.org",
-                "featured": True,
-                "registration": False,
-                "cost": "Free",
-                "status": "approved"
-            },
-        ]
-        
-        for event_data in events_data:
-            client.table("events").insert(event_data).execute()
-        
-        # Create sample announcements
-        announcements_data = [
-            {
-                "title": "Welcome to Der Town Events",
-                "message": "Find all the latest community events and activities here!",
-                "status": "published",
-                "show_at": "2024-01-01T00:00:00Z"
-            },
-            {
-                "title": "New Event Submission Feature",
-                "message": "Community members can now submit events for review",
-                "status": "published",
-                "show_at": "2024-01-01T00:00:00Z"
-            },
-        ]
-        
-        for announcement_data in announcements_data:
-            client.table("announcements").insert(announcement_data).execute()
-        
-        print("Test data seeding complete")
-        
+        data = load_bundle(bundle)
+        try:
+            with get_cursor() as cur:
+                loaded = copy_bundle(cur, data)
+        except psycopg2.OperationalError:
+            loaded = insert_bundle(get_supabase_client(), data)
+
+        print("Test data seeding complete: " + ", ".join(f"{count} {table}" for table, count in loaded.items()))
+
     except Exception as e:
         print(f"Error seeding test data: {e}")
         sys.exit(1)
@@ -239,21 +307,26 @@ def validate_csv(file_path: str) -> bool:
 
 def main():
     """Main entry point for development utilities."""
-    if len(sys.argv) < 2:
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
         print("Usage: python scripts/dev_utils.py <command>")
         print("Commands:")
-        print("  reset    - Reset database with sample data")
-        print("  seed     - Seed database with test data")
+        print("  reset [--yes] - Reset database with sample data (restores the snapshot if one exists);")
+        print("                  --yes empties referencing tables outside the snapshot without asking")
+        print("  snapshot - Save the current reset tables as the snapshot `reset` restores")
+        print("  seed [bundle] - Seed database with a fixture bundle: minimal, demo (default), load-test")
         print("  validate <file> - Validate CSV file")
-        sys.exit(1)
+        sys.exit(0 if len(sys.argv) > 1 else 1)
     
     command = sys.argv[1]
     
     if command == "reset":
-        reset_dev_db()
-        seed_test_data()
+        # Without a snapshot, fall back to seeding through the API
+        if not reset_dev_db(assume_yes="--yes" in sys.argv[2:]):
+            seed_test_data()
+    elif command == "snapshot":
+        snapshot_dev_db()
     elif command == "seed":
-        seed_test_data()
+        seed_test_data(sys.argv[2] if len(sys.argv) > 2 else "demo")
     elif command == "validate":
         if len(sys.argv) < 3:
             print("Error: validate command requires a file path")
@@ -0,0 +1,213 @@
+"""
+Columnar container for large in-memory event sets.
+
+Holding hundreds of thousands of events as full row dicts costs several
+kilobytes per event. `EventBatch` keeps one NumPy column per field instead:
+
+- dates as datetime64[D] (NaT for missing), times as seconds since midnight
+  (-1 for missing)
+- ids, foreign keys and statuses dictionary-encoded as int32 codes into a
+  shared `Dictionary` (-1 for NULL)
+- titles (interned) and descriptions as object arrays of str
+
+Batches can be filtered, grouped and converted to and from rows or `Event`
+models. NumPy is required.
+"""
+
+import sys
+from datetime import date, time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from models import Event
+from parsers import parse_date_column, parse_time_column
+
+NULL_CODE = -1
+
+# Dictionary-encoded columns
+CODED_COLUMNS = (
+    'id', 'location_id', 'organization_id', 'primary_tag_id', 'secondary_tag_id',
+    'parent_event_id', 'source_id', 'status',
+)
+DATE_COLUMNS = ('start_date', 'end_date')
+TIME_COLUMNS = ('start_time', 'end_time')
+STRING_COLUMNS = ('title', 'description')
+COLUMNS = STRING_COLUMNS + DATE_COLUMNS + TIME_COLUMNS + CODED_COLUMNS
+
+
+class Dictionary:
+    """Value <-> int32 code mapping used for dictionary-encoded columns."""
+
+    __slots__ = ('values', 'codes')
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def encode(self, value: Optional[Any]) -> int:
+        if value is None or value == '':
+            return NULL_CODE
+        value = str(value)
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(sys.intern(value))
+        return code
+
+    def decode(self, code: int) -> Optional[str]:
+        return None if code == NULL_CODE else self.values[code]
+
+    def lookup(self, value: str) -> int:
+        """Code for an existing value, or NULL_CODE if it was never encoded."""
+        return self.codes.get(value, NULL_CODE)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _time_to_seconds(value: Optional[time]) -> int:
+    if value is None:
+        return -1
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _from_datetime64(value: np.datetime64) -> Optional[date]:
+    return None if np.isnat(value) else value.astype(object)
+
+
+def _from_seconds(value: int) -> Optional[time]:
+    if value < 0:
+        return None
+    return time(value // 3600, value // 60 % 60, value % 60)
+
+
+class EventBatch:
+    """Array-backed set of events; every column has one entry per event."""
+
+    def __init__(self, columns: Dict[str, np.ndarray], dictionaries: Dict[str, Dictionary]):
+        self.columns = columns
+        self.dictionaries = dictionaries
+
+    # -- construction -------------------------------------------------------
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> 'EventBatch':
+        """Build a batch from database rows or CSV dicts (dates as ISO strings or objects)."""
+        rows = rows if isinstance(rows, list) else list(rows)
+        dictionaries = {column: Dictionary() for column in CODED_COLUMNS}
+        columns = {
+            'title': np.array([sys.intern(row.get('title') or '') for row in rows], dtype=object),
+            'description': np.array([row.get('description') for row in rows], dtype=object),
+        }
+        for column in DATE_COLUMNS:
+            # None becomes NaT
+            columns[column] = np.array(parse_date_column(row.get(column) for row in rows), dtype='datetime64[D]')
+        for column in TIME_COLUMNS:
+            columns[column] = np.array(
+                [_time_to_seconds(value) for value in parse_time_column(row.get(column) for row in rows)],
+                dtype=np.int32
+            )
+        for column in CODED_COLUMNS:
+            encode = dictionaries[column].encode
+            # Enum statuses from models encode by value
+            columns[column] = np.array(
+                [encode(getattr(value, 'value', value)) for value in (row.get(column) for row in rows)],
+                dtype=np.int32
+            )
+        return cls(columns, dictionaries)
+
+    @classmethod
+    def from_models(cls, events: Iterable[Event]) -> 'EventBatch':
+        """Build a batch from `Event` models."""
+        return cls.from_rows({column: getattr(event, column) for column in COLUMNS} for event in events)
+
+    # -- conversion ---------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.columns['title'])
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Decode one event back to a row dict (dates and times as Python objects)."""
+        row = {
+            'title': self.columns['title'][index],
+            'description': self.columns['description'][index],
+        }
+        for column in DATE_COLUMNS:
+            row[column] = _from_datetime64(self.columns[column][index])
+        for column in TIME_COLUMNS:
+            row[column] = _from_seconds(int(self.columns[column][index]))
+        for column in CODED_COLUMNS:
+            row[column] = self.dictionaries[column].decode(int(self.columns[column][index]))
+        return row
+
+    def to_rows(self, indices: Optional[Sequence[int]] = None) -> List[Dict[str, Any]]:
+        """Decode events (all, or the given positions) to row dicts."""
+        positions = range(len(self)) if indices is None else indices
+        return [self.row(int(i)) for i in positions]
+
+    def to_models(self, indices: Optional[Sequence[int]] = None) -> List[Event]:
+        """Decode events to validated `Event` models (rows without an id get a new one)."""
+        return [Event.model_validate({k: v for k, v in row.items() if v is not None})
+                for row in self.to_rows(indices)]
+
+    # -- selection ----------------------------------------------------------
+
+    def take(self, indices: Sequence[int]) -> 'EventBatch':
+        """New batch with the events at `indices` (dictionaries are shared)."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return EventBatch({name: values[indices] for name, values in self.columns.items()}, self.dictionaries)
+
+    def filter(self, mask: np.ndarray) -> 'EventBatch':
+        """New batch with the events where `mask` is True."""
+        return self.take(np.flatnonzero(mask))
+
+    def mask_equals(self, column: str, value: Optional[str]) -> np.ndarray:
+        """Boolean mask for a dictionary-encoded column equal to `value` (None matches NULL)."""
+        code = NULL_CODE if value is None else self.dictionaries[column].lookup(value)
+        if value is not None and code == NULL_CODE:
+            return np.zeros(len(self), dtype=bool)
+        return self.columns[column] == code
+
+    def mask_date_range(self, start: Optional[date] = None, end: Optional[date] = None) -> np.ndarray:
+        """Events overlapping [start, end]; a missing end_date means a single-day event."""
+        starts = self.columns['start_date']
+        ends = np.where(np.isnat(self.columns['end_date']), starts, self.columns['end_date'])
+        mask = ~np.isnat(starts)
+        if start is not None:
+            mask &= ends >= np.datetime64(start, 'D')
+        if end is not None:
+            mask &= starts <= np.datetime64(end, 'D')
+        return mask
+
+    # -- grouping -----------------------------------------------------------
+
+    def group_by_keys(self, keys: np.ndarray, min_size: int = 1) -> Dict[Any, np.ndarray]:
+        """Group event positions by an array of keys (one per event)."""
+        if len(self) == 0:
+            return {}
+        unique, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        order = np.argsort(inverse, kind='stable')
+        boundaries = np.cumsum(counts)[:-1]
+        groups = {}
+        for key, positions, count in zip(unique, np.split(order, boundaries), counts):
+            if count >= min_size:
+                groups[key.item() if hasattr(key, 'item') else key] = positions
+        return groups
+
+    def group_by(self, column: str, min_size: int = 1) -> Dict[Any, np.ndarray]:
+        """Group event positions by a column (coded columns are keyed by decoded value)."""
+        groups = self.group_by_keys(self.columns[column], min_size)
+        if column in CODED_COLUMNS:
+            dictionary = self.dictionaries[column]
+            return {dictionary.decode(code): positions for code, positions in groups.items()}
+        return groups
+
+    def normalized_titles(self) -> np.ndarray:
+        """Titles stripped and lower-cased (the duplicate-detection key)."""
+        return np.array([title.strip().lower() for title in self.columns['title']], dtype=object)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns (object columns count pointers only)."""
+        return sum(values.nbytes for values in self.columns.values())
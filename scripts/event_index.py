@@ -0,0 +1,160 @@
+"""
+In-memory index for answering EventFilters over a local set of events.
+
+Date ranges use a static interval index: events are sorted by start date and
+a max-segment-tree over that order stores the latest end date in each
+subtree. "Events overlapping [start, end]" is then a binary search for the
+events starting on or before `end`, followed by a tree walk that skips every
+subtree whose latest end is before `start` - O(log n + k) instead of a scan
+of the whole list.
+
+Equality filters (location, organization, tags, status, featured) use hash
+indexes from value to event positions. A query intersects the smallest
+candidate sets first and only scans what is left for the remaining
+predicates (e.g. text search).
+"""
+
+from bisect import bisect_right
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from models import EventFilters
+from parsers import parse_date
+
+HASH_COLUMNS = ('location_id', 'organization_id', 'primary_tag_id', 'secondary_tag_id', 'status', 'featured')
+
+MIN_ORDINAL = date.min.toordinal()
+MAX_ORDINAL = date.max.toordinal()
+
+
+def _ordinal(value: Any) -> Optional[int]:
+    parsed = parse_date(value)
+    return parsed.toordinal() if parsed is not None else None
+
+
+class IntervalIndex:
+    """Static index over closed integer intervals [start, end] for overlap queries."""
+
+    def __init__(self, intervals: List[tuple]):
+        """`intervals` is a list of (start, end, position) tuples."""
+        ordered = sorted(intervals)
+        self.starts = [start for start, _, _ in ordered]
+        self.ends = [end for _, end, _ in ordered]
+        self.positions = [position for _, _, position in ordered]
+        # Iterative max-segment-tree over `ends`; leaves live at [size, size + n)
+        self.size = 1
+        while self.size < len(ordered):
+            self.size *= 2
+        self.tree = [MIN_ORDINAL - 1] * (2 * self.size)
+        self.tree[self.size:self.size + len(ordered)] = self.ends
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def overlapping(self, start: int, end: int) -> List[int]:
+        """Positions of intervals overlapping [start, end], in start order."""
+        limit = bisect_right(self.starts, end)
+        if limit == 0:
+            return []
+        result = []
+        # Depth-first walk over leaves [0, limit), pruning subtrees that end too early
+        stack = [(1, 0, self.size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= limit or self.tree[node] < start:
+                continue
+            if node >= self.size:
+                result.append(self.positions[lo])
+                continue
+            mid = (lo + hi) // 2
+            # Push right first so leaves come out in start order
+            stack.append((2 * node + 1, mid, hi))
+            stack.append((2 * node, lo, mid))
+        return result
+
+
+class EventIndex:
+    """Date-span and hash indexes over a list of event rows (dicts or models)."""
+
+    def __init__(self, events: Iterable[Any]):
+        self.events = [event if isinstance(event, dict) else event.model_dump() for event in events]
+        intervals = []
+        self.undated: List[int] = []
+        self.hash: Dict[str, Dict[Any, Set[int]]] = {column: {} for column in HASH_COLUMNS}
+        for position, event in enumerate(self.events):
+            start = _ordinal(event.get('start_date'))
+            if start is None:
+                self.undated.append(position)
+            else:
+                end = _ordinal(event.get('end_date'))
+                # Single-day events have no end_date
+                intervals.append((start, max(end if end is not None else start, start), position))
+            for column in HASH_COLUMNS:
+                value = event.get(column)
+                value = getattr(value, 'value', value)
+                if value is not None:
+                    self.hash[column].setdefault(value, set()).add(position)
+        self.dates = IntervalIndex(intervals)
+        # Start-date order rank and span per position, for filtering small hash candidate sets directly
+        self.rank = [0] * len(self.events)
+        self.spans: List[Optional[tuple]] = [None] * len(self.events)
+        for rank, position in enumerate(self.dates.positions + self.undated):
+            self.rank[position] = rank
+        for start, end, position in intervals:
+            self.spans[position] = (start, end)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def overlapping(self, start: Optional[date] = None, end: Optional[date] = None) -> List[int]:
+        """Positions of events whose [start_date, end_date] overlaps [start, end]."""
+        low = start.toordinal() if start else MIN_ORDINAL
+        high = end.toordinal() if end else MAX_ORDINAL
+        return self.dates.overlapping(low, high)
+
+    def lookup(self, column: str, value: Any) -> Set[int]:
+        """Positions of events with column == value (hash index)."""
+        return self.hash[column].get(getattr(value, 'value', value), set())
+
+    def candidates(self, filters: EventFilters) -> List[int]:
+        """Positions matching every indexed predicate in `filters`, in start-date order."""
+        sets: List[Set[int]] = []
+        for column in HASH_COLUMNS:
+            value = getattr(filters, column)
+            if value is not None:
+                sets.append(self.lookup(column, value))
+        dated = bool(filters.start_date or filters.end_date)
+        if not sets:
+            return self.overlapping(filters.start_date, filters.end_date) if dated \
+                else self.dates.positions + self.undated
+
+        sets.sort(key=len)
+        matched = sets[0].intersection(*sets[1:])
+        if not dated:
+            return sorted(matched, key=self.rank.__getitem__)
+
+        low = filters.start_date.toordinal() if filters.start_date else MIN_ORDINAL
+        high = filters.end_date.toordinal() if filters.end_date else MAX_ORDINAL
+        # Events starting on or before `high` bound the tree walk; walk it only when
+        # that is cheaper than span-checking every hash match
+        if bisect_right(self.dates.starts, high) < len(matched):
+            return [position for position in self.dates.overlapping(low, high) if position in matched]
+        return sorted(
+            (position for position in matched
+             if self.spans[position] and self.spans[position][0] <= high and self.spans[position][1] >= low),
+            key=self.rank.__getitem__
+        )
+
+    def query(self, filters: EventFilters) -> List[Dict[str, Any]]:
+        """Events matching `filters`; the date range is an overlap test on the event span."""
+        positions = self.candidates(filters)
+        if filters.search:
+            needle = filters.search.lower()
+            positions = [
+                position for position in positions
+                if needle in (self.events[position].get('title') or '').lower()
+                or needle in (self.events[position].get('description') or '').lower()
+            ]
+        return [self.events[position] for position in positions]
@@ -0,0 +1,231 @@
+"""
+Keyset-paginated event queries from EventFilters / EventSearchParams.
+
+Offset pagination (`page`) makes deep pages progressively slower because the
+database has to scan and discard every earlier row. Keyset pagination instead
+continues from the last row seen, ordering by `(sort_by, id)` so ties are
+broken deterministically:
+
+    WHERE (start_date, id) > ('2025-06-01', '…') ORDER BY start_date, id LIMIT 21
+
+The position is handed to clients as an opaque cursor (base64url JSON) that
+is only valid for the same sort column and direction.
+
+Two builders share the filter logic:
+
+- `apply_postgrest(query, params)` / `fetch_page_postgrest(client, params)`
+  for supabase-py table queries
+- `build_sql(params)` / `fetch_page_sql(cur, params)` for direct psycopg2
+  access (see src/lib/db.py)
+
+Counting is optional: `exact` runs count(*), `estimated` uses the planner's
+row estimate (PostgREST `count=estimated` / EXPLAIN), `none` skips it.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from models import EventFilters, EventSearchParams, KeysetPage
+
+# Characters that must be double-quoted inside PostgREST logic-tree values
+POSTGREST_RESERVED = set(',.:()"\\ ')
+
+
+# -- cursors ----------------------------------------------------------------
+
+def _cursor_value(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(params: EventSearchParams, row: Dict[str, Any]) -> str:
+    """Opaque cursor positioned after `row` for the given sort."""
+    payload = {
+        's': params.sort_by,
+        'o': params.sort_order,
+        'v': _cursor_value(row[params.sort_by]),
+        'id': str(row['id']),
+    }
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(params: EventSearchParams) -> Optional[Tuple[Any, str]]:
+    """Return the (sort value, id) after which the page starts, or None for the first page."""
+    if not params.cursor:
+        return None
+    try:
+        padded = params.cursor + '=' * (-len(params.cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        sort_by, order, value, row_id = payload['s'], payload['o'], payload['v'], payload['id']
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError('Invalid pagination cursor')
+    if sort_by != params.sort_by or order != params.sort_order:
+        raise ValueError('Pagination cursor does not match the requested sort')
+    return value, row_id
+
+
+# -- PostgREST --------------------------------------------------------------
+
+def quote_postgrest(value: Any) -> str:
+    """Quote a value for use inside a PostgREST or=/and= expression."""
+    text = str(value).lower() if isinstance(value, bool) else str(value)
+    if any(char in POSTGREST_RESERVED for char in text):
+        return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+    return text
+
+
+def _postgrest_search(search: str) -> str:
+    """Alternatives (for an or=) matching the search text in title or description."""
+    pattern = quote_postgrest(f'*{search}*')
+    return f'title.ilike.{pattern},description.ilike.{pattern}'
+
+
+def _postgrest_keyset(params: EventSearchParams, value: Any, row_id: str) -> str:
+    """Alternatives (for an or=) selecting rows after (value, row_id) in sort order."""
+    op = 'gt' if params.sort_order == 'asc' else 'lt'
+    column = params.sort_by
+    value, row_id = quote_postgrest(value), quote_postgrest(row_id)
+    return f'{column}.{op}.{value},and({column}.eq.{value},id.{op}.{row_id})'
+
+
+def apply_postgrest(query, params: EventSearchParams):
+    """
+    Apply filters, keyset position, ordering and limit to a supabase-py select.
+
+    PostgREST accepts a single `or` parameter per level, so the search and
+    keyset conditions are combined into one or=(and(or(...),or(...))).
+    """
+    filters = params.filters or EventFilters()
+    if filters.start_date:
+        query = query.gte('start_date', filters.start_date.isoformat())
+    if filters.end_date:
+        query = query.lte('start_date', filters.end_date.isoformat())
+    for column in ('location_id', 'organization_id', 'primary_tag_id', 'secondary_tag_id'):
+        value = getattr(filters, column)
+        if value:
+            query = query.eq(column, value)
+    if filters.featured is not None:
+        query = query.eq('featured', filters.featured)
+    if filters.status is not None:
+        query = query.eq('status', filters.status.value)
+
+    conditions = []
+    if filters.search:
+        conditions.append(_postgrest_search(filters.search))
+    position = decode_cursor(params)
+    if position is not None:
+        conditions.append(_postgrest_keyset(params, *position))
+    if len(conditions) == 1:
+        query = query.or_(conditions[0])
+    elif conditions:
+        query = query.or_(f'and({",".join(f"or({condition})" for condition in conditions)})')
+
+    desc = params.sort_order == 'desc'
+    return query.order(params.sort_by, desc=desc).order('id', desc=desc).limit(params.page_size + 1)
+
+
+def fetch_page_postgrest(client, params: EventSearchParams, table: str = 'events',
+                         columns: str = '*') -> KeysetPage:
+    """Fetch one keyset page through PostgREST."""
+    count = None if params.count == 'none' else params.count
+    query = client.table(table).select(columns, count=count)
+    result = apply_postgrest(query, params).execute()
+    return _make_page(params, result.data or [], result.count if count else None)
+
+
+# -- SQL --------------------------------------------------------------------
+
+def _escape_like(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def build_where(params: EventSearchParams, include_cursor: bool = True) -> Tuple[str, List[Any]]:
+    """WHERE clause (without the keyword) and parameters for the filters."""
+    filters = params.filters or EventFilters()
+    clauses: List[str] = []
+    values: List[Any] = []
+    if filters.start_date:
+        clauses.append('start_date >= %s')
+        values.append(filters.start_date)
+    if filters.end_date:
+        clauses.append('start_date <= %s')
+        values.append(filters.end_date)
+    for column in ('location_id', 'organization_id', 'primary_tag_id', 'secondary_tag_id'):
+        value = getattr(filters, column)
+        if value:
+            clauses.append(f'{column} = %s')
+            values.append(value)
+    if filters.featured is not None:
+        clauses.append('featured = %s')
+        values.append(filters.featured)
+    if filters.status is not None:
+        clauses.append('status = %s')
+        values.append(filters.status.value)
+    if filters.search:
+        pattern = f'%{_escape_like(filters.search)}%'
+        clauses.append('(title ILIKE %s OR description ILIKE %s)')
+        values += [pattern, pattern]
+    if include_cursor:
+        position = decode_cursor(params)
+        if position is not None:
+            op = '>' if params.sort_order == 'asc' else '<'
+            clauses.append(f'({params.sort_by}, id) {op} (%s, %s)')
+            values += list(position)
+    return ' AND '.join(clauses) or 'TRUE', values
+
+
+def build_sql(params: EventSearchParams, table: str = 'events', columns: str = '*') -> Tuple[str, List[Any]]:
+    """SELECT for one keyset page (fetches page_size + 1 rows to detect more pages)."""
+    where, values = build_where(params)
+    direction = 'ASC' if params.sort_order == 'asc' else 'DESC'
+    query = (f'SELECT {columns} FROM {table} WHERE {where} '
+             f'ORDER BY {params.sort_by} {direction}, id {direction} LIMIT %s')
+    return query, values + [params.page_size + 1]
+
+
+def build_count_sql(params: EventSearchParams, table: str = 'events') -> Optional[Tuple[str, List[Any]]]:
+    """Count query for params.count ('exact' -> count(*), 'estimated' -> EXPLAIN), or None."""
+    if params.count == 'none':
+        return None
+    where, values = build_where(params, include_cursor=False)
+    if params.count == 'exact':
+        return f'SELECT count(*) FROM {table} WHERE {where}', values
+    return f'EXPLAIN (FORMAT JSON) SELECT 1 FROM {table} WHERE {where}', values
+
+
+def fetch_page_sql(cur, params: EventSearchParams, table: str = 'events', columns: str = '*') -> KeysetPage:
+    """Fetch one keyset page with a psycopg2 cursor."""
+    query, values = build_sql(params, table, columns)
+    cur.execute(query, values)
+    names = [column.name for column in cur.description]
+    rows = [dict(zip(names, row)) for row in cur.fetchall()]
+
+    count = None
+    count_query = build_count_sql(params, table)
+    if count_query is not None:
+        cur.execute(*count_query)
+        result = cur.fetchone()[0]
+        if params.count == 'exact':
+            count = result
+        else:
+            plan = result if isinstance(result, list) else json.loads(result)
+            count = int(plan[0]['Plan']['Plan Rows'])
+    return _make_page(params, rows, count)
+
+
+def _make_page(params: EventSearchParams, rows: List[Dict[str, Any]], count: Optional[int]) -> KeysetPage:
+    has_more = len(rows) > params.page_size
+    rows = rows[:params.page_size]
+    return KeysetPage(
+        data=rows,
+        page_size=params.page_size,
+        next_cursor=encode_cursor(params, rows[-1]) if has_more else None,
+        has_more=has_more,
+        count=count,
+        count_mode=params.count,
+    )
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Versioned, pre-validated fixture bundles for development and test databases.
+
+A bundle is a named set of rows for tags, locations, organizations, events
+and announcements, stored column-wise (one column list plus row arrays per
+table) as JSON. Bundles are validated against the Pydantic models when they
+are built, not when they are loaded, and carry FIXTURE_VERSION so stale
+files are rebuilt instead of loaded.
+
+- minimal, demo: small, committed under scripts/fixtures/
+- load-test: generated deterministically on first use and cached
+  (gzipped) under .cache/fixtures/
+
+Loading is one bulk operation per table: COPY over a direct connection
+(src/lib/db.py) or a single multi-row insert through the Supabase client.
+
+Usage:
+    python scripts/fixture_bundles.py list
+    python scripts/fixture_bundles.py build [minimal demo load-test]
+"""
+
+import argparse
+import gzip
+import random
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import serialization
+
+project_root = Path(__file__).parent.parent
+
+FIXTURE_VERSION = 1
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+GENERATED_DIR = project_root / '.cache' / 'fixtures'
+
+# Load order: parents before children
+TABLES = ('tags', 'locations', 'organizations', 'events', 'announcements')
+
+# Stable ids so bundles can reference their own rows across rebuilds
+ID_NAMESPACE = uuid.UUID('5d1b5b9e-6f0c-4c55-9a43-0b7c2f6a4e61')
+
+Tables = Dict[str, List[Dict[str, Any]]]
+
+
+def fixture_id(bundle: str, table: str, key: Any) -> str:
+    return str(uuid.uuid5(ID_NAMESPACE, f'{bundle}/{table}/{key}'))
+
+
+# -- definitions ------------------------------------------------------------
+
+def define_minimal() -> Tables:
+    """One row per table, linked together."""
+    tag = fixture_id('minimal', 'tags', 'community')
+    location = fixture_id('minimal', 'locations', 'center')
+    organization = fixture_id('minimal', 'organizations', 'association')
+    return {
+        'tags': [{'id': tag, 'name': 'Community'}],
+        'locations': [{'id': location, 'name': 'Community Center', 'status': 'approved'}],
+        'organizations': [{'id': organization, 'name': 'Der Town Community Association', 'status': 'approved'}],
+        'events': [{
+            'id': fixture_id('minimal', 'events', 'picnic'), 'title': 'Community Picnic',
+            'start_date': '2024-07-15', 'location_id': location, 'organization_id': organization,
+            'primary_tag_id': tag, 'status': 'approved',
+        }],
+        'announcements': [{
+            'id': fixture_id('minimal', 'announcements', 'welcome'), 'title': 'Welcome to Der Town Events',
+            'message': 'Find all the latest community events and activities here!',
+            'status': 'published', 'show_at': '2024-01-01T00:00:00Z',
+        }],
+    }
+
+
+def define_demo() -> Tables:
+    """The sample data dev_utils.py has always seeded."""
+    def ids(table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [{'id': fixture_id('demo', table, i), **row} for i, row in enumerate(rows)]
+
+    return {
+        'tags': ids('tags', [
+            {"name": "Community", "calendar_id": "community_calendar_id", "share_id": "community_share_id"},
+            {"name": "Arts & Culture", "calendar_id": "arts_calendar_id", "share_id": "arts_share_id"},
+            {"name": "Sports & Recreation", "calendar_id": "sports_calendar_id", "share_id": "sports_share_id"},
+            {"name": "Education", "calendar_id": "education_calendar_id", "share_id": "education_share_id"},
+        ]),
+        'locations': ids('locations', [
+            {
+                "name": "Community Center",
+                "address": "123 Main St, Der Town, WA 98826",
+                "website": "https://communitycenter.example.com",
+                "phone": "(509) 555-0100",
+                "latitude": 47.6062,
+                "longitude": -122.3321,
+                "status": "approved",
+            },
+            {
+                "name": "Public Library",
+                "address": "456 Oak Ave, Der Town, WA 98826",
+                "website": "https://library.example.com",
+                "phone": "(509) 555-0200",
+                "latitude": 47.6063,
+                "longitude": -122.3322,
+                "status": "approved",
+            },
+        ]),
+        'organizations': ids('organizations', [
+            {
+                "name": "Der Town Community Association",
+                "description": "Local community organization promoting events and activities",
+                "website": "https://dertown.org",
+                "phone": "(509) 555-0300",
+                "email": "info@dertown.org",
+                "status": "approved",
+            },
+            {
+                "name": "Arts Council",
+                "description": "Promoting arts and culture in Der Town",
+                "website": "https://arts.dertown.org",
+                "phone": "(509) 555-0400",
+                "email": "arts@dertown.org",
+                "status": "approved",
+            },
+        ]),
+        'events': ids('events', [
+            {
+                "title": "Community Picnic",
+                "description": "Annual community picnic in the park",
+                "start_date": "2024-07-15",
+                "end_date": "2024-07-15",
+                "start_time": "12:00:00",
+                "end_time": "16:00:00",
+                "email": "picnic@dertown.org",
+                "website": "https://picnic.dertown.org",
+                "featured": True,
+                "registration": False,
+                "cost": "Free",
+                "status": "approved",
+            },
+            {
+                "title": "Art Walk",
+                "description": "Monthly art walk featuring local artists",
+                "start_date": "2024-06-20",
+                "end_date": "2024-06-20",
+                "start_time": "18:00:00",
+                "end_time": "21:00:00",
+                "email": "artwalk@dertown.org",
+                "website": "https://artwalk.dertown.org",
+                "featured": True,
+                "registration": False,
+                "cost": "Free",
+                "status": "approved",
+            },
+        ]),
+        'announcements': ids('announcements', [
+            {
+                "title": "Welcome to Der Town Events",
+                "message": "Find all the latest community events and activities here!",
+                "status": "published",
+                "show_at": "2024-01-01T00:00:00Z",
+            },
+            {
+                "title": "New Event Submission Feature",
+                "message": "Community members can now submit events for review",
+                "status": "published",
+                "show_at": "2024-01-01T00:00:00Z",
+            },
+        ]),
+    }
+
+
+def define_load_test(events: int = 20000, seed: int = 46) -> Tables:
+    """A large, deterministic data set for performance work."""
+    rng = random.Random(seed)
+    tags = [{'id': fixture_id('load-test', 'tags', i), 'name': f'Load Tag {i}'} for i in range(24)]
+    locations = [
+        {'id': fixture_id('load-test', 'locations', i), 'name': f'Load Venue {i}',
+         'address': f'{100 + i} Main St, Der Town, WA 98826', 'status': 'approved'}
+        for i in range(300)
+    ]
+    organizations = [
+        {'id': fixture_id('load-test', 'organizations', i), 'name': f'Load Organization {i}', 'status': 'approved'}
+        for i in range(300)
+    ]
+    base = date(2025, 1, 1)
+    event_rows = []
+    for i in range(events):
+        start = base + timedelta(days=rng.randrange(730))
+        event_rows.append({
+            'id': fixture_id('load-test', 'events', i),
+            'title': f'Load Event {i}',
+            'description': rng.choice(('Live music', 'Story time for kids', 'Farmers market', 'Trail run', None)),
+            'start_date': start.isoformat(),
+            'end_date': (start + timedelta(days=rng.choice((0, 0, 1, 2)))).isoformat(),
+            'location_id': rng.choice(locations)['id'],
+            'organization_id': rng.choice(organizations)['id'],
+            'primary_tag_id': rng.choice(tags)['id'],
+            'featured': rng.random() < 0.05,
+            'status': rng.choice(('approved', 'approved', 'approved', 'pending')),
+        })
+    announcements = [
+        {'id': fixture_id('load-test', 'announcements', i), 'title': f'Load Announcement {i}',
+         'message': 'Generated for load testing', 'status': 'published',
+         'show_at': f'{(base + timedelta(days=i % 365)).isoformat()}T00:00:00Z'}
+        for i in range(500)
+    ]
+    return {'tags': tags, 'locations': locations, 'organizations': organizations,
+            'events': event_rows, 'announcements': announcements}
+
+
+DEFINITIONS: Dict[str, Callable[[], Tables]] = {
+    'minimal': define_minimal,
+    'demo': define_demo,
+    'load-test': define_load_test,
+}
+COMMITTED = ('minimal', 'demo')
+
+
+# -- build / load -----------------------------------------------------------
+
+def bundle_path(name: str) -> Path:
+    if name in COMMITTED:
+        return FIXTURES_DIR / f'{name}.json'
+    return GENERATED_DIR / f'{name}.json.gz'
+
+
+def validate_tables(tables: Tables) -> None:
+    """Validate every row against its model; raises pydantic.ValidationError."""
+    from pydantic import TypeAdapter
+
+    from models import Announcement, Event, Location, Organization, Tag
+
+    models = {'tags': Tag, 'locations': Location, 'organizations': Organization,
+              'events': Event, 'announcements': Announcement}
+    for table, rows in tables.items():
+        TypeAdapter(List[models[table]]).validate_python(rows)
+
+
+def to_columns(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Column-wise form: the union of keys (first-seen order) plus one value list per row."""
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    return {'columns': columns, 'rows': [[row.get(column) for column in columns] for row in rows]}
+
+
+def build_bundle(name: str) -> Path:
+    """Validate and write one bundle; returns its path."""
+    tables = DEFINITIONS[name]()
+    validate_tables(tables)
+    bundle = {
+        'name': name,
+        'version': FIXTURE_VERSION,
+        'tables': {table: to_columns(tables[table]) for table in TABLES if tables.get(table)},
+    }
+    path = bundle_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == '.gz':
+        with gzip.open(path, 'wb', compresslevel=6) as f:
+            f.write(serialization.dumps(bundle))
+    else:
+        with open(path, 'wb') as f:
+            f.write(serialization.dumps(bundle, indent=True))
+            f.write(b'\n')
+    return path
+
+
+def load_bundle(name: str) -> Dict[str, Any]:
+    """Read a bundle, building it first if it is missing or from an older FIXTURE_VERSION."""
+    if name not in DEFINITIONS:
+        raise ValueError(f"Unknown fixture bundle '{name}' (choose from {', '.join(DEFINITIONS)})")
+    path = bundle_path(name)
+    bundle = None
+    if path.exists():
+        opener = gzip.open if path.suffix == '.gz' else open
+        with opener(path, 'rb') as f:
+            bundle = serialization.load(f)
+    if bundle is None or bundle.get('version') != FIXTURE_VERSION:
+        if name in COMMITTED and bundle is not None:
+            print(f"Fixture bundle '{name}' is version {bundle.get('version')}, rebuilding as {FIXTURE_VERSION}")
+        build_bundle(name)
+        return load_bundle(name)
+    return bundle
+
+
+def copy_bundle(cur, bundle: Dict[str, Any]) -> Dict[str, int]:
+    """COPY each table of a bundle in one statement; returns rows per table."""
+    from src.lib.db import copy_rows
+
+    loaded = {}
+    for table in TABLES:
+        data = bundle['tables'].get(table)
+        if data:
+            loaded[table] = copy_rows(cur, table, data['columns'], data['rows'])
+    return loaded
+
+
+def insert_bundle(client, bundle: Dict[str, Any], chunk_size: int = 1000) -> Dict[str, int]:
+    """Insert each table through the Supabase client with multi-row requests."""
+    loaded = {}
+    for table in TABLES:
+        data = bundle['tables'].get(table)
+        if not data:
+            continue
+        rows = [dict(zip(data['columns'], values)) for values in data['rows']]
+        for start in range(0, len(rows), chunk_size):
+            client.table(table).insert(rows[start:start + chunk_size]).execute()
+        loaded[table] = len(rows)
+    return loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and inspect fixture bundles')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build = subparsers.add_parser('build', help='Validate and (re)write bundles')
+    build.add_argument('names', nargs='*', metavar='name',
+                       help=f"Bundles to build (default: all of {', '.join(DEFINITIONS)})")
+    subparsers.add_parser('list', help='Show bundles and row counts')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        unknown = [name for name in args.names if name not in DEFINITIONS]
+        if unknown:
+            parser.error(f"unknown bundle(s): {', '.join(unknown)}")
+        for name in args.names or DEFINITIONS:
+            print(f'Built {name}: {build_bundle(name)}')
+    else:
+        for name in DEFINITIONS:
+            bundle = load_bundle(name)
+            counts = ', '.join(f"{table} {len(data['rows'])}" for table, data in bundle['tables'].items())
+            print(f"{name} (v{bundle['version']}): {counts}")
+
+
+if __name__ == '__main__':
+    main()
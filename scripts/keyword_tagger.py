@@ -0,0 +1,119 @@
+"""
+Keyword tag inference driven by `tag_keywords` in scrape/sources.yaml.
+
+Matches what the scraper's `inferTag` (src/lib/scraper/match.ts) does:
+keywords are matched case-insensitively on word boundaries against
+title + description, the first tag in YAML order with any matching
+keyword wins, and `venue_tags` patterns against the location name are
+the fallback. Tag names are compared like `normTag` ("arts-culture"
+matches "Arts+Culture").
+
+Instead of one regex per keyword, every keyword list is compiled into a
+single alternation with one group per tag, in YAML order, behind a
+shared word boundary and a lookahead on the keywords' first letters, so
+most positions are rejected before any alternative is tried. A search at
+a position returns the highest-priority tag whose keyword starts there;
+the lowercased text is scanned once, restarting one character past each
+hit so overlapping keywords are not hidden, and the scan stops as soon as
+the first tag matches.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+SOURCES_PATH = Path(__file__).parent.parent / 'scrape' / 'sources.yaml'
+
+# JS regexes: \b is ASCII-only. Text is lowercased instead of matching with
+# IGNORECASE, which is several times slower in re
+FLAGS = re.ASCII
+
+
+def norm_tag(name: str) -> str:
+    """Lowercase alphanumerics only, like normTag in match.ts."""
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+def load_tag_config(path: Path = SOURCES_PATH) -> Tuple[Dict[str, List[str]], List[Dict[str, str]]]:
+    """`tag_keywords` and `venue_tags` from sources.yaml."""
+    import yaml
+
+    with open(path, encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+    return config.get('tag_keywords') or {}, config.get('venue_tags') or []
+
+
+def compile_keywords(tag_keywords: Dict[str, Sequence[str]]) -> Tuple[Optional[Pattern], List[str]]:
+    """One pattern with a group per tag (YAML order) and the tag name for each group."""
+    groups = []
+    tags = []
+    first_chars = set()
+    for tag, keywords in tag_keywords.items():
+        keywords = [keyword.strip().lower() for keyword in keywords or () if keyword and keyword.strip()]
+        if not keywords:
+            continue
+        first_chars.update(keyword[0] for keyword in keywords)
+        groups.append('(' + '|'.join(re.escape(keyword) for keyword in keywords) + ')')
+        tags.append(tag)
+    if not groups:
+        return None, tags
+    first = ''.join(re.escape(char) for char in sorted(first_chars))
+    return re.compile(f'\\b(?=[{first}])(?:{"|".join(groups)})\\b', FLAGS), tags
+
+
+class KeywordTagger:
+    """Infer one tag name per event from keyword and venue rules."""
+
+    def __init__(self, tag_keywords: Dict[str, Sequence[str]],
+                 venue_tags: Iterable[Dict[str, str]] = ()):
+        self.pattern, self.tags = compile_keywords(tag_keywords)
+        self.venue_patterns = [(re.compile(rule['match'], re.IGNORECASE), rule['tag'])
+                               for rule in venue_tags if rule.get('match') and rule.get('tag')]
+
+    @classmethod
+    def from_sources(cls, path: Path = SOURCES_PATH) -> 'KeywordTagger':
+        tag_keywords, venue_tags = load_tag_config(path)
+        return cls(tag_keywords, venue_tags)
+
+    def match_keywords(self, text: str) -> Optional[str]:
+        """Highest-priority tag with a keyword anywhere in `text`."""
+        if self.pattern is None or not text:
+            return None
+        text = text.lower()
+        search = self.pattern.search
+        best = len(self.tags)
+        match = search(text)
+        while match:
+            index = match.lastindex - 1
+            if index < best:
+                best = index
+                if best == 0:
+                    break
+            match = search(text, match.start() + 1)
+        return self.tags[best] if best < len(self.tags) else None
+
+    def infer(self, title: Optional[str], description: Optional[str] = None,
+              location_name: Optional[str] = None) -> Optional[str]:
+        """Tag name for one event: keywords in title + description, then venue rules."""
+        tag = self.match_keywords(f"{title or ''} {description or ''}")
+        if tag is None and location_name:
+            for pattern, venue_tag in self.venue_patterns:
+                if pattern.search(location_name):
+                    return venue_tag
+        return tag
+
+    def infer_many(self, events: Iterable[Dict], location_names: Optional[Dict[str, str]] = None
+                   ) -> List[Optional[str]]:
+        """Tag names for event dicts with title, description and optional location_id."""
+        location_names = location_names or {}
+        return [
+            self.infer(event.get('title'), event.get('description'),
+                       location_names.get(event.get('location_id')))
+            for event in events
+        ]
+
+
+def resolve_tag_ids(tag_names: Iterable[Optional[str]], tags: Iterable[Dict]) -> List[Optional[str]]:
+    """Map inferred tag names to ids of `tags` rows (id, name) via norm_tag; None if absent."""
+    ids = {norm_tag(tag['name']): tag['id'] for tag in tags}
+    return [ids.get(norm_tag(name)) if name else None for name in tag_names]
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Concurrent link-health checker for event and organization URLs.
+
+Collects `website`, `registration_link` and `external_image_url` from events
+and `website` from organizations, checks every distinct URL with aiohttp and
+upserts the results into `link_checks` in bulk.
+
+- one ClientSession whose connector keeps connections alive per host
+- total and per-host concurrency are capped with semaphores taken before a
+  request starts, so `--timeout` covers only the request itself and time
+  spent queueing behind other URLs on a busy host is never reported as a
+  timeout
+- HEAD first (redirects followed); on an error status or a dropped
+  connection the URL is retried once with GET, since many servers reject or
+  mishandle HEAD
+- results are cached on disk (.cache/link_checks.sqlite3) and re-checked only
+  after `--ttl-hours`
+
+Usage:
+    python scripts/link_checker.py                      # check and write link_checks
+    python scripts/link_checker.py --dry-run --limit 200
+    python scripts/link_checker.py --urls https://example.org http://localhost:8080/x
+"""
+
+import argparse
+import asyncio
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from dataclasses import astuple, dataclass, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+project_root = Path(__file__).parent.parent
+
+DEFAULT_CACHE_PATH = project_root / '.cache' / 'link_checks.sqlite3'
+USER_AGENT = 'DerTownLinkChecker/1.0 (+https://dertown.org)'
+
+# (table, column) pairs whose URLs are checked
+URL_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('events', 'website'),
+    ('events', 'registration_link'),
+    ('events', 'external_image_url'),
+    ('organizations', 'website'),
+)
+
+
+@dataclass
+class LinkResult:
+    """Outcome of checking one URL."""
+    url: str
+    ok: bool
+    status_code: Optional[int] = None
+    final_url: Optional[str] = None
+    method: Optional[str] = None
+    error: Optional[str] = None
+    elapsed_ms: int = 0
+    checked_at: float = 0.0  # Unix time
+
+
+RESULT_COLUMNS = tuple(field.name for field in fields(LinkResult))
+
+
+class LinkCache:
+    """SQLite cache of LinkResults keyed by URL."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS link_results ('
+            'url TEXT PRIMARY KEY, ok INTEGER, status_code INTEGER, final_url TEXT, '
+            'method TEXT, error TEXT, elapsed_ms INTEGER, checked_at REAL)'
+        )
+
+    def fresh(self, urls: Iterable[str], ttl_seconds: float) -> Dict[str, LinkResult]:
+        """Cached results newer than the TTL for the given URLs."""
+        cutoff = time.time() - ttl_seconds
+        urls = list(urls)
+        found: Dict[str, LinkResult] = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            rows = self.conn.execute(
+                f'SELECT {", ".join(RESULT_COLUMNS)} FROM link_results '
+                f'WHERE checked_at >= ? AND url IN ({",".join("?" * len(chunk))})',
+                [cutoff] + chunk
+            )
+            for row in rows:
+                result = LinkResult(*row)
+                result.ok = bool(result.ok)
+                found[result.url] = result
+        return found
+
+    def store(self, results: Iterable[LinkResult]) -> None:
+        with self.conn:
+            self.conn.executemany(
+                f'INSERT OR REPLACE INTO link_results ({", ".join(RESULT_COLUMNS)}) '
+                f'VALUES ({", ".join("?" * len(RESULT_COLUMNS))})',
+                [astuple(result) for result in results]
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class LinkChecker:
+    """Check many URLs concurrently over pooled per-host connections."""
+
+    def __init__(self, concurrency: int = 64, per_host: int = 4, timeout: float = 10.0,
+                 user_agent: str = USER_AGENT):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.headers = {'User-Agent': user_agent}
+
+    async def _request(self, session: aiohttp.ClientSession, method: str, url: str) -> Tuple[int, str]:
+        # The body is never read; only status and final URL matter
+        async with session.request(method, url, allow_redirects=True) as response:
+            return response.status, str(response.url)
+
+    async def check(self, session: aiohttp.ClientSession, url: str) -> LinkResult:
+        result = LinkResult(url=url, ok=False, checked_at=time.time())
+        if not url.lower().startswith(('http://', 'https://')):
+            result.error = 'unsupported URL scheme'
+            return result
+        try:
+            host = (urlsplit(url).hostname or '').lower()
+        except ValueError:
+            host = ''
+
+        # Wait for a slot before the request's timeout starts
+        async with self._host_slots[host], self._slots:
+            await self._check(session, url, result)
+        return result
+
+    async def _check(self, session: aiohttp.ClientSession, url: str, result: LinkResult) -> None:
+        started = time.perf_counter()
+        result.checked_at = time.time()
+        for method in ('HEAD', 'GET'):
+            result.method = method
+            try:
+                result.status_code, result.final_url = await self._request(session, method, url)
+                result.error = None
+                if result.status_code < 400:
+                    break
+            except asyncio.TimeoutError:
+                result.error = 'timeout'
+                break
+            except aiohttp.InvalidURL:
+                result.error = 'invalid URL'
+                break
+            except aiohttp.ClientConnectorError as e:
+                # DNS or connect failure; a GET would fail the same way
+                result.error = f'{type(e).__name__}: {e}'[:500]
+                break
+            except aiohttp.ClientError as e:
+                # Connection-level failure; GET may still succeed where HEAD was dropped
+                result.error = f'{type(e).__name__}: {e}'[:500]
+        result.ok = result.status_code is not None and result.status_code < 400 and result.error is None
+        result.elapsed_ms = int((time.perf_counter() - started) * 1000)
+
+    async def check_many(self, urls: Sequence[str]) -> List[LinkResult]:
+        """Check every URL; results are returned in input order."""
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._host_slots = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+        # Concurrency is limited by the semaphores; connector limits would queue requests after
+        # their timeout had started
+        connector = aiohttp.TCPConnector(limit=0, limit_per_host=0, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, timeout=self.timeout,
+                                         headers=self.headers) as session:
+            return await asyncio.gather(*(self.check(session, url) for url in urls))
+
+
+def check_links(urls: Iterable[str], cache: Optional[LinkCache] = None, ttl_hours: float = 24.0,
+                checker: Optional[LinkChecker] = None) -> Dict[str, LinkResult]:
+    """Check distinct URLs, reusing cached results younger than `ttl_hours`."""
+    urls = list(dict.fromkeys(url.strip() for url in urls if url and url.strip()))
+    results = cache.fresh(urls, ttl_hours * 3600) if cache else {}
+    pending = [url for url in urls if url not in results]
+    if pending:
+        checked = asyncio.run((checker or LinkChecker()).check_many(pending))
+        if cache:
+            cache.store(checked)
+        results.update((result.url, result) for result in checked)
+    return results
+
+
+# -- database ---------------------------------------------------------------
+
+def collect_urls(cur, limit: Optional[int] = None) -> List[str]:
+    """Distinct non-empty URLs referenced by events and organizations."""
+    selects = [f"SELECT {column} AS url FROM {table} WHERE coalesce({column}, '') <> ''"
+               for table, column in URL_COLUMNS]
+    query = f"SELECT DISTINCT btrim(url) FROM ({' UNION ALL '.join(selects)}) urls ORDER BY 1"
+    if limit:
+        query += f' LIMIT {int(limit)}'
+    cur.execute(query)
+    return [row[0] for row in cur.fetchall()]
+
+
+def save_results(cur, results: Iterable[LinkResult]) -> int:
+    """Upsert results into link_checks with multi-row VALUES statements."""
+    from src.lib.db import insert_values
+
+    rows = [
+        (r.url, r.ok, r.status_code, r.final_url, r.method, r.error, r.elapsed_ms,
+         datetime.fromtimestamp(r.checked_at, timezone.utc))
+        for r in results
+    ]
+    insert_values(
+        cur, 'link_checks',
+        ['url', 'ok', 'status_code', 'final_url', 'method', 'error', 'elapsed_ms', 'checked_at'],
+        rows,
+        on_conflict=(
+            'ON CONFLICT (url) DO UPDATE SET ok = EXCLUDED.ok, status_code = EXCLUDED.status_code, '
+            'final_url = EXCLUDED.final_url, method = EXCLUDED.method, error = EXCLUDED.error, '
+            'elapsed_ms = EXCLUDED.elapsed_ms, checked_at = EXCLUDED.checked_at'
+        ),
+    )
+    return len(rows)
+
+
+def print_report(results: Dict[str, LinkResult], elapsed: float, show: int = 50) -> None:
+    broken = [result for result in results.values() if not result.ok]
+    print(f'Checked {len(results)} URLs in {elapsed:.1f}s: {len(results) - len(broken)} ok, {len(broken)} broken')
+    for result in sorted(broken, key=lambda r: r.url)[:show]:
+        print(f'  {result.status_code or "---"}  {result.url}  {result.error or ""}')
+    if len(broken) > show:
+        print(f'  ... and {len(broken) - show} more')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check event and organization URLs for dead links')
+    parser.add_argument('--urls', nargs='+', help='Check these URLs instead of the database')
+    parser.add_argument('--limit', type=int, help='Check at most this many database URLs')
+    parser.add_argument('--ttl-hours', type=float, default=24.0, help='Reuse cached results younger than this')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update the disk cache')
+    parser.add_argument('--concurrency', type=int, default=64, help='Maximum concurrent connections')
+    parser.add_argument('--per-host', type=int, default=4, help='Maximum concurrent connections per host')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Per-request timeout in seconds')
+    parser.add_argument('--dry-run', action='store_true', help='Do not write results to link_checks')
+    args = parser.parse_args()
+
+    checker = LinkChecker(concurrency=args.concurrency, per_host=args.per_host, timeout=args.timeout)
+    cache = None if args.no_cache else LinkCache()
+    started = time.perf_counter()
+
+    if args.urls:
+        results = check_links(args.urls, cache, args.ttl_hours, checker)
+        print_report(results, time.perf_counter() - started)
+        return
+
+    sys.path.insert(0, str(project_root))
+    from src.lib.db import get_cursor
+
+    with get_cursor() as cur:
+        urls = collect_urls(cur, args.limit)
+    results = check_links(urls, cache, args.ttl_hours, checker)
+    print_report(results, time.perf_counter() - started)
+    if not args.dry_run:
+        with get_cursor() as cur:
+            saved = save_results(cur, results.values())
+        print(f'Saved {saved} results to link_checks')
+
+
+if __name__ == '__main__':
+    main()
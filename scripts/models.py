@@ -8,9 +8,11 @@ API endpoints, and data processing pipelines.
 from datetime import date, time, datetime
 from typing import Optional, List, Union
 from enum import Enum
-from pydantic import BaseModel, Field, validator, HttpUrl, root_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter, ValidationInfo, field_validator
 import uuid
 
+from parsers import parse_bool, parse_date, parse_datetime, parse_time
+
 
 def convert_postgres_null(value: Union[str, None]) -> Optional[str]:
     """Convert PostgreSQL \\N to Python None for Pydantic validation."""
@@ -33,64 +35,22 @@ def postgres_null_url_validator(cls, v):
 
 def parse_date_validator(cls, v):
     """Pre-validator to parse date strings to date objects."""
-    if v is None or v == '' or v == '\\N':
-        return None
-    if isinstance(v, date):
-        return v
-    if isinstance(v, str):
-        try:
-            return datetime.strptime(v, '%Y-%m-%d').date()
-        except ValueError:
-            raise ValueError(f"Could not parse date: {v}")
-    return v
+    return parse_date(v)
 
 
 def parse_time_validator(cls, v):
     """Pre-validator to parse time strings to time objects."""
-    if v is None or v == '' or v == '\\N':
-        return None
-    if isinstance(v, time):
-        return v
-    if isinstance(v, str):
-        try:
-            return datetime.strptime(v, '%H:%M:%S').time()
-        except ValueError:
-            raise ValueError(f"Could not parse time: {v}")
-    return v
+    return parse_time(v)
 
 
 def parse_datetime_validator(cls, v):
     """Pre-validator to parse datetime strings to datetime objects."""
-    if v is None or v == '' or v == '\\N':
-        return None
-    if isinstance(v, datetime):
-        return v
-    if isinstance(v, str):
-        try:
-            # Handle PostgreSQL timestamp format
-            if v.endswith('+00'):
-                v = v[:-3]
-            return datetime.fromisoformat(v.replace('Z', '+00:00'))
-        except ValueError:
-            raise ValueError(f"Could not parse datetime: {v}")
-    return v
+    return parse_datetime(v)
 
 
 def parse_boolean_validator(cls, v):
     """Pre-validator to parse various boolean string representations."""
-    if v is None or v == '' or v == '\\N':
-        return None
-    if isinstance(v, bool):
-        return v
-    if isinstance(v, str):
-        v_lower = v.lower().strip()
-        if v_lower in ('true', 't', '1', 'yes', 'y', 'on'):
-            return True
-        elif v_lower in ('false', 'f', '0', 'no', 'n', 'off'):
-            return False
-        else:
-            raise ValueError(f"Could not parse boolean: {v}")
-    return v
+    return parse_bool(v)
 
 
 def status_enum_pre_validator(enum_cls):
@@ -141,13 +101,8 @@ class BaseEntity(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None,
-            date: lambda v: v.isoformat() if v else None,
-            time: lambda v: v.isoformat() if v else None,
-        }
+    # Bulk JSON/NDJSON encoding lives in serialization.py
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Location(BaseEntity):
@@ -161,19 +116,23 @@ class Location(BaseEntity):
     parent_location_id: Optional[str] = None
     status: EventStatus = EventStatus.PENDING
 
-    @validator('address', 'phone', 'parent_location_id', pre=True)
+    @field_validator('address', 'phone', 'parent_location_id', mode='before')
+    @classmethod
     def validate_postgres_nulls(cls, v):
         return postgres_null_validator(cls, v)
 
-    @validator('website', pre=True)
+    @field_validator('website', mode='before')
+    @classmethod
     def validate_postgres_null_url(cls, v):
         return postgres_null_url_validator(cls, v)
 
-    @validator('status', pre=True)
+    @field_validator('status', mode='before')
+    @classmethod
     def validate_status_enum(cls, v):
         return status_enum_pre_validator(EventStatus)(cls, v)
 
-    @validator('phone')
+    @field_validator('phone')
+    @classmethod
     def validate_phone(cls, v):
         if v and not v.replace('+', '').replace('-', '').replace(' ', '').replace('(', '').replace(')', '').isdigit():
             raise ValueError('Phone number must contain only digits, spaces, hyphens, parentheses, and plus sign')
@@ -191,19 +150,23 @@ class Organization(BaseEntity):
     parent_organization_id: Optional[str] = None
     status: EventStatus = EventStatus.PENDING
 
-    @validator('description', 'phone', 'email', 'location_id', 'parent_organization_id', pre=True)
+    @field_validator('description', 'phone', 'email', 'location_id', 'parent_organization_id', mode='before')
+    @classmethod
     def validate_postgres_nulls(cls, v):
         return postgres_null_validator(cls, v)
 
-    @validator('website', pre=True)
+    @field_validator('website', mode='before')
+    @classmethod
     def validate_postgres_null_url(cls, v):
         return postgres_null_url_validator(cls, v)
 
-    @validator('status', pre=True)
+    @field_validator('status', mode='before')
+    @classmethod
     def validate_status_enum(cls, v):
         return status_enum_pre_validator(EventStatus)(cls, v)
 
-    @validator('phone')
+    @field_validator('phone')
+    @classmethod
     def validate_phone(cls, v):
         if v and not v.replace('+', '').replace('-', '').replace(' ', '').replace('(', '').replace(')', '').isdigit():
             raise ValueError('Phone number must contain only digits, spaces, hyphens, parentheses, and plus sign')
@@ -216,7 +179,8 @@ class Tag(BaseEntity):
     calendar_id: Optional[str] = None
     share_id: Optional[str] = None
 
-    @validator('calendar_id', 'share_id', pre=True)
+    @field_validator('calendar_id', 'share_id', mode='before')
+    @classmethod
     def validate_postgres_nulls(cls, v):
         return postgres_null_validator(cls, v)
 
@@ -233,11 +197,13 @@ class SourceSite(BaseEntity):
     import_frequency: ImportFrequency = ImportFrequency.MANUAL
     extraction_function: Optional[str] = None
 
-    @validator('organization_id', 'event_tag_id', 'last_status', 'last_error', 'extraction_function', pre=True)
+    @field_validator('organization_id', 'event_tag_id', 'last_status', 'last_error', 'extraction_function', mode='before')
+    @classmethod
     def validate_postgres_nulls(cls, v):
         return postgres_null_validator(cls, v)
 
-    @validator('last_scraped', pre=True)
+    @field_validator('last_scraped', mode='before')
+    @classmethod
     def validate_datetime(cls, v):
         return parse_datetime_validator(cls, v)
 
@@ -269,46 +235,55 @@ class Event(BaseEntity):
     source_id: Optional[str] = None
     details_outdated_checked_at: Optional[datetime] = None
 
-    @validator('description', 'location_id', 'organization_id', 'email', 'primary_tag_id', 
-               'secondary_tag_id', 'image_id', 'parent_event_id', 'google_calendar_event_id', 
-               'cost', 'source_id', pre=True)
+    @field_validator('description', 'location_id', 'organization_id', 'email', 'primary_tag_id',
+                     'secondary_tag_id', 'image_id', 'parent_event_id', 'google_calendar_event_id',
+                     'cost', 'source_id', mode='before')
+    @classmethod
     def validate_postgres_nulls(cls, v):
         return postgres_null_validator(cls, v)
 
-    @validator('website', 'registration_link', 'external_image_url', pre=True)
+    @field_validator('website', 'registration_link', 'external_image_url', mode='before')
+    @classmethod
     def validate_postgres_null_url(cls, v):
         return postgres_null_url_validator(cls, v)
 
-    @validator('start_date', 'end_date', pre=True)
+    @field_validator('start_date', 'end_date', mode='before')
+    @classmethod
     def validate_dates(cls, v):
         return parse_date_validator(cls, v)
 
-    @validator('start_time', 'end_time', pre=True)
+    @field_validator('start_time', 'end_time', mode='before')
+    @classmethod
     def validate_times(cls, v):
         return parse_time_validator(cls, v)
 
-    @validator('details_outdated_checked_at', pre=True)
+    @field_validator('featured', 'exclude_from_calendar', 'registration', mode='before')
+    @classmethod
+    def validate_booleans(cls, v):
+        return parse_boolean_validator(cls, v)
+
+    @field_validator('details_outdated_checked_at', mode='before')
+    @classmethod
     def validate_datetime(cls, v):
         return parse_datetime_validator(cls, v)
 
-    @validator('status', pre=True)
+    @field_validator('status', mode='before')
+    @classmethod
     def validate_status_enum(cls, v):
         return status_enum_pre_validator(EventStatus)(cls, v)
 
-    @validator('featured', 'exclude_from_calendar', 'registration', pre=True)
-    def validate_booleans(cls, v):
-        return parse_boolean_validator(cls, v)
-
-    @validator('end_date')
-    def validate_end_date(cls, v, values):
-        if v and 'start_date' in values and v < values['start_date']:
+    @field_validator('end_date')
+    @classmethod
+    def validate_end_date(cls, v, info: ValidationInfo):
+        if v and info.data.get('start_date') and v < info.data['start_date']:
             raise ValueError('End date must be after or equal to start date')
         return v
 
-    @validator('end_time')
-    def validate_end_time(cls, v, values):
-        if v and 'start_time' in values and values['start_date'] == values.get('end_date'):
-            if v <= values['start_time']:
+    @field_validator('end_time')
+    @classmethod
+    def validate_end_time(cls, v, info: ValidationInfo):
+        if v and info.data.get('start_time') and info.data.get('start_date') == info.data.get('end_date'):
+            if v <= info.data['start_time']:
                 raise ValueError('End time must be after start time when on the same date')
         return v
 
@@ -341,42 +316,50 @@ class EventStaged(BaseEntity):
     details_outdated_checked_at: Optional[datetime] = None
     submitted_at: Optional[datetime] = None
 
-    @validator('description', 'location_id', 'organization_id', 'email', 'primary_tag_id', 
-               'secondary_tag_id', 'image_id', 'parent_event_id', 'google_calendar_event_id', 
-               'cost', 'source_id', pre=True)
+    @field_validator('description', 'location_id', 'organization_id', 'email', 'primary_tag_id',
+                     'secondary_tag_id', 'image_id', 'parent_event_id', 'google_calendar_event_id',
+                     'cost', 'source_id', mode='before')
+    @classmethod
     def validate_postgres_nulls(cls, v):
         return postgres_null_validator(cls, v)
 
-    @validator('website', 'registration_link', 'external_image_url', pre=True)
+    @field_validator('website', 'registration_link', 'external_image_url', mode='before')
+    @classmethod
     def validate_postgres_null_url(cls, v):
         return postgres_null_url_validator(cls, v)
 
-    @validator('start_date', 'end_date', pre=True)
+    @field_validator('start_date', 'end_date', mode='before')
+    @classmethod
     def validate_dates(cls, v):
         return parse_date_validator(cls, v)
 
-    @validator('start_time', 'end_time', pre=True)
+    @field_validator('start_time', 'end_time', mode='before')
+    @classmethod
     def validate_times(cls, v):
         return parse_time_validator(cls, v)
 
-    @validator('details_outdated_checked_at', 'submitted_at', pre=True)
-    def validate_datetime(cls, v):
-        return parse_datetime_validator(cls, v)
-
-    @validator('featured', 'exclude_from_calendar', 'registration', pre=True)
+    @field_validator('featured', 'exclude_from_calendar', 'registration', mode='before')
+    @classmethod
     def validate_booleans(cls, v):
         return parse_boolean_validator(cls, v)
 
-    @validator('end_date')
-    def validate_end_date(cls, v, values):
-        if v and 'start_date' in values and v < values['start_date']:
+    @field_validator('details_outdated_checked_at', 'submitted_at', mode='before')
+    @classmethod
+    def validate_datetime(cls, v):
+        return parse_datetime_validator(cls, v)
+
+    @field_validator('end_date')
+    @classmethod
+    def validate_end_date(cls, v, info: ValidationInfo):
+        if v and info.data.get('start_date') and v < info.data['start_date']:
             raise ValueError('End date must be after or equal to start date')
         return v
 
-    @validator('end_time')
-    def validate_end_time(cls, v, values):
-        if v and 'start_time' in values and values['start_date'] == values.get('end_date'):
-            if v <= values['start_time']:
+    @field_validator('end_time')
+    @classmethod
+    def validate_end_time(cls, v, info: ValidationInfo):
+        if v and info.data.get('start_time') and info.data.get('start_date') == info.data.get('end_date'):
+            if v <= info.data['start_time']:
                 raise ValueError('End time must be after start time when on the same date')
         return v
 
@@ -393,25 +376,30 @@ class Announcement(BaseEntity):
     show_at: datetime = Field(default_factory=datetime.now)
     expires_at: Optional[datetime] = None
 
-    @validator('email', 'organization_id', 'author', pre=True)
+    @field_validator('email', 'organization_id', 'author', mode='before')
+    @classmethod
     def validate_postgres_nulls(cls, v):
         return postgres_null_validator(cls, v)
 
-    @validator('link', pre=True)
+    @field_validator('link', mode='before')
+    @classmethod
     def validate_postgres_null_url(cls, v):
         return postgres_null_url_validator(cls, v)
 
-    @validator('status', pre=True)
+    @field_validator('status', mode='before')
+    @classmethod
     def validate_status_enum(cls, v):
         return status_enum_pre_validator(AnnouncementStatus)(cls, v)
 
-    @validator('show_at', 'expires_at', pre=True)
+    @field_validator('show_at', 'expires_at', mode='before')
+    @classmethod
     def validate_datetime(cls, v):
         return parse_datetime_validator(cls, v)
 
-    @validator('expires_at')
-    def validate_expires_at(cls, v, values):
-        if v and 'show_at' in values and v <= values['show_at']:
+    @field_validator('expires_at')
+    @classmethod
+    def validate_expires_at(cls, v, info: ValidationInfo):
+        if v and info.data.get('show_at') and v <= info.data['show_at']:
             raise ValueError('Expires at must be after show at')
         return v
 
@@ -423,11 +411,13 @@ class ScrapeLog(BaseEntity):
     status: str = Field(..., max_length=50)
     error_message: Optional[str] = None
 
-    @validator('error_message', pre=True)
+    @field_validator('error_message', mode='before')
+    @classmethod
     def validate_postgres_nulls(cls, v):
         return postgres_null_validator(cls, v)
 
-    @validator('timestamp', pre=True)
+    @field_validator('timestamp', mode='before')
+    @classmethod
     def validate_datetime(cls, v):
         return parse_datetime_validator(cls, v)
 
@@ -449,6 +439,16 @@ class PaginatedResponse(BaseModel):
     total_pages: int
 
 
+class KeysetPage(BaseModel):
+    """Keyset-paginated response; pass next_cursor back as EventSearchParams.cursor."""
+    data: List[dict]
+    page_size: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    count: Optional[int] = None
+    count_mode: str = "none"
+
+
 # Form Models for Event Submission
 class EventSubmissionForm(BaseModel):
     """Form model for public event submissions."""
@@ -467,37 +467,44 @@ class EventSubmissionForm(BaseModel):
     cost: Optional[str] = Field(None, max_length=100)
     registration: bool = False
 
-    @validator('description', 'location_name', 'organization_name', 'email', 
-               'primary_tag_name', 'cost', pre=True)
+    @field_validator('description', 'location_name', 'organization_name', 'email', 
+                     'primary_tag_name', 'cost', mode='before')
+    @classmethod
     def validate_postgres_nulls(cls, v):
         return postgres_null_validator(cls, v)
 
-    @validator('website', 'registration_link', pre=True)
+    @field_validator('website', 'registration_link', mode='before')
+    @classmethod
     def validate_postgres_null_url(cls, v):
         return postgres_null_url_validator(cls, v)
 
-    @validator('start_date', 'end_date', pre=True)
+    @field_validator('start_date', 'end_date', mode='before')
+    @classmethod
     def validate_dates(cls, v):
         return parse_date_validator(cls, v)
 
-    @validator('start_time', 'end_time', pre=True)
+    @field_validator('start_time', 'end_time', mode='before')
+    @classmethod
     def validate_times(cls, v):
         return parse_time_validator(cls, v)
 
-    @validator('registration', pre=True)
+    @field_validator('registration', mode='before')
+    @classmethod
     def validate_booleans(cls, v):
         return parse_boolean_validator(cls, v)
 
-    @validator('end_date')
-    def validate_end_date(cls, v, values):
-        if v and 'start_date' in values and v < values['start_date']:
+    @field_validator('end_date')
+    @classmethod
+    def validate_end_date(cls, v, info: ValidationInfo):
+        if v and info.data.get('start_date') and v < info.data['start_date']:
             raise ValueError('End date must be after or equal to start date')
         return v
 
-    @validator('end_time')
-    def validate_end_time(cls, v, values):
-        if v and 'start_time' in values and values['start_date'] == values.get('end_date'):
-            if v <= values['start_time']:
+    @field_validator('end_time')
+    @classmethod
+    def validate_end_time(cls, v, info: ValidationInfo):
+        if v and info.data.get('start_time') and info.data.get('start_date') == info.data.get('end_date'):
+            if v <= info.data['start_time']:
                 raise ValueError('End time must be after start time when on the same date')
         return v
 
@@ -514,20 +521,24 @@ class EventFilters(BaseModel):
     status: Optional[EventStatus] = None
     search: Optional[str] = Field(None, max_length=255)
 
-    @validator('location_id', 'organization_id', 'primary_tag_id', 'secondary_tag_id', 
-               'search', pre=True)
+    @field_validator('location_id', 'organization_id', 'primary_tag_id', 'secondary_tag_id', 
+                     'search', mode='before')
+    @classmethod
     def validate_postgres_nulls(cls, v):
         return postgres_null_validator(cls, v)
 
-    @validator('start_date', 'end_date', pre=True)
+    @field_validator('start_date', 'end_date', mode='before')
+    @classmethod
     def validate_dates(cls, v):
         return parse_date_validator(cls, v)
 
-    @validator('status', pre=True)
+    @field_validator('status', mode='before')
+    @classmethod
     def validate_status_enum(cls, v):
         return status_enum_pre_validator(EventStatus)(cls, v)
 
-    @validator('featured', pre=True)
+    @field_validator('featured', mode='before')
+    @classmethod
     def validate_booleans(cls, v):
         return parse_boolean_validator(cls, v)
 
@@ -539,6 +550,24 @@ class EventSearchParams(BaseModel):
     filters: Optional[EventFilters] = None
     sort_by: str = Field("start_date", pattern="^(start_date|title|created_at)$")
     sort_order: str = Field("asc", pattern="^(asc|desc)$")
+    # Keyset pagination (see event_query.py): opaque cursor from KeysetPage.next_cursor
+    cursor: Optional[str] = None
+    count: str = Field("none", pattern="^(exact|estimated|none)$")
+
+
+# Batch validation entry points (one pydantic-core call per list instead of per row)
+EventListAdapter = TypeAdapter(List[Event])
+EventStagedListAdapter = TypeAdapter(List[EventStaged])
+
+
+def validate_events(rows: List[dict]) -> List[Event]:
+    """Validate a list of event rows; errors are reported with the row index in their location."""
+    return EventListAdapter.validate_python(rows)
+
+
+def validate_staged_events(rows: List[dict]) -> List[EventStaged]:
+    """Validate a list of staged event rows; errors are reported with the row index in their location."""
+    return EventStagedListAdapter.validate_python(rows)
 
 
 # Utility functions
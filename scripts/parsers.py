@@ -0,0 +1,159 @@
+"""
+Fast, memoized parsers for CSV/PostgreSQL date, time, datetime and boolean values.
+
+Seed and import CSVs repeat a small set of dates and times thousands of
+times, so string parsing is cached with a bounded LRU. Canonical ISO inputs
+take a `fromisoformat` fast path; anything else falls back to the same
+`strptime` formats the model validators have always accepted, so results
+and error messages are unchanged.
+
+Column variants parse each distinct value once and map the results back
+over the whole column.
+"""
+
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional
+
+NULL_MARKERS = ('', '\\N')
+CACHE_SIZE = 4096
+
+TRUE_VALUES = frozenset(('true', 't', '1', 'yes', 'y', 'on'))
+FALSE_VALUES = frozenset(('false', 'f', '0', 'no', 'n', 'off'))
+
+
+def is_null(value: Any) -> bool:
+    """True for None and the PostgreSQL null markers ('' and \\N)."""
+    return value is None or (isinstance(value, str) and value in NULL_MARKERS)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_date_str(value: str) -> date:
+    # 'YYYY-MM-DD' is the only shape both fromisoformat and strptime agree on
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError(f"Could not parse date: {value}")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_time_str(value: str) -> time:
+    if len(value) == 8 and value[2] == ':' and value[5] == ':':
+        try:
+            return time.fromisoformat(value)
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(value, '%H:%M:%S').time()
+    except ValueError:
+        raise ValueError(f"Could not parse time: {value}")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_datetime_str(value: str) -> datetime:
+    try:
+        # Handle PostgreSQL timestamp format
+        if value.endswith('+00'):
+            value = value[:-3]
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError(f"Could not parse datetime: {value}")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_bool_str(value: str) -> bool:
+    lowered = value.lower().strip()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    raise ValueError(f"Could not parse boolean: {value}")
+
+
+def parse_date(value: Any) -> Any:
+    """Parse a 'YYYY-MM-DD' string to a date; null markers become None, other types pass through."""
+    if is_null(value):
+        return None
+    if isinstance(value, str):
+        return _parse_date_str(value)
+    return value
+
+
+def parse_time(value: Any) -> Any:
+    """Parse an 'HH:MM:SS' string to a time; null markers become None, other types pass through."""
+    if is_null(value):
+        return None
+    if isinstance(value, str):
+        return _parse_time_str(value)
+    return value
+
+
+def parse_datetime(value: Any) -> Any:
+    """Parse an ISO/PostgreSQL timestamp string to a datetime; null markers become None."""
+    if is_null(value):
+        return None
+    if isinstance(value, str):
+        return _parse_datetime_str(value)
+    return value
+
+
+def parse_bool(value: Any, default: Optional[bool] = None) -> Any:
+    """Parse a boolean string (true/t/1/yes/y/on, false/f/0/no/n/off); null markers become `default`."""
+    if is_null(value):
+        return default
+    if isinstance(value, str):
+        return _parse_bool_str(value)
+    return value
+
+
+def _parse_column(parser: Callable[[Any], Any], values: Iterable[Any], strict: bool) -> List[Any]:
+    values = list(values)
+    parsed = {}
+    for value in set(v for v in values if isinstance(v, str)):
+        try:
+            parsed[value] = parser(value)
+        except ValueError:
+            if strict:
+                raise
+            # Leave the raw value in place so downstream validation reports it
+            parsed[value] = value
+    return [parsed[v] if isinstance(v, str) else parser(v) for v in values]
+
+
+def parse_date_column(values: Iterable[Any], strict: bool = True) -> List[Any]:
+    """Parse a whole column of dates, parsing each distinct string once.
+
+    With strict=False unparseable values are returned unchanged instead of raising.
+    """
+    return _parse_column(parse_date, values, strict)
+
+
+def parse_time_column(values: Iterable[Any], strict: bool = True) -> List[Any]:
+    """Parse a whole column of times, parsing each distinct string once."""
+    return _parse_column(parse_time, values, strict)
+
+
+def parse_datetime_column(values: Iterable[Any], strict: bool = True) -> List[Any]:
+    """Parse a whole column of timestamps, parsing each distinct string once."""
+    return _parse_column(parse_datetime, values, strict)
+
+
+def parse_bool_column(values: Iterable[Any], default: Optional[bool] = None,
+                      strict: bool = True) -> List[Any]:
+    """Parse a whole column of booleans, parsing each distinct string once."""
+    return _parse_column(lambda v: parse_bool(v, default), values, strict)
+
+
+def cache_info() -> dict:
+    """LRU statistics per parser (hits, misses, currsize)."""
+    return {
+        'date': _parse_date_str.cache_info(),
+        'time': _parse_time_str.cache_info(),
+        'datetime': _parse_datetime_str.cache_info(),
+        'bool': _parse_bool_str.cache_info(),
+    }
@@ -0,0 +1,152 @@
+"""
+Cached, batched phone number normalization.
+
+`phonenumbers.parse` plus `is_valid_number` costs tens of microseconds per
+value, and organization and location imports repeat the same few hundred
+numbers. `PhoneNormalizer` memoizes results per raw string in a bounded LRU,
+normalizes a whole column at once (each distinct value parsed once) and keeps
+call, cache and timing counters.
+
+Validity matches what `DataValidator.validate_phone` has always returned:
+empty values are valid (phone is optional), numbers phonenumbers can parse
+must be valid for their region, and values it cannot parse (or every value,
+when phonenumbers is not installed) fall back to a digits-only regex.
+"""
+
+import re
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+DEFAULT_REGION = 'US'
+CACHE_SIZE = 4096
+
+FALLBACK_PATTERN = re.compile(r'^[\+]?[1-9][\d]{0,15}$')
+FALLBACK_STRIP = re.compile(r'[\s\-\(\)]')
+
+
+class PhoneResult(NamedTuple):
+    """Normalization result for one raw value."""
+    e164: Optional[str]  # +15095550123 for numbers phonenumbers accepts, else None
+    valid: bool
+    method: str  # 'empty', 'phonenumbers' or 'regex'
+
+
+EMPTY_RESULT = PhoneResult(None, True, 'empty')
+
+
+def _load_phonenumbers():
+    """Import phonenumbers on first use (it is slow to load); None if it is not installed."""
+    try:
+        import phonenumbers
+    except ImportError:
+        return None
+    return phonenumbers
+
+
+class PhoneNormalizer:
+    """Normalize phone numbers to E.164 with a bounded memo cache."""
+
+    def __init__(self, region: str = DEFAULT_REGION, cache_size: int = CACHE_SIZE):
+        self.region = region
+        self._phonenumbers = None
+        self._loaded = False
+        self._normalize_cached = lru_cache(maxsize=cache_size)(self._normalize_uncached)
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.calls = 0
+        self.values = 0
+        self.parse_errors = 0
+        self.fallbacks = 0
+        self.seconds = 0.0
+
+    def _library(self):
+        if not self._loaded:
+            self._phonenumbers = _load_phonenumbers()
+            self._loaded = True
+        return self._phonenumbers
+
+    def _fallback(self, phone: str) -> PhoneResult:
+        self.fallbacks += 1
+        cleaned = FALLBACK_STRIP.sub('', phone)
+        return PhoneResult(None, bool(FALLBACK_PATTERN.match(cleaned)), 'regex')
+
+    def _normalize_uncached(self, phone: str) -> PhoneResult:
+        phonenumbers = self._library()
+        if phonenumbers is None:
+            return self._fallback(phone)
+        try:
+            parsed = phonenumbers.parse(phone, self.region)
+        except phonenumbers.NumberParseException:
+            self.parse_errors += 1
+            return self._fallback(phone)
+        if not phonenumbers.is_valid_number(parsed):
+            return PhoneResult(None, False, 'phonenumbers')
+        e164 = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+        return PhoneResult(e164, True, 'phonenumbers')
+
+    def normalize(self, phone: Optional[str]) -> PhoneResult:
+        """Normalize one value (None and '' are valid and empty)."""
+        started = time.perf_counter()
+        self.calls += 1
+        self.values += 1
+        result = self._normalize_cached(phone) if phone else EMPTY_RESULT
+        self.seconds += time.perf_counter() - started
+        return result
+
+    def normalize_many(self, phones: Iterable[Optional[str]]) -> List[PhoneResult]:
+        """Normalize a whole column, looking up each distinct value once."""
+        started = time.perf_counter()
+        phones = list(phones)
+        self.calls += 1
+        self.values += len(phones)
+        results: Dict[Any, PhoneResult] = {}
+        for phone in phones:
+            if phone not in results:
+                results[phone] = self._normalize_cached(phone) if phone else EMPTY_RESULT
+        self.seconds += time.perf_counter() - started
+        return [results[phone] for phone in phones]
+
+    def is_valid(self, phone: Optional[str]) -> bool:
+        return self.normalize(phone).valid
+
+    def to_e164(self, phone: Optional[str]) -> Optional[str]:
+        return self.normalize(phone).e164
+
+    def stats(self) -> Dict[str, Any]:
+        """Call, cache and timing counters since creation or the last reset_stats()."""
+        info = self._normalize_cached.cache_info()
+        return {
+            'calls': self.calls,
+            'values': self.values,
+            'cache_hits': info.hits,
+            'cache_misses': info.misses,
+            'cache_size': info.currsize,
+            'parse_errors': self.parse_errors,
+            'regex_fallbacks': self.fallbacks,
+            'seconds': self.seconds,
+            'us_per_value': self.seconds / self.values * 1e6 if self.values else 0.0,
+        }
+
+    def clear_cache(self) -> None:
+        self._normalize_cached.cache_clear()
+
+
+_default: Optional[PhoneNormalizer] = None
+
+
+def default_normalizer() -> PhoneNormalizer:
+    """Shared normalizer for the default region."""
+    global _default
+    if _default is None:
+        _default = PhoneNormalizer()
+    return _default
+
+
+def normalize_phone(phone: Optional[str]) -> PhoneResult:
+    return default_normalizer().normalize(phone)
+
+
+def normalize_phones(phones: Iterable[Optional[str]]) -> List[PhoneResult]:
+    return default_normalizer().normalize_many(phones)
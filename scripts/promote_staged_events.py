@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Promote pending staged events to public events in bulk.
+
+Does what the admin approve endpoint (src/pages/api/admin/events-staged/approve.ts)
+does for one row, but for a whole batch with set-based SQL in one transaction:
+
+1. copy the selected pending rows (with a primary tag) into a temp table and
+   pre-generate their event ids
+2. create approved locations / organizations for `location_added` /
+   `organization_added` (one per distinct name in the batch)
+3. resolve parents: an explicit parent that is already an event, an approved
+   top-level event named by a [SCRAPER_APPROVED_PARENT_ID:…] comment marker,
+   or a staged parent promoted in the same batch
+4. one INSERT … SELECT into events (status approved, source_id and
+   source_title carried over, parent markers stripped from comments)
+5. point pending staged children outside the batch at their new approved
+   parent via the comment marker, then delete the promoted staged rows
+
+Staged rows are never marked approved (events_staged_status_staging_only);
+approval moves them into events, exactly like the app.
+
+Usage:
+    python scripts/promote_staged_events.py --ids <uuid> <uuid> ...
+    python scripts/promote_staged_events.py --source-id <uuid> --dry-run
+    python scripts/promote_staged_events.py --all-pending --limit 500
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import psycopg2
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.lib.db import get_connection
+
+PARENT_MARKER = r'\[SCRAPER_APPROVED_PARENT_ID:([0-9a-fA-F-]{36})\]'
+
+
+def strip_markers_sql(column: str) -> str:
+    """SQL for `column` without parent markers, whitespace-trimmed (like JS .trim()), NULL if empty."""
+    stripped = f"regexp_replace(coalesce({column}, ''), '{PARENT_MARKER}', '', 'gi')"
+    return f"NULLIF(regexp_replace({stripped}, '^\\s+|\\s+$', '', 'g'), '')"
+
+
+# events column -> expression over the promote_batch temp table (b)
+EVENT_COLUMNS: Dict[str, str] = {
+    'id': 'b.new_id',
+    'title': 'b.title',
+    'description': 'b.description',
+    'start_date': 'b.start_date',
+    'end_date': 'b.end_date',
+    'start_time': 'b.start_time',
+    'end_time': 'b.end_time',
+    'location_id': 'b.location_id',
+    'organization_id': 'b.organization_id',
+    'email': 'b.email',
+    'website': 'b.website',
+    'registration_link': 'b.registration_link',
+    'primary_tag_id': 'b.primary_tag_id',
+    'secondary_tag_id': 'b.secondary_tag_id',
+    'image_id': 'b.image_id',
+    'external_image_url': 'b.external_image_url',
+    'featured': 'b.featured',
+    'parent_event_id': 'b.resolved_parent_id',
+    'exclude_from_calendar': 'b.exclude_from_calendar',
+    'registration': 'b.registration',
+    'cost': 'b.cost',
+    'comments': strip_markers_sql('b.comments'),
+    'status': "'approved'::event_status",
+    'source_id': 'b.source_id',
+    'source_title': 'b.source_title',
+}
+
+
+def build_selection(ids: Optional[List[str]], source_id: Optional[str],
+                    limit: Optional[int]) -> tuple:
+    """WHERE clause (without the keyword) and parameters selecting pending staged rows."""
+    clauses = ["status = 'pending'"]
+    params: Dict[str, object] = {}
+    if ids:
+        clauses.append('id = ANY(%(ids)s::uuid[])')
+        params['ids'] = ids
+    if source_id:
+        clauses.append('source_id = %(source_id)s')
+        params['source_id'] = source_id
+    where = ' AND '.join(clauses)
+    if limit:
+        where += ' ORDER BY start_date, id LIMIT %(limit)s'
+        params['limit'] = limit
+    return where, params
+
+
+def create_batch(cur, ids: Optional[List[str]], source_id: Optional[str],
+                 limit: Optional[int]) -> Dict[str, int]:
+    """Lock the selected rows and copy those with a primary tag into promote_batch."""
+    where, params = build_selection(ids, source_id, limit)
+    cur.execute(f'SELECT id, primary_tag_id IS NOT NULL FROM events_staged WHERE {where} FOR UPDATE', params)
+    rows = cur.fetchall()
+    ready = [row_id for row_id, has_tag in rows if has_tag]
+    cur.execute(
+        """
+        CREATE TEMP TABLE promote_batch ON COMMIT DROP AS
+        SELECT s.*,
+               gen_random_uuid() AS new_id,
+               s.parent_event_id AS resolved_parent_id,
+               substring(s.comments FROM %(marker)s)::uuid AS marked_parent_id
+        FROM events_staged s
+        WHERE s.id = ANY(%(ids)s::uuid[])
+        """,
+        {'ids': ready, 'marker': PARENT_MARKER}
+    )
+    return {'selected': len(rows), 'missing_primary_tag': len(rows) - len(ready), 'promoted': len(ready)}
+
+
+def create_added_entities(cur) -> Dict[str, int]:
+    """Create approved locations/organizations for *_added names and point the batch at them."""
+    created = {}
+    for table, added, column in (('locations', 'location_added', 'location_id'),
+                                 ('organizations', 'organization_added', 'organization_id')):
+        cur.execute(
+            f"""
+            WITH created AS (
+                INSERT INTO {table} (name, status)
+                SELECT DISTINCT {added}, 'approved'::event_status FROM promote_batch
+                WHERE {added} IS NOT NULL AND {added} <> ''
+                RETURNING id, name
+            )
+            UPDATE promote_batch b SET {column} = created.id
+            FROM created WHERE b.{added} = created.name
+            """
+        )
+        cur.execute(f"SELECT count(DISTINCT {added}) FROM promote_batch WHERE {added} IS NOT NULL AND {added} <> ''")
+        created[table] = cur.fetchone()[0]
+    return created
+
+
+def resolve_parents(cur) -> int:
+    """Resolve parent_event_id for the batch; returns how many promoted events get a parent."""
+    # Marker parents only apply when the staged row has no explicit parent
+    cur.execute(
+        """
+        UPDATE promote_batch b SET resolved_parent_id = e.id
+        FROM events e
+        WHERE b.resolved_parent_id IS NULL AND e.id = b.marked_parent_id
+          AND e.status = 'approved' AND e.parent_event_id IS NULL
+        """
+    )
+    # A parent that is a staged row promoted in this batch maps to its new id
+    cur.execute(
+        """
+        UPDATE promote_batch b SET resolved_parent_id = p.new_id
+        FROM promote_batch p
+        WHERE b.resolved_parent_id = p.id
+        """
+    )
+    # Anything else that is not an event would violate the events.parent_event_id FK
+    cur.execute(
+        """
+        UPDATE promote_batch b SET resolved_parent_id = NULL
+        WHERE b.resolved_parent_id IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM events e WHERE e.id = b.resolved_parent_id)
+          AND NOT EXISTS (SELECT 1 FROM promote_batch p WHERE p.new_id = b.resolved_parent_id)
+        """
+    )
+    cur.execute('SELECT count(*) FROM promote_batch WHERE resolved_parent_id IS NOT NULL')
+    return cur.fetchone()[0]
+
+
+def insert_events(cur) -> int:
+    columns = ', '.join(EVENT_COLUMNS)
+    expressions = ', '.join(EVENT_COLUMNS.values())
+    cur.execute(f'INSERT INTO events ({columns}) SELECT {expressions} FROM promote_batch b')
+    return cur.rowcount
+
+
+def relink_staged_children(cur) -> int:
+    """Pending staged children of promoted rows get the approved parent marker, as in the app."""
+    cur.execute(
+        f"""
+        UPDATE events_staged c
+        SET parent_event_id = NULL,
+            comments = concat_ws(E'\\n', {strip_markers_sql('c.comments')},
+                                 '[SCRAPER_APPROVED_PARENT_ID:' || b.new_id || ']')
+        FROM promote_batch b
+        WHERE c.parent_event_id = b.id AND c.status = 'pending'
+          AND NOT EXISTS (SELECT 1 FROM promote_batch p WHERE p.id = c.id)
+        """
+    )
+    return cur.rowcount
+
+
+def delete_promoted(cur) -> int:
+    cur.execute('DELETE FROM events_staged s USING promote_batch b WHERE s.id = b.id')
+    return cur.rowcount
+
+
+def promote(conn, ids: Optional[List[str]] = None, source_id: Optional[str] = None,
+            limit: Optional[int] = None, dry_run: bool = False) -> Dict[str, int]:
+    """Promote the selected pending staged events in one transaction (rolled back for dry runs)."""
+    with conn.cursor() as cur:
+        summary = create_batch(cur, ids, source_id, limit)
+        if summary['promoted']:
+            created = create_added_entities(cur)
+            summary['locations_created'] = created['locations']
+            summary['organizations_created'] = created['organizations']
+            summary['with_parent'] = resolve_parents(cur)
+            insert_events(cur)
+            summary['children_relinked'] = relink_staged_children(cur)
+            delete_promoted(cur)
+    if dry_run:
+        conn.rollback()
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Promote pending staged events to events in bulk')
+    selection = parser.add_mutually_exclusive_group(required=True)
+    selection.add_argument('--ids', nargs='+', help='Staged event ids to promote')
+    selection.add_argument('--source-id', help='Promote pending rows from this source site')
+    selection.add_argument('--all-pending', action='store_true', help='Promote every pending row')
+    parser.add_argument('--limit', type=int, help='Promote at most this many rows (earliest first)')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would happen and roll back')
+    args = parser.parse_args()
+
+    try:
+        with get_connection() as conn:
+            summary = promote(conn, ids=args.ids, source_id=args.source_id,
+                              limit=args.limit, dry_run=args.dry_run)
+    except psycopg2.Error as e:
+        print(f'Error promoting staged events: {e}')
+        sys.exit(1)
+
+    print(f"{'Dry run: would promote' if args.dry_run else 'Promoted'} {summary['promoted']} "
+          f"of {summary['selected']} selected staged events")
+    for key, value in summary.items():
+        if key not in ('selected', 'promoted'):
+            print(f'  {key}: {value}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Rebase dates in the local database so seeded data shows up as "upcoming".
+
+Uses the same shift as seed_local_base.py (earliest event moves to tomorrow),
+but applies it to already-loaded rows with one set-based UPDATE per table, so
+the client does constant work no matter how large the dataset is.
+
+events_staged rows must stay on or after today (events_staged_start_date_future),
+so a computed shift that would move them into the past is clamped for that
+table, and an explicit --days that would do so is rejected.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import psycopg2
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.lib.db import get_cursor
+
+# Per table: (date columns shifted by whole days, timestamp columns shifted by an interval)
+SHIFT_COLUMNS: Dict[str, Tuple[List[str], List[str]]] = {
+    'events': (['start_date', 'end_date'], []),
+    'events_staged': (['start_date', 'end_date'], []),
+    'announcements': ([], ['show_at', 'expires_at']),
+    'activities': (['registration_opens', 'registration_closes'], ['start_datetime', 'end_datetime']),
+}
+
+
+def compute_days_shift(cur) -> Optional[int]:
+    """Number of days that moves the earliest event to tomorrow (None if no events)."""
+    cur.execute('SELECT (CURRENT_DATE + 1) - MIN(start_date) FROM events')
+    return cur.fetchone()[0]
+
+
+def staged_min_shift(cur) -> Optional[int]:
+    """Smallest shift that keeps every events_staged start_date on or after today (None if empty)."""
+    cur.execute('SELECT CURRENT_DATE - MIN(start_date) FROM events_staged')
+    return cur.fetchone()[0]
+
+
+def build_shift_statement(table: str) -> str:
+    """Build the single UPDATE that shifts every date/timestamp column of a table."""
+    date_columns, timestamp_columns = SHIFT_COLUMNS[table]
+    assignments = [f'{col} = {col} + %(days)s' for col in date_columns]
+    assignments += [f'{col} = {col} + make_interval(days => %(days)s)' for col in timestamp_columns]
+    return f'UPDATE {table} SET {", ".join(assignments)}'
+
+
+def rebase_dates(cur, days: int, overrides: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """
+    Shift all tables by `days` (or their entry in `overrides`) and return the
+    number of rows touched per table.
+    """
+    overrides = overrides or {}
+    touched = {}
+    for table in SHIFT_COLUMNS:
+        table_days = overrides.get(table, days)
+        if not table_days:
+            touched[table] = 0
+            continue
+        cur.execute(build_shift_statement(table), {'days': table_days})
+        touched[table] = cur.rowcount
+    return touched
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shift local event, announcement and activity dates')
+    parser.add_argument('--days', type=int, help='Shift by this many days instead of rebasing to tomorrow')
+    args = parser.parse_args()
+
+    try:
+        with get_cursor() as cur:
+            days = args.days if args.days is not None else compute_days_shift(cur)
+            if not days:
+                print('Dates already current, nothing to shift')
+                return
+
+            overrides = {}
+            staged_min = staged_min_shift(cur)
+            if staged_min is not None and days < staged_min:
+                if args.days is not None:
+                    print(f'Error: --days {days} would move events_staged start dates before today '
+                          f'(events_staged_start_date_future); use --days {staged_min} or more')
+                    sys.exit(1)
+                overrides['events_staged'] = staged_min
+            touched = rebase_dates(cur, days, overrides)
+        print(f'Shifted dates by {days} days:')
+        for table, count in touched.items():
+            note = f' (shifted by {overrides[table]} days to stay on or after today)' if table in overrides else ''
+            print(f'  {table}: {count} rows{note}')
+    except psycopg2.Error as e:
+        print(f'Error rebasing dates: {e}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
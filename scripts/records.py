@@ -0,0 +1,272 @@
+"""
+Compact record types for trusted bulk moves between our own databases.
+
+Rows read back from Der Town (backups, local sync) have already passed
+validation once, so re-validating every row through the Pydantic models is
+wasted work. The slotted dataclasses here mirror `Event`, `Location` and
+`Organization`, convert to and from the models, and build the same database
+payloads without validation.
+
+`check_payload_parity` runs rows through both paths (validated model vs
+trusted record) and reports any payload differences. Run it with
+`make check-payload-parity` (scripts/check_payload_parity.py), which covers
+sample rows, the fixture bundles and any backup files passed to it.
+"""
+
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from pydantic import HttpUrl, TypeAdapter, ValidationError
+
+from models import Event, Location, Organization
+
+_HTTP_URL = TypeAdapter(HttpUrl)
+
+
+def _to_date(value: Any) -> Optional[date]:
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _to_time(value: Any) -> Optional[time]:
+    return time.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, str):
+        # Same handling of the PostgreSQL '+00' suffix as models.parse_datetime_validator
+        if value.endswith('+00'):
+            value = value[:-3]
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value
+
+
+def _payload_value(value: Any) -> Any:
+    """Convert a field value to its JSON/PostgREST payload form."""
+    if isinstance(value, (date, time, datetime)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    # HttpUrl and other pydantic types
+    return str(value)
+
+
+class _Record:
+    """Shared conversions for the record dataclasses below."""
+
+    __slots__ = ()
+
+    # Pydantic model the record mirrors
+    MODEL = None
+    # Columns written to the database (model fields that exist in the table)
+    COLUMNS = ()
+    # Field name -> parser applied to string values from trusted rows
+    PARSERS = {}
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]):
+        """Build a record from a trusted database row without validation.
+
+        Columns the record does not mirror are kept in `extra` so a restore is
+        lossless.
+        """
+        names = cls._field_names()
+        values = {}
+        extra = {}
+        for key, value in row.items():
+            if key in names:
+                parser = cls.PARSERS.get(key)
+                values[key] = parser(value) if parser and value is not None else value
+            else:
+                extra[key] = value
+        return cls(**values, extra=extra)
+
+    @classmethod
+    def from_model(cls, model):
+        """Build a record from a validated Pydantic model."""
+        return cls(**{name: getattr(model, name) for name in cls._field_names()})
+
+    def to_model(self, validate: bool = True):
+        """Convert to the Pydantic model (model_construct skips validation when validate=False)."""
+        data = {name: getattr(self, name) for name in self._field_names()}
+        if validate:
+            return self.MODEL.model_validate(data)
+        return self.MODEL.model_construct(**data)
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Database payload: mirrored columns plus any extra columns from the source row."""
+        payload = {column: _payload_value(getattr(self, column)) for column in self.COLUMNS}
+        payload.update(self.extra)
+        return payload
+
+    @classmethod
+    def _field_names(cls) -> List[str]:
+        return [f.name for f in fields(cls) if f.name != 'extra']
+
+
+@dataclass(slots=True)
+class LocationRecord(_Record):
+    """Mirror of models.Location."""
+    name: str
+    id: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    address: Optional[str] = None
+    website: Optional[str] = None
+    phone: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    parent_location_id: Optional[str] = None
+    status: str = 'pending'
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    MODEL = Location
+    COLUMNS = (
+        'id', 'created_at', 'updated_at', 'name', 'address', 'website', 'phone',
+        'latitude', 'longitude', 'parent_location_id', 'status',
+    )
+    PARSERS = {'created_at': _to_datetime, 'updated_at': _to_datetime}
+
+
+@dataclass(slots=True)
+class OrganizationRecord(_Record):
+    """Mirror of models.Organization."""
+    name: str
+    id: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    description: Optional[str] = None
+    website: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    location_id: Optional[str] = None
+    parent_organization_id: Optional[str] = None
+    status: str = 'pending'
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    MODEL = Organization
+    COLUMNS = (
+        'id', 'created_at', 'updated_at', 'name', 'description', 'website', 'phone',
+        'email', 'location_id', 'parent_organization_id', 'status',
+    )
+    PARSERS = {'created_at': _to_datetime, 'updated_at': _to_datetime}
+
+
+@dataclass(slots=True)
+class EventRecord(_Record):
+    """Mirror of models.Event."""
+    title: str
+    start_date: date
+    id: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    description: Optional[str] = None
+    end_date: Optional[date] = None
+    start_time: Optional[time] = None
+    end_time: Optional[time] = None
+    location_id: Optional[str] = None
+    organization_id: Optional[str] = None
+    email: Optional[str] = None
+    website: Optional[str] = None
+    registration_link: Optional[str] = None
+    primary_tag_id: Optional[str] = None
+    secondary_tag_id: Optional[str] = None
+    image_id: Optional[str] = None
+    external_image_url: Optional[str] = None
+    featured: bool = False
+    parent_event_id: Optional[str] = None
+    exclude_from_calendar: bool = False
+    google_calendar_event_id: Optional[str] = None
+    registration: bool = False
+    cost: Optional[str] = None
+    status: str = 'pending'
+    source_id: Optional[str] = None
+    details_outdated_checked_at: Optional[datetime] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    MODEL = Event
+    # google_calendar_event_id is a model-only field; the events table has no such column
+    COLUMNS = (
+        'id', 'created_at', 'updated_at', 'title', 'description', 'start_date', 'end_date',
+        'start_time', 'end_time', 'location_id', 'organization_id', 'email', 'website',
+        'registration_link', 'primary_tag_id', 'secondary_tag_id', 'image_id',
+        'external_image_url', 'featured', 'parent_event_id', 'exclude_from_calendar',
+        'registration', 'cost', 'status', 'source_id', 'details_outdated_checked_at',
+    )
+    PARSERS = {
+        'start_date': _to_date,
+        'end_date': _to_date,
+        'start_time': _to_time,
+        'end_time': _to_time,
+        'created_at': _to_datetime,
+        'updated_at': _to_datetime,
+        'details_outdated_checked_at': _to_datetime,
+    }
+
+
+RECORD_TYPES: Dict[str, Type[_Record]] = {
+    'events': EventRecord,
+    'locations': LocationRecord,
+    'organizations': OrganizationRecord,
+}
+
+URL_FIELDS = {'website', 'registration_link', 'external_image_url'}
+
+
+def trusted_payloads(table: str, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build insert payloads for trusted rows without model validation."""
+    record_cls = RECORD_TYPES.get(table)
+    if record_cls is None:
+        return list(rows)
+    return [record_cls.from_row(row).to_payload() for row in rows]
+
+
+def validated_payloads(table: str, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build insert payloads by validating every row through its Pydantic model."""
+    record_cls = RECORD_TYPES.get(table)
+    if record_cls is None:
+        return list(rows)
+    payloads = []
+    for row in rows:
+        record = record_cls.from_row(row)
+        model = record_cls.MODEL.model_validate(row)
+        payload = record_cls.from_model(model).to_payload()
+        payload.update(record.extra)
+        payloads.append(payload)
+    return payloads
+
+
+def check_payload_parity(table: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compare trusted and validated payloads for the same rows.
+
+    Differences that come only from HttpUrl normalization (e.g. an added
+    trailing slash) are counted separately from real mismatches.
+    """
+    record_cls = RECORD_TYPES[table]
+    report = {'table': table, 'rows': len(rows), 'invalid': 0, 'url_normalized': 0, 'mismatches': []}
+    for row in rows:
+        trusted = record_cls.from_row(row).to_payload()
+        try:
+            validated = validated_payloads(table, [row])[0]
+        except ValidationError:
+            report['invalid'] += 1
+            continue
+        for column in record_cls.COLUMNS:
+            if trusted.get(column) == validated.get(column):
+                continue
+            if column in URL_FIELDS and trusted.get(column) is not None and \
+                    str(_HTTP_URL.validate_python(trusted[column])) == validated.get(column):
+                report['url_normalized'] += 1
+                continue
+            report['mismatches'].append({
+                'id': row.get('id'),
+                'column': column,
+                'trusted': trusted.get(column),
+                'validated': validated.get(column),
+            })
+    return report
+
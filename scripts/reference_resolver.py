@@ -0,0 +1,71 @@
+"""
+Preloaded name -> id lookups for foreign keys in direct-DB loaders.
+
+Each reference table is read once into a dictionary keyed by normalized name,
+so rows can be resolved in memory instead of issuing a SELECT per value.
+Names that fail to resolve are collected and reported once at the end.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+
+def normalize_name(name: Optional[str]) -> Optional[str]:
+    """Normalize a reference name for matching (trim, collapse whitespace, casefold)."""
+    if name is None:
+        return None
+    normalized = ' '.join(name.split()).casefold()
+    return normalized or None
+
+
+class ReferenceResolver:
+    """Resolve reference-table names to ids from in-memory dictionaries."""
+
+    def __init__(self, cur, tables: Iterable[str] = ('locations', 'organizations', 'tags')):
+        self.cur = cur
+        self.ids: Dict[str, Dict[str, str]] = {}
+        self.unmatched: Dict[str, Counter] = {}
+        for table in tables:
+            self.load(table)
+
+    def load(self, table: str) -> None:
+        """(Re)load a reference table with a single query."""
+        self.cur.execute(f'SELECT id, name FROM {table}')
+        lookup: Dict[str, str] = {}
+        for row_id, name in self.cur.fetchall():
+            key = normalize_name(name)
+            # Keep the first row when two names normalize to the same key
+            if key is not None and key not in lookup:
+                lookup[key] = row_id
+        self.ids[table] = lookup
+        self.unmatched[table] = Counter()
+
+    def discard_ids(self, table: str, ids: Iterable[str]) -> None:
+        """Stop resolving names to the given ids (e.g. rows about to be deleted)."""
+        drop = {str(row_id) for row_id in ids}
+        if drop:
+            self.ids[table] = {key: row_id for key, row_id in self.ids[table].items() if str(row_id) not in drop}
+
+    def resolve(self, table: str, name: Optional[str]) -> Optional[str]:
+        """Return the id for a name, recording it as unmatched if not found."""
+        key = normalize_name(name)
+        row_id = self.ids[table].get(key) if key is not None else None
+        if row_id is None:
+            self.unmatched[table][name.strip() if name and name.strip() else '<empty>'] += 1
+        return row_id
+
+    def has_unmatched(self) -> bool:
+        """Return True if any lookup failed."""
+        return any(self.unmatched.values())
+
+    def report_unmatched(self) -> None:
+        """Print a consolidated report of names that did not resolve."""
+        if not self.has_unmatched():
+            return
+        print('Unmatched reference names:')
+        for table, names in self.unmatched.items():
+            if not names:
+                continue
+            print(f'  {table} ({sum(names.values())} rows, {len(names)} distinct):')
+            for name, count in names.most_common():
+                print(f"    '{name}' x{count}")
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+On-disk inverted index for full-text search over event titles and descriptions.
+
+`EventFilters.search` is a substring match, which means a scan of every
+event. This module keeps a SQLite inverted index instead (by default in
+`.cache/search_index.sqlite3`):
+
+- text is case-folded, accent-stripped and split into word tokens; a few
+  stopwords are dropped and title tokens count double
+- postings are stored as (term, doc, tf) in a clustered WITHOUT ROWID table,
+  so exact terms and prefixes (`jaz*`, and the last query word) are range
+  scans on the primary key
+- results are ranked with BM25 (k1=1.2, b=0.75); by default every query word
+  must match, like the substring filter
+
+The index is built from an events snapshot (a data_manager JSON backup, an
+NDJSON export or the database) and updated incrementally: rows whose
+`updated_at` is at or after the stored watermark are re-indexed, and events
+that no longer exist are removed when a full id list is available.
+
+Usage:
+    python scripts/search_index.py build --from-file backups/db_backup_20250101_120000.json
+    python scripts/search_index.py update --from-db
+    python scripts/search_index.py search "jazz festival" --limit 10
+    python scripts/search_index.py stats
+"""
+
+import argparse
+import math
+import re
+import sqlite3
+import sys
+import time
+import unicodedata
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from parsers import parse_datetime
+
+project_root = Path(__file__).parent.parent
+
+DEFAULT_PATH = project_root / '.cache' / 'search_index.sqlite3'
+
+TOKEN_PATTERN = re.compile(r'\w+')
+STOPWORDS = frozenset((
+    'a', 'an', 'and', 'are', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it',
+    'of', 'on', 'or', 'the', 'to', 'with',
+))
+TITLE_WEIGHT = 2
+K1 = 1.2
+B = 0.75
+# Most frequent expansions kept per prefix term
+MAX_EXPANSIONS = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    doc INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL UNIQUE,
+    length INTEGER NOT NULL,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _fold(text: str) -> str:
+    text = text.casefold()
+    if text.isascii():
+        return text
+    return ''.join(char for char in unicodedata.normalize('NFKD', text) if not unicodedata.combining(char))
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Case-folded, accent-stripped word tokens without stopwords."""
+    if not text:
+        return []
+    return [token for token in TOKEN_PATTERN.findall(_fold(text)) if token not in STOPWORDS]
+
+
+def term_frequencies(title: Optional[str], description: Optional[str]) -> Counter:
+    """Weighted term counts for one event (title tokens count TITLE_WEIGHT times)."""
+    counts = Counter(tokenize(description))
+    for token in tokenize(title):
+        counts[token] += TITLE_WEIGHT
+    return counts
+
+
+def watermark_key(value: Any) -> Optional[str]:
+    """Sortable UTC ISO string for an updated_at value (str or datetime)."""
+    parsed = parse_datetime(value)
+    if parsed is None:
+        return None
+    if isinstance(parsed, datetime) and parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.isoformat(timespec='microseconds')
+
+
+class SearchIndex:
+    """SQLite-backed inverted index with BM25 ranking."""
+
+    def __init__(self, path: Path = DEFAULT_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> 'SearchIndex':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- metadata -----------------------------------------------------------
+
+    def _meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key: str, value: Optional[str]) -> None:
+        self.conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    @property
+    def watermark(self) -> Optional[str]:
+        """Latest updated_at indexed so far (UTC ISO string), or None for an empty index."""
+        return self._meta('watermark')
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'documents': int(self._meta('doc_count', '0')),
+            'average_length': self._average_length(),
+            'terms': self.conn.execute('SELECT count(DISTINCT term) FROM postings').fetchone()[0],
+            'postings': self.conn.execute('SELECT count(*) FROM postings').fetchone()[0],
+            'watermark': self.watermark,
+        }
+
+    def _average_length(self) -> float:
+        count = int(self._meta('doc_count', '0'))
+        return int(self._meta('total_length', '0')) / count if count else 0.0
+
+    # -- updates ------------------------------------------------------------
+
+    def clear(self) -> None:
+        with self.conn:
+            self.conn.execute('DELETE FROM postings')
+            self.conn.execute('DELETE FROM docs')
+            self.conn.execute('DELETE FROM meta')
+
+    def _remove_docs(self, docs: Sequence[Tuple[int, int]]) -> int:
+        """Drop (doc, length) pairs; returns the total length removed."""
+        self.conn.executemany('DELETE FROM postings WHERE doc = ?', [(doc,) for doc, _ in docs])
+        self.conn.executemany('DELETE FROM docs WHERE doc = ?', [(doc,) for doc, _ in docs])
+        return sum(length for _, length in docs)
+
+    def upsert(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """(Re-)index event rows with id, title, description and updated_at; returns rows indexed."""
+        count = int(self._meta('doc_count', '0'))
+        total = int(self._meta('total_length', '0'))
+        watermark = self.watermark
+        indexed = 0
+        with self.conn:
+            for row in rows:
+                event_id = str(row['id'])
+                existing = self.conn.execute(
+                    'SELECT doc, length FROM docs WHERE event_id = ?', (event_id,)
+                ).fetchone()
+                if existing:
+                    total -= self._remove_docs([existing])
+                    count -= 1
+                counts = term_frequencies(row.get('title'), row.get('description'))
+                length = sum(counts.values())
+                updated = watermark_key(row.get('updated_at'))
+                doc = self.conn.execute(
+                    'INSERT INTO docs (event_id, length, updated_at) VALUES (?, ?, ?)',
+                    (event_id, length, updated)
+                ).lastrowid
+                self.conn.executemany(
+                    'INSERT INTO postings (term, doc, tf) VALUES (?, ?, ?)',
+                    [(term, doc, tf) for term, tf in counts.items()]
+                )
+                count += 1
+                total += length
+                indexed += 1
+                if updated and (watermark is None or updated > watermark):
+                    watermark = updated
+            self._set_meta('doc_count', str(count))
+            self._set_meta('total_length', str(total))
+            self._set_meta('watermark', watermark)
+        return indexed
+
+    def remove(self, event_ids: Iterable[Any]) -> int:
+        """Remove events from the index; returns how many were indexed."""
+        docs = []
+        for event_id in event_ids:
+            row = self.conn.execute(
+                'SELECT doc, length FROM docs WHERE event_id = ?', (str(event_id),)
+            ).fetchone()
+            if row:
+                docs.append(row)
+        if not docs:
+            return 0
+        with self.conn:
+            removed_length = self._remove_docs(docs)
+            self._set_meta('doc_count', str(int(self._meta('doc_count', '0')) - len(docs)))
+            self._set_meta('total_length', str(int(self._meta('total_length', '0')) - removed_length))
+        return len(docs)
+
+    def retain(self, event_ids: Iterable[Any]) -> int:
+        """Remove every indexed event not in `event_ids` (a full list of live ids)."""
+        live = {str(event_id) for event_id in event_ids}
+        stale = [event_id for (event_id,) in self.conn.execute('SELECT event_id FROM docs')
+                 if event_id not in live]
+        return self.remove(stale)
+
+    def update(self, rows: Iterable[Dict[str, Any]], full: bool = False) -> Dict[str, int]:
+        """
+        Apply a snapshot of event rows.
+
+        Only rows updated at or after the watermark are re-indexed. With
+        `full=True` the snapshot is treated as the complete event list, so
+        indexed events missing from it are removed.
+        """
+        rows = list(rows)
+        watermark = self.watermark
+        changed = [
+            row for row in rows
+            if watermark is None or (watermark_key(row.get('updated_at')) or '') >= watermark
+            or row.get('updated_at') is None
+        ]
+        indexed = self.upsert(changed)
+        removed = self.retain(row['id'] for row in rows) if full else 0
+        return {'indexed': indexed, 'removed': removed, 'unchanged': len(rows) - indexed}
+
+    # -- queries ------------------------------------------------------------
+
+    def _term_stats(self, token: str, is_prefix: bool) -> List[Tuple[str, int]]:
+        """(term, document frequency) for a token, or its most frequent expansions for a prefix."""
+        if not is_prefix:
+            df = self.conn.execute('SELECT count(*) FROM postings WHERE term = ?', (token,)).fetchone()[0]
+            return [(token, df)] if df else []
+        return self.conn.execute(
+            'SELECT term, count(*) AS df FROM postings WHERE term >= ? AND term < ? '
+            'GROUP BY term ORDER BY df DESC LIMIT ?',
+            (token, token + '\U0010ffff', MAX_EXPANSIONS)
+        ).fetchall()
+
+    def parse_query(self, query: str, prefix_last: bool = True) -> List[Tuple[str, bool]]:
+        """(token, is_prefix) pairs; `word*` and (by default) the last word are prefixes."""
+        words = query.split()
+        parsed = []
+        for position, word in enumerate(words):
+            is_prefix = word.endswith('*') or (prefix_last and position == len(words) - 1)
+            for token in tokenize(word.rstrip('*')):
+                parsed.append((token, is_prefix))
+        return parsed
+
+    def search(self, query: str, limit: Optional[int] = 20, require_all: bool = True,
+               prefix_last: bool = True) -> List[Tuple[str, float]]:
+        """Return (event_id, score) pairs ranked by BM25, best first."""
+        tokens = self.parse_query(query, prefix_last)
+        count = int(self._meta('doc_count', '0'))
+        if not tokens or not count:
+            return []
+
+        # (term, token position, idf) for every term the query expands to
+        terms = []
+        rarest: Optional[Tuple[int, List[str]]] = None
+        for position, (token, is_prefix) in enumerate(tokens):
+            stats = self._term_stats(token, is_prefix)
+            if not stats and require_all:
+                return []
+            for term, df in stats:
+                terms.append((term, position, math.log(1 + (count - df + 0.5) / (df + 0.5))))
+            matches = sum(df for _, df in stats)
+            if stats and (rarest is None or matches < rarest[0]):
+                rarest = (matches, [term for term, _ in stats])
+        if not terms:
+            return []
+
+        # Scoring and top-k run inside SQLite rather than per posting in Python
+        values = ','.join('(?, ?, ?)' for _ in terms)
+        params: List[Any] = [value for term in terms for value in term]
+        sql = (
+            f'WITH q(term, token, idf) AS (VALUES {values}) '
+            'SELECT d.event_id, '
+            '       sum(q.idf * p.tf * (? + 1) / (p.tf + ? * (1 - ? + ? * d.length / ?))) AS score '
+            'FROM q JOIN postings p ON p.term = q.term JOIN docs d ON d.doc = p.doc '
+        )
+        params += [K1, K1, B, B, self._average_length() or 1.0]
+        if require_all and len(tokens) > 1:
+            # Only documents containing the rarest word can match every word
+            sql += f'WHERE p.doc IN (SELECT doc FROM postings WHERE term IN ({",".join("?" * len(rarest[1]))})) '
+            params += rarest[1]
+        sql += 'GROUP BY p.doc '
+        if require_all:
+            sql += 'HAVING count(DISTINCT q.token) = ? '
+            params.append(len(tokens))
+        sql += 'ORDER BY score DESC, p.doc'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        return self.conn.execute(sql, params).fetchall()
+
+    def search_ids(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Event ids matching every query word (e.g. for `EventFilters.search`), best first."""
+        return [event_id for event_id, _ in self.search(query, limit=limit)]
+
+
+# -- snapshot sources -------------------------------------------------------
+
+def load_snapshot(path: str) -> List[Dict[str, Any]]:
+    """Event rows from a data_manager JSON backup, a JSON list or an NDJSON file."""
+    import serialization
+
+    with open(path, 'rb') as f:
+        if path.endswith('.ndjson') or path.endswith('.jsonl'):
+            return list(serialization.read_ndjson(f))
+        data = serialization.load(f)
+    return data.get('events', []) if isinstance(data, dict) else data
+
+
+def sync_database(index: SearchIndex, full: bool = True, chunk_size: int = 2000) -> Dict[str, int]:
+    """Re-index events updated since the watermark straight from PostgreSQL."""
+    sys.path.insert(0, str(project_root))
+    from src.lib.db import get_connection, stream_rows
+
+    indexed = removed = 0
+    watermark = index.watermark
+    query = 'SELECT id, title, description, updated_at FROM events'
+    params: List[Any] = []
+    if watermark:
+        query += ' WHERE updated_at >= %s'
+        params.append(watermark + '+00')
+    with get_connection() as conn:
+        batch = []
+        for event_id, title, description, updated_at in stream_rows(conn, query + ' ORDER BY updated_at', params):
+            batch.append({'id': event_id, 'title': title, 'description': description, 'updated_at': updated_at})
+            if len(batch) >= chunk_size:
+                indexed += index.upsert(batch)
+                batch = []
+        indexed += index.upsert(batch)
+        if full:
+            with conn.cursor() as cur:
+                cur.execute('SELECT id FROM events')
+                removed = index.retain(row[0] for row in cur)
+    return {'indexed': indexed, 'removed': removed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Full-text search index for events')
+    parser.add_argument('--index', default=str(DEFAULT_PATH), help='Index file path')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for name, help_text in (('build', 'Rebuild the index from scratch'),
+                            ('update', 'Re-index events changed since the last run')):
+        sub = subparsers.add_parser(name, help=help_text)
+        source = sub.add_mutually_exclusive_group(required=True)
+        source.add_argument('--from-file', help='JSON backup, JSON list or NDJSON of events')
+        source.add_argument('--from-db', action='store_true', help='Read events from PostgreSQL (src/lib/db.py)')
+
+    search = subparsers.add_parser('search', help='Search the index')
+    search.add_argument('query')
+    search.add_argument('--limit', type=int, default=20)
+    search.add_argument('--any', action='store_true', help='Match any query word instead of all')
+
+    subparsers.add_parser('stats', help='Show index statistics')
+    args = parser.parse_args()
+
+    with SearchIndex(Path(args.index)) as index:
+        if args.command in ('build', 'update'):
+            if args.command == 'build':
+                index.clear()
+            started = time.perf_counter()
+            if args.from_db:
+                result = sync_database(index)
+            else:
+                result = index.update(load_snapshot(args.from_file), full=True)
+            print(f"{args.command}: {result} in {time.perf_counter() - started:.2f}s")
+        elif args.command == 'search':
+            started = time.perf_counter()
+            results = index.search(args.query, limit=args.limit, require_all=not args.any)
+            elapsed = (time.perf_counter() - started) * 1000
+            for event_id, score in results:
+                print(f"{score:8.3f}  {event_id}")
+            print(f"{len(results)} result(s) in {elapsed:.1f} ms")
+        else:
+            for key, value in index.stats().items():
+                print(f"{key}: {value}")
+
+
+if __name__ == '__main__':
+    main()
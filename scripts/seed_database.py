@@ -7,7 +7,6 @@ Reads data from CSV files and inserts into Supabase database.
 import csv
 import os
 import sys
-from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -22,7 +21,8 @@ from scripts.models import (
     Organization,
     Tag,
 )
-from scripts.validation import validate_csv_data
+from scripts.parsers import parse_bool, parse_date_column, parse_time_column
+from scripts.validation import sanitize_records, validate_csv_data
 from src.lib.supabase import get_supabase_client
 
 # Configure logging
@@ -54,8 +54,8 @@ def read_csv_data(file_path: Path) -> List[Dict]:
     data = []
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
+            rows = sanitize_records(list(csv.DictReader(f)))
+            for row in rows:
                 # Convert empty strings and \N to None for optional fields
                 cleaned_row = {}
                 for key, value in row.items():
@@ -72,6 +72,14 @@ def read_csv_data(file_path: Path) -> List[Dict]:
         return []
 
 
+def parse_flag(value) -> bool:
+    """Parse a CSV boolean cell; blank or unrecognised values are False, as seeding always treated them."""
+    try:
+        return parse_bool(value, default=False)
+    except ValueError:
+        return False
+
+
 def seed_tags(supabase) -> Dict[int, str]:
     """Seed tags and return a mapping of old IDs to new UUIDs."""
     csv_path = Path("seed_data/tags.csv")
@@ -274,9 +282,15 @@ def seed_events(supabase, tag_id_mapping: Dict[int, str],
         logger.warning("No event data found")
         return {}
     
+    # Parse date/time columns once per distinct value; bad values are left for validation to report
+    start_dates = parse_date_column((row.get('start_date') for row in data), strict=False)
+    end_dates = parse_date_column((row.get('end_date') for row in data), strict=False)
+    start_times = parse_time_column((row.get('start_time') for row in data), strict=False)
+    end_times = parse_time_column((row.get('end_time') for row in data), strict=False)
+    
     # Validate data with Pydantic
     validated_events = []
-    for row in data:
+    for i, row in enumerate(data):
         try:
             # Map old IDs to new UUIDs
             primary_tag_id = None
@@ -307,10 +321,10 @@ def seed_events(supabase, tag_id_mapping: Dict[int, str],
             event = Event(
                 title=row['title'],
                 description=row.get('description'),
-                start_date=datetime.strptime(row['start_date'], '%Y-%m-%d').date(),
-                end_date=datetime.strptime(row['end_date'], '%Y-%m-%d').date() if row.get('end_date') else None,
-                start_time=datetime.strptime(row['start_time'], '%H:%M:%S').time() if row.get('start_time') else None,
-                end_time=datetime.strptime(row['end_time'], '%H:%M:%S').time() if row.get('end_time') else None,
+                start_date=start_dates[i],
+                end_date=end_dates[i],
+                start_time=start_times[i],
+                end_time=end_times[i],
                 location_id=location_id,
                 organization_id=organization_id,
                 email=row.get('email'),
@@ -319,10 +333,10 @@ def seed_events(supabase, tag_id_mapping: Dict[int, str],
                 primary_tag_id=primary_tag_id,
                 secondary_tag_id=secondary_tag_id,
                 external_image_url=row.get('external_image_url'),
-                featured=row.get('featured', 'false').lower() == 'true',
-                exclude_from_calendar=row.get('exclude_from_calendar', 'false').lower() == 'true',
+                featured=parse_flag(row.get('featured')),
+                exclude_from_calendar=parse_flag(row.get('exclude_from_calendar')),
                 google_calendar_event_id=row.get('google_calendar_event_id'),
-                registration=row.get('registration_required', 'false').lower() == 'true',
+                registration=parse_flag(row.get('registration_required')),
                 cost=row.get('fee'),
                 status=row.get('status', 'approved')
             )
@@ -1,13 +1,23 @@
+import argparse
 import csv
 import os
-import psycopg2
+import sys
 from datetime import datetime, timedelta, date
+from pathlib import Path
 
-DB_HOST = os.environ.get('PGHOST', 'localhost')
-DB_PORT = os.environ.get('PGPORT', '54322')
-DB_NAME = os.environ.get('PGDATABASE', 'postgres')
-DB_USER = os.environ.get('PGUSER', 'postgres')
-DB_PASS = os.environ.get('PGPASSWORD', 'postgres')
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.lib.db import get_cursor, insert_values
+from content_hash_sync import (
+    clear_hashes,
+    delete_stale,
+    ensure_hash_table,
+    make_keys,
+    upsert_changed,
+)
+from reference_resolver import ReferenceResolver
 
 BASE_DIR = os.path.join(os.path.dirname(__file__), '../seed_data')
 
@@ -26,49 +36,46 @@ NULLABLE_COLUMNS = {
     'announcements': ['link', 'email', 'organization_id', 'author', 'expires_at'],
 }
 
+# Natural keys used to recognise a row across reloads when the CSV has no id column
+KEY_COLUMNS = {
+    'locations': ['name'],
+    'organizations': ['name'],
+    'tags': ['name'],
+    'announcements': ['title'],
+    'events': ['title', 'start_date', 'start_time', 'location'],
+}
+
+
 def clean_value(value, column_name, table_name):
     """Convert empty strings to None for nullable columns"""
     if value == '' and column_name in NULLABLE_COLUMNS.get(table_name, []):
         return None
     return value
 
-conn = psycopg2.connect(
-    host=DB_HOST,
-    port=DB_PORT,
-    dbname=DB_NAME,
-    user=DB_USER,
-    password=DB_PASS
-)
-cur = conn.cursor()
-
-# Clear events table first (has foreign keys)
-cur.execute('DELETE FROM events;')
-
-for table, csv_file in TABLES:
-    csv_path = os.path.join(BASE_DIR, csv_file)
-    with open(csv_path, newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    # Clear table
-    cur.execute(f'DELETE FROM {table};')
-    # Insert rows
-    if rows:
-        columns = rows[0].keys()
-        col_str = ','.join(columns)
-        val_str = ','.join(['%s'] * len(columns))
-        for row in rows:
-            # Clean values for nullable columns
-            cleaned_values = [clean_value(row[col], col, table) for col in columns]
-            cur.execute(
-                f'INSERT INTO {table} ({col_str}) VALUES ({val_str})',
-                cleaned_values
-            )
-    print(f'Seeded {len(rows)} rows into {table}')
-
-# Add 3 recent announcements for dev/testing
-if table == 'announcements':
-    now = datetime.utcnow()
-    recent_announcements = [
+
+def read_csv_rows(csv_file):
+    """Read a seed CSV into a list of dicts with sanitized string values."""
+    # Deferred: validation imports the pydantic models
+    from validation import sanitize_records
+
+    with open(os.path.join(BASE_DIR, csv_file), newline='', encoding='utf-8') as f:
+        return sanitize_records(list(csv.DictReader(f)))
+
+
+def keyed(table, source_rows, rows):
+    """Pair each row with its reload key (CSV id if present, otherwise natural key)."""
+    key_columns = ['id'] if source_rows and 'id' in source_rows[0] else KEY_COLUMNS[table]
+    return list(zip(make_keys(source_rows, key_columns), rows))
+
+
+def build_table_rows(table, csv_rows):
+    """Clean CSV rows for a reference table into insertable dicts."""
+    return [{col: clean_value(value, col, table) for col, value in row.items()} for row in csv_rows]
+
+
+def build_recent_announcements(now):
+    """3 recent announcements for dev/testing (not hash-tracked: their dates follow `now`)."""
+    return [
         {
             'title': 'Pop-Up Ice Cream Social',
             'message': 'Free ice cream in the park today! Come meet your neighbors and enjoy a treat.',
@@ -97,19 +104,16 @@ if table == 'announcements':
             'created_at': (now - timedelta(days=2)).strftime('%Y-%m-%d %H:%M:%S+00'),
         },
     ]
-    for ann in recent_announcements:
-        cur.execute(
-            'INSERT INTO announcements (title, message, status, link, show_at, expires_at, created_at) VALUES (%s, %s, %s, %s, %s, %s, %s)',
-            [ann['title'], ann['message'], ann['status'], ann['link'], ann['show_at'], ann['expires_at'], ann['created_at']]
-        )
-    print('Seeded 3 recent announcements for dev/testing')
-
-# --- Seed events table from events_local.csv ---
-events_csv_path = os.path.join(BASE_DIR, 'events_local.csv')
-if os.path.exists(events_csv_path):
-    with open(events_csv_path, newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        events = list(reader)
+
+
+def build_event_rows(cur, events, stale_ids=None):
+    """
+    Resolve FKs and shift dates for events_local.csv rows; returns (source rows, event rows).
+
+    Source rows are the CSV rows plus their resolved FK ids. They are what the
+    reload hash covers, since the shifted dates change with today's date and
+    with the earliest start_date in the CSV.
+    """
     # Find the earliest start_date
     date_format = '%Y-%m-%d'
     today = date.today()
@@ -119,55 +123,115 @@ if os.path.exists(events_csv_path):
         days_shift = (today + timedelta(days=1) - min_date).days
     else:
         days_shift = 0
-    # Clear events table
-    cur.execute('DELETE FROM events;')
-    seeded = 0
+    # Load reference tables once and resolve FK names in memory
+    resolver = ReferenceResolver(cur, ['locations', 'organizations', 'tags'])
+    for table, ids in (stale_ids or {}).items():
+        resolver.discard_ids(table, ids)
+    sources = []
+    rows = []
     for event in events:
-        # Look up foreign key IDs with trimmed values
-        location_name = event['location'].strip() if event['location'] else None
-        organization_name = event['organization'].strip() if event['organization'] else None
-        primary_tag_name = event['primary_tag'].strip() if event['primary_tag'] else None
-        
-        cur.execute('SELECT id FROM locations WHERE name = %s', (location_name,))
-        location_id = cur.fetchone()
-        cur.execute('SELECT id FROM organizations WHERE name = %s', (organization_name,))
-        organization_id = cur.fetchone()
-        cur.execute('SELECT id FROM tags WHERE name = %s', (primary_tag_name,))
-        primary_tag_id = cur.fetchone()
-        
+        location_id = resolver.resolve('locations', event['location'])
+        organization_id = resolver.resolve('organizations', event['organization'])
+        primary_tag_id = resolver.resolve('tags', event['primary_tag'])
+
         # Only insert if all FKs are found
         if not (location_id and organization_id and primary_tag_id):
-            print(f"Skipping event '{event['title']}' due to missing FK(s):")
-            print(f"  location='{location_name}' -> found: {location_id}")
-            print(f"  organization='{organization_name}' -> found: {organization_id}")
-            print(f"  primary_tag='{primary_tag_name}' -> found: {primary_tag_id}")
             continue
         # Shift start_date and end_date
         start_date = datetime.strptime(event['start_date'], date_format).date() + timedelta(days=days_shift) if event['start_date'] else None
         end_date = datetime.strptime(event['end_date'], date_format).date() + timedelta(days=days_shift) if event['end_date'] else None
-        # Prepare insert values, mapping CSV fields to DB columns
-        cur.execute(
-            '''INSERT INTO events (title, description, start_date, start_time, end_time, end_date, external_image_url, registration_link, website, status, location_id, organization_id, primary_tag_id)
-               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)''',
-            [
-                event['title'],
-                event['description'],
-                start_date,
-                event['start_time'] or None,
-                event['end_time'] or None,
-                end_date,
-                event['external_image_url'] or None,
-                event['registration_link'] or None,
-                event['website'] or None,
-                event['status'] or 'approved',
-                location_id[0],
-                organization_id[0],
-                primary_tag_id[0],
-            ]
-        )
-        seeded += 1
-    print(f'Seeded {seeded} rows into events')
-
-conn.commit()
-cur.close()
-conn.close() 
\ No newline at end of file
+        # Map CSV fields to DB columns
+        sources.append({**event, 'location_id': location_id, 'organization_id': organization_id,
+                        'primary_tag_id': primary_tag_id})
+        rows.append({
+            'title': event['title'],
+            'description': event['description'],
+            'start_date': start_date,
+            'start_time': event['start_time'] or None,
+            'end_time': event['end_time'] or None,
+            'end_date': end_date,
+            'external_image_url': event['external_image_url'] or None,
+            'registration_link': event['registration_link'] or None,
+            'website': event['website'] or None,
+            'status': event['status'] or 'approved',
+            'location_id': location_id,
+            'organization_id': organization_id,
+            'primary_tag_id': primary_tag_id,
+        })
+    skipped = len(events) - len(rows)
+    if skipped:
+        print(f'Skipped {skipped} events due to missing FK(s)')
+        resolver.report_unmatched()
+    return sources, rows
+
+
+def add_recent_announcements(cur, now):
+    """Insert the generated recent announcements whose titles are not present yet."""
+    recent = build_recent_announcements(now)
+    cur.execute('SELECT title FROM announcements WHERE title = ANY(%s)', ([row['title'] for row in recent],))
+    existing = {title for (title,) in cur.fetchall()}
+    missing = [row for row in recent if row['title'] not in existing]
+    if missing:
+        columns = list(missing[0])
+        insert_values(cur, 'announcements', columns, [[row[col] for col in columns] for row in missing])
+    return len(missing)
+
+
+def seed(cur, reload=False):
+    """
+    Seed reference tables, announcements and events from seed_data.
+
+    A full seed clears every table and reinserts it. With reload=True only rows
+    whose content hash changed are upserted and only removed rows are deleted.
+    """
+    ensure_hash_table(cur)
+    results = []
+    if not reload:
+        # Clear events table first (has foreign keys)
+        cur.execute('DELETE FROM events;')
+        clear_hashes(cur, 'events')
+
+    for table, csv_file in TABLES:
+        csv_rows = read_csv_rows(csv_file)
+        rows = build_table_rows(table, csv_rows)
+        if not reload:
+            cur.execute(f'DELETE FROM {table};')
+            clear_hashes(cur, table)
+        result = upsert_changed(cur, table, keyed(table, csv_rows, rows), hash_sources=csv_rows)
+        results.append(result)
+        print(f'Seeded {len(rows)} rows into {table}')
+
+    # --- Seed events table from events_local.csv ---
+    if os.path.exists(os.path.join(BASE_DIR, 'events_local.csv')):
+        events = read_csv_rows('events_local.csv')
+        # Rows removed from the reference CSVs are deleted last, so don't link events to them
+        stale_ids = {result.table: result.stale_ids for result in results}
+        sources, rows = build_event_rows(cur, events, stale_ids)
+        result = upsert_changed(cur, 'events', keyed('events', sources, rows), hash_sources=sources)
+        results.append(result)
+        print(f'Seeded {len(rows)} rows into events')
+
+    # Delete removed rows children-first so FK references stay valid
+    for result in reversed(results):
+        delete_stale(cur, result)
+
+    added = add_recent_announcements(cur, datetime.utcnow())
+    if added:
+        print(f'Added {added} recent announcements')
+    if reload:
+        for result in results:
+            print(result.summary())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed the local database from seed_data CSVs')
+    parser.add_argument('--reload', action='store_true',
+                        help='Only upsert changed rows and delete removed ones (keeps existing ids)')
+    args = parser.parse_args()
+
+    with get_cursor() as cur:
+        seed(cur, reload=args.reload)
+
+
+if __name__ == '__main__':
+    main()
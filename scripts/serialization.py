@@ -0,0 +1,129 @@
+"""
+Bulk JSON / NDJSON serialization for models and raw database rows.
+
+Uses orjson when it is installed (native date, time, datetime, UUID and
+enum encoding in Rust) and falls back to the standard library json module
+with an equivalent `default` hook otherwise. Output is always bytes and is
+written straight to a binary file or buffer.
+
+Pydantic models are dumped to Python values first, so HttpUrl and other
+pydantic types are encoded as strings.
+"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import IO, Any, Iterable, Iterator, List
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode values neither encoder handles natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    # HttpUrl and other pydantic / custom scalar types
+    return str(value)
+
+
+def _prepare(item: Any) -> Any:
+    return item.model_dump() if isinstance(item, BaseModel) else item
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_cls: type) -> TypeAdapter:
+    return TypeAdapter(List[model_cls])
+
+
+def _prepare_many(items: Iterable[Any]) -> List[Any]:
+    """Dump a list of models in one pydantic-core call when they share a class."""
+    items = list(items)
+    if items and isinstance(items[0], BaseModel):
+        model_cls = type(items[0])
+        if all(type(item) is model_cls for item in items):
+            return _list_adapter(model_cls).dump_python(items)
+    return [_prepare(item) for item in items]
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode one object (model, row dict, list, ...) to JSON bytes."""
+    obj = _prepare(obj)
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, default=_default, indent=2 if indent else None,
+                      separators=None if indent else (',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """Decode JSON bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump(obj: Any, fp: IO[bytes], indent: bool = False) -> None:
+    """Write one object as JSON to a binary file or buffer."""
+    fp.write(dumps(obj, indent=indent))
+
+
+def load(fp: IO) -> Any:
+    """Read one JSON document from a file or buffer."""
+    return loads(fp.read())
+
+
+def write_ndjson(items: Iterable[Any], fp: IO[bytes]) -> int:
+    """Write models or rows as newline-delimited JSON; returns the number of lines."""
+    count = 0
+    for item in items:
+        fp.write(dumps(item))
+        fp.write(b'\n')
+        count += 1
+    return count
+
+
+def read_ndjson(fp: IO) -> Iterator[Any]:
+    """Yield one decoded object per non-empty line."""
+    for line in fp:
+        if line.strip():
+            yield loads(line)
+
+
+def write_json_array(items: Iterable[Any], fp: IO[bytes]) -> int:
+    """Stream models or rows as a single JSON array, one item at a time."""
+    count = 0
+    fp.write(b'[')
+    for item in items:
+        if count:
+            fp.write(b',')
+        fp.write(dumps(item))
+        count += 1
+    fp.write(b']')
+    return count
+
+
+def to_json_array(items: Iterable[Any]) -> bytes:
+    """Encode models or rows as one JSON array in a single encoder call."""
+    return dumps(_prepare_many(items))
+
+
+def to_ndjson(items: Iterable[Any]) -> bytes:
+    """Encode models or rows as NDJSON bytes."""
+    lines: List[bytes] = [dumps(item) for item in items]
+    return b'\n'.join(lines) + (b'\n' if lines else b'')
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Statistical tag suggestions for untagged events.
+
+Keyword rules (keyword_tagger.py) only tag events that mention one of a few
+dozen words. This trains a classifier on the events admins have already
+tagged and writes ranked suggestions for approved untagged events to
+event_tag_suggestions (suggestions of events that have since been tagged or
+are no longer approved are removed on each run):
+
+- features are TF-IDF over search_index's tokens (title tokens count
+  double), with sublinear tf and L2-normalized rows, held as CSR arrays
+- the model is multinomial logistic regression (softmax, L2-regularized)
+  trained with full-batch Nesterov gradient descent in NumPy; the primary
+  tag is the target, shared 2:1 with the secondary tag when one is set
+- all untagged events are scored with one sparse-dense product per chunk
+- the trained model is cached in .cache/tag_classifier.npz together with a
+  fingerprint of the labelled events; while labels are unchanged, repeat
+  runs load it instead of retraining
+
+Usage:
+    python scripts/tag_classifier.py                       # train if needed, write suggestions
+    python scripts/tag_classifier.py --dry-run --show 20
+    python scripts/tag_classifier.py --evaluate            # hold-out accuracy, writes nothing
+"""
+
+import argparse
+import hashlib
+import math
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from search_index import term_frequencies
+
+project_root = Path(__file__).parent.parent
+
+DEFAULT_MODEL_PATH = project_root / '.cache' / 'tag_classifier.npz'
+# Bump when features or training change so cached models are retrained
+MODEL_VERSION = 1
+
+MIN_DF = 2
+MAX_FEATURES = 30000
+L2 = 1e-4
+ITERATIONS = 200
+LEARNING_RATE = 1.0
+SECONDARY_WEIGHT = 1 / 3
+SCORE_CHUNK = 5000
+
+
+class SparseRows(NamedTuple):
+    """CSR matrix: row i has values data[indptr[i]:indptr[i + 1]] in columns indices[...]."""
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    columns: int
+
+    @property
+    def rows(self) -> int:
+        return len(self.indptr) - 1
+
+    def row_ids(self) -> np.ndarray:
+        """Row number of every stored value."""
+        return np.repeat(np.arange(self.rows), np.diff(self.indptr))
+
+    def transpose(self) -> 'SparseRows':
+        """The same matrix with rows and columns swapped (CSR of the transpose)."""
+        order = np.argsort(self.indices, kind='stable')
+        counts = np.bincount(self.indices, minlength=self.columns)
+        indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return SparseRows(indptr, self.row_ids()[order].astype(np.int32), self.data[order], self.rows)
+
+    def dot(self, dense: np.ndarray) -> np.ndarray:
+        """self @ dense for a (columns, k) array."""
+        out = np.zeros((self.rows, dense.shape[1]), dtype=dense.dtype)
+        if len(self.data):
+            products = np.take(dense, self.indices, axis=0)
+            products *= self.data[:, None]
+            nonempty = np.flatnonzero(np.diff(self.indptr))
+            out[nonempty] = np.add.reduceat(products, self.indptr[nonempty], axis=0)
+        return out
+
+
+def fit_vocabulary(documents: Sequence[Dict[str, int]], min_df: int = MIN_DF,
+                   max_features: int = MAX_FEATURES) -> Tuple[List[str], np.ndarray]:
+    """Terms in at least `min_df` documents (the `max_features` most common) and their smoothed idf."""
+    df: Dict[str, int] = {}
+    for terms in documents:
+        for term in terms:
+            df[term] = df.get(term, 0) + 1
+    kept = sorted((term for term, count in df.items() if count >= min_df), key=lambda term: (-df[term], term))
+    vocabulary = sorted(kept[:max_features])
+    n = len(documents)
+    idf = np.array([math.log((1 + n) / (1 + df[term])) + 1 for term in vocabulary], dtype=np.float32)
+    return vocabulary, idf
+
+
+def vectorize(documents: Iterable[Dict[str, int]], columns: Dict[str, int], idf: np.ndarray) -> SparseRows:
+    """TF-IDF rows (1 + log tf, L2-normalized); unknown terms are ignored."""
+    indptr = [0]
+    indices: List[int] = []
+    data: List[float] = []
+    for terms in documents:
+        row = sorted((columns[term], 1.0 + math.log(count)) for term, count in terms.items() if term in columns)
+        indices.extend(column for column, _ in row)
+        data.extend(value for _, value in row)
+        indptr.append(len(indices))
+    indptr_array = np.array(indptr, dtype=np.int64)
+    indices_array = np.array(indices, dtype=np.int32)
+    data_array = np.array(data, dtype=np.float32)
+    if len(data_array):
+        data_array *= idf[indices_array]
+        row_ids = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr_array))
+        norms = np.sqrt(np.bincount(row_ids, weights=data_array ** 2))
+        data_array /= norms[row_ids].astype(np.float32)
+    return SparseRows(indptr_array, indices_array, data_array, len(idf))
+
+
+def softmax(scores: np.ndarray) -> np.ndarray:
+    scores = scores - scores.max(axis=1, keepdims=True)
+    np.exp(scores, out=scores)
+    scores /= scores.sum(axis=1, keepdims=True)
+    return scores
+
+
+class TagClassifier:
+    """TF-IDF features and a softmax linear model over tag ids."""
+
+    def __init__(self, vocabulary: List[str], idf: np.ndarray, weights: np.ndarray,
+                 bias: np.ndarray, tag_ids: List[str], fingerprint: str = ''):
+        self.vocabulary = vocabulary
+        self.columns = {term: column for column, term in enumerate(vocabulary)}
+        self.idf = idf
+        self.weights = weights
+        self.bias = bias
+        self.tag_ids = tag_ids
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def fit(cls, documents: Sequence[Dict[str, int]], targets: np.ndarray, tag_ids: List[str],
+            fingerprint: str = '', iterations: int = ITERATIONS, l2: float = L2,
+            learning_rate: float = LEARNING_RATE) -> 'TagClassifier':
+        """
+        Train on term counts and an (n, tags) matrix of target distributions.
+
+        Rows are L2-normalized, so with the bias the mean cross-entropy has a
+        gradient Lipschitz constant of about 1 and a fixed step of 1 is stable.
+        """
+        vocabulary, idf = fit_vocabulary(documents)
+        columns = {term: column for column, term in enumerate(vocabulary)}
+        features = vectorize(documents, columns, idf)
+        transposed = features.transpose()
+        n, k = targets.shape
+        targets = targets.astype(np.float32)
+
+        weights = np.zeros((len(vocabulary), k), dtype=np.float32)
+        bias = np.log(targets.mean(axis=0) + 1e-6).astype(np.float32)
+        velocity_w = np.zeros_like(weights)
+        velocity_b = np.zeros_like(bias)
+        for step in range(iterations):
+            momentum = step / (step + 3)
+            look_w = weights + momentum * velocity_w
+            look_b = bias + momentum * velocity_b
+            errors = softmax(features.dot(look_w) + look_b) - targets
+            errors /= n
+            grad_w = transposed.dot(errors) + l2 * look_w
+            grad_b = errors.sum(axis=0)
+            velocity_w = momentum * velocity_w - learning_rate * grad_w
+            velocity_b = momentum * velocity_b - learning_rate * grad_b
+            weights += velocity_w
+            bias += velocity_b
+        return cls(vocabulary, idf, weights, bias, list(tag_ids), fingerprint)
+
+    def predict_proba(self, documents: Sequence[Dict[str, int]]) -> np.ndarray:
+        """(n, tags) probabilities, scored SCORE_CHUNK documents at a time."""
+        out = np.empty((len(documents), len(self.tag_ids)), dtype=np.float32)
+        for start in range(0, len(documents), SCORE_CHUNK):
+            features = vectorize(documents[start:start + SCORE_CHUNK], self.columns, self.idf)
+            out[start:start + features.rows] = softmax(features.dot(self.weights) + self.bias)
+        return out
+
+    def suggest(self, documents: Sequence[Dict[str, int]], top_k: int = 2,
+                min_confidence: float = 0.0) -> List[List[Tuple[str, float]]]:
+        """
+        Up to `top_k` (tag_id, confidence) pairs per document, best first.
+
+        Documents with no term in the vocabulary get no suggestions: their
+        scores would be the bias alone, i.e. the tag frequencies.
+        """
+        probabilities = self.predict_proba(documents)
+        top_k = min(top_k, probabilities.shape[1])
+        best = np.argsort(-probabilities, axis=1)[:, :top_k]
+        columns = self.columns
+        return [
+            [(self.tag_ids[column], float(row[column])) for column in ranked if row[column] >= min_confidence]
+            if any(term in columns for term in terms) else []
+            for terms, row, ranked in zip(documents, probabilities, best)
+        ]
+
+    def save(self, path: Path = DEFAULT_MODEL_PATH) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f, vocabulary=np.array(self.vocabulary, dtype=str), idf=self.idf,
+                weights=self.weights, bias=self.bias, tag_ids=np.array(self.tag_ids, dtype=str),
+                fingerprint=np.array(self.fingerprint), version=np.array(MODEL_VERSION),
+            )
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_MODEL_PATH) -> Optional['TagClassifier']:
+        """The cached model, or None if it is missing or from another MODEL_VERSION."""
+        try:
+            with np.load(path) as saved:
+                if int(saved['version']) != MODEL_VERSION:
+                    return None
+                return cls(saved['vocabulary'].tolist(), saved['idf'], saved['weights'], saved['bias'],
+                           saved['tag_ids'].tolist(), str(saved['fingerprint']))
+        except (OSError, KeyError, ValueError):
+            return None
+
+
+def target_matrix(labels: Sequence[Tuple[str, Optional[str]]], tag_ids: List[str]) -> np.ndarray:
+    """Target distributions from (primary, secondary) tag pairs."""
+    columns = {tag_id: column for column, tag_id in enumerate(tag_ids)}
+    targets = np.zeros((len(labels), len(tag_ids)), dtype=np.float32)
+    for row, (primary, secondary) in enumerate(labels):
+        if secondary and secondary != primary and secondary in columns:
+            targets[row, columns[primary]] = 1 - SECONDARY_WEIGHT
+            targets[row, columns[secondary]] = SECONDARY_WEIGHT
+        else:
+            targets[row, columns[primary]] = 1.0
+    return targets
+
+
+# -- database ---------------------------------------------------------------
+
+LABELLED_WHERE = 'e.primary_tag_id IS NOT NULL AND e.primary_tag_id IN (SELECT id FROM tags)'
+# Events that get suggestions; same selection as assign_tags_to_events
+UNTAGGED_WHERE = "primary_tag_id IS NULL AND status = 'approved'"
+
+
+def training_fingerprint(cur) -> str:
+    """Hash of every labelled event's id, tags and updated_at, computed in the database."""
+    cur.execute(
+        f"""
+        SELECT count(*), md5(coalesce(string_agg(
+            e.id::text || ':' || e.primary_tag_id::text || ':' || coalesce(e.secondary_tag_id::text, '')
+            || ':' || coalesce(e.updated_at::text, ''), ',' ORDER BY e.id), ''))
+        FROM events e WHERE {LABELLED_WHERE}
+        """
+    )
+    count, digest = cur.fetchone()
+    return hashlib.sha256(f'{MODEL_VERSION}:{count}:{digest}'.encode()).hexdigest()
+
+
+def load_labelled(conn) -> Tuple[List[str], List[Dict[str, int]], List[Tuple[str, Optional[str]]]]:
+    from src.lib.db import stream_rows
+
+    ids, documents, labels = [], [], []
+    query = (f'SELECT e.id::text, e.title, e.description, e.primary_tag_id::text, e.secondary_tag_id::text '
+             f'FROM events e WHERE {LABELLED_WHERE} ORDER BY e.id')
+    for event_id, title, description, primary, secondary in stream_rows(conn, query):
+        ids.append(event_id)
+        documents.append(term_frequencies(title, description))
+        labels.append((primary, secondary))
+    return ids, documents, labels
+
+
+def load_untagged(conn, limit: Optional[int] = None) -> Tuple[List[str], List[Dict[str, int]]]:
+    from src.lib.db import stream_rows
+
+    query = f'SELECT id::text, title, description FROM events WHERE {UNTAGGED_WHERE} ORDER BY id'
+    if limit:
+        query += f' LIMIT {int(limit)}'
+    ids, documents = [], []
+    for event_id, title, description in stream_rows(conn, query):
+        ids.append(event_id)
+        documents.append(term_frequencies(title, description))
+    return ids, documents
+
+
+def train(conn, fingerprint: str) -> TagClassifier:
+    _, documents, labels = load_labelled(conn)
+    tag_ids = sorted({tag for pair in labels for tag in pair if tag})
+    return TagClassifier.fit(documents, target_matrix(labels, tag_ids), tag_ids, fingerprint)
+
+
+def get_model(conn, path: Path = DEFAULT_MODEL_PATH, retrain: bool = False) -> Tuple[TagClassifier, bool]:
+    """The cached model if its fingerprint still matches, else a freshly trained (and cached) one."""
+    with conn.cursor() as cur:
+        fingerprint = training_fingerprint(cur)
+    if not retrain:
+        model = TagClassifier.load(path)
+        if model is not None and model.fingerprint == fingerprint:
+            return model, False
+    model = train(conn, fingerprint)
+    model.save(path)
+    return model, True
+
+
+def prune_suggestions(cur) -> int:
+    """Delete the suggestions of events that have been tagged or are no longer approved."""
+    cur.execute(f'DELETE FROM event_tag_suggestions WHERE event_id NOT IN '
+                f'(SELECT id FROM events WHERE {UNTAGGED_WHERE})')
+    return cur.rowcount
+
+
+def save_suggestions(cur, event_ids: Sequence[str], suggestions: Sequence[List[Tuple[str, float]]],
+                     model_version: str) -> int:
+    """Replace the suggestions of the scored events with multi-row upserts."""
+    from src.lib.db import insert_values
+
+    cur.execute('DELETE FROM event_tag_suggestions WHERE event_id = ANY(%s::uuid[])', (list(event_ids),))
+    rows = [
+        (event_id, tag_id, rank, confidence, model_version)
+        for event_id, ranked in zip(event_ids, suggestions)
+        for rank, (tag_id, confidence) in enumerate(ranked, start=1)
+    ]
+    insert_values(
+        cur, 'event_tag_suggestions', ['event_id', 'tag_id', 'rank', 'confidence', 'model_version'], rows,
+        on_conflict=(
+            'ON CONFLICT (event_id, tag_id) DO UPDATE SET rank = EXCLUDED.rank, '
+            'confidence = EXCLUDED.confidence, model_version = EXCLUDED.model_version, created_at = now()'
+        ),
+    )
+    return len(rows)
+
+
+def evaluate(conn, holdout: float = 0.2) -> Dict[str, float]:
+    """
+    Train on most labelled events and report top-1/top-2 accuracy on the rest (split by id hash).
+
+    A hit is the event's primary tag ranked first (top-1) or in the first two (top-2).
+    """
+    ids, documents, labels = load_labelled(conn)
+    tag_ids = sorted({tag for pair in labels for tag in pair if tag})
+    test = np.array([zlib.crc32(event_id.encode()) % 1000 < holdout * 1000 for event_id in ids], dtype=bool)
+    train_rows, test_rows = np.flatnonzero(~test), np.flatnonzero(test)
+    if not len(train_rows) or not len(test_rows):
+        return {'train': len(train_rows), 'test': len(test_rows)}
+
+    started = time.perf_counter()
+    model = TagClassifier.fit([documents[i] for i in train_rows],
+                              target_matrix([labels[i] for i in train_rows], tag_ids), tag_ids)
+    trained = time.perf_counter() - started
+    ranked = model.suggest([documents[i] for i in test_rows], top_k=2)
+    top1 = sum(bool(r) and r[0][0] == labels[i][0] for r, i in zip(ranked, test_rows))
+    top2 = sum(any(tag == labels[i][0] for tag, _ in r) for r, i in zip(ranked, test_rows))
+    return {'train': len(train_rows), 'test': len(test_rows), 'features': len(model.vocabulary),
+            'train_seconds': round(trained, 2), 'top1_accuracy': round(top1 / len(test_rows), 3),
+            'top2_accuracy': round(top2 / len(test_rows), 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Suggest tags for untagged events from already-tagged ones')
+    parser.add_argument('--top-k', type=int, default=2, help='Suggestions per event')
+    parser.add_argument('--min-confidence', type=float, default=0.2, help='Drop suggestions below this probability')
+    parser.add_argument('--limit', type=int, help='Score at most this many untagged events')
+    parser.add_argument('--retrain', action='store_true', help='Ignore the cached model')
+    parser.add_argument('--model-path', type=Path, default=DEFAULT_MODEL_PATH, help='Model cache file')
+    parser.add_argument('--dry-run', action='store_true', help='Do not write event_tag_suggestions')
+    parser.add_argument('--show', type=int, default=0, help='Print this many suggestions')
+    parser.add_argument('--evaluate', action='store_true', help='Report hold-out accuracy and exit')
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(project_root))
+    from src.lib.db import get_connection
+
+    with get_connection() as conn:
+        if args.evaluate:
+            for key, value in evaluate(conn).items():
+                print(f'  {key}: {value}')
+            return
+
+        started = time.perf_counter()
+        model, trained = get_model(conn, args.model_path, args.retrain)
+        if not model.tag_ids:
+            print('No tagged events to learn from')
+            return
+        print(f"{'Trained' if trained else 'Loaded cached'} model: {len(model.tag_ids)} tags, "
+              f"{len(model.vocabulary)} features ({time.perf_counter() - started:.2f}s)")
+
+        started = time.perf_counter()
+        event_ids, documents = load_untagged(conn, args.limit)
+        suggestions = model.suggest(documents, args.top_k, args.min_confidence)
+        print(f'Scored {len(event_ids)} untagged events in {time.perf_counter() - started:.2f}s')
+
+        if args.show:
+            with conn.cursor() as cur:
+                cur.execute('SELECT id::text, name FROM tags')
+                names = dict(cur.fetchall())
+            for event_id, ranked in list(zip(event_ids, suggestions))[:args.show]:
+                print(f"  {event_id}  " + ', '.join(f'{names.get(tag, tag)} {confidence:.2f}'
+                                                     for tag, confidence in ranked))
+
+        if args.dry_run:
+            conn.rollback()
+            return
+        with conn.cursor() as cur:
+            pruned = prune_suggestions(cur)
+            saved = save_suggestions(cur, event_ids, suggestions, model.fingerprint[:12])
+        print(f'Removed {pruned} suggestions of tagged or unapproved events')
+        print(f'Saved {saved} suggestions to event_tag_suggestions')
+
+
+if __name__ == '__main__':
+    main()
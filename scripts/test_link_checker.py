@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+LinkChecker against a local aiohttp stub server.
+
+Covers the HEAD 405 -> GET fallback, a redirect, a 404, a real timeout, and
+many URLs on one slow host: with more queued requests per host than fit in
+one timeout, none of them may be reported as a timeout, and the host never
+sees more than `per_host` concurrent requests.
+
+Usage:
+    python scripts/test_link_checker.py
+"""
+
+import asyncio
+import sys
+from typing import Awaitable, Callable
+
+from aiohttp import web
+
+from link_checker import LinkChecker
+
+SLOW_SECONDS = 0.2
+
+failures = 0
+
+
+async def check(label: str, fn: Callable[[], Awaitable[None]]) -> None:
+    global failures
+    try:
+        await fn()
+        print(f'✅ PASS: {label}')
+    except AssertionError as e:
+        print(f'❌ FAIL: {label}\n        {e}')
+        failures += 1
+
+
+def make_app(stats: dict) -> web.Application:
+    async def ok(request):
+        return web.Response(text='ok')
+
+    async def no_head(request):
+        if request.method == 'HEAD':
+            return web.Response(status=405)
+        return web.Response(text='ok')
+
+    async def redirect(request):
+        raise web.HTTPFound('/ok')
+
+    async def slow(request):
+        stats['in_flight'] += 1
+        stats['max_in_flight'] = max(stats['max_in_flight'], stats['in_flight'])
+        try:
+            await asyncio.sleep(SLOW_SECONDS)
+        finally:
+            stats['in_flight'] -= 1
+        return web.Response(text='ok')
+
+    async def hang(request):
+        await asyncio.sleep(1.5)
+        return web.Response(text='late')
+
+    app = web.Application()
+    app.router.add_route('*', '/ok', ok)
+    app.router.add_route('*', '/no-head', no_head)
+    app.router.add_route('*', '/redirect', redirect)
+    app.router.add_route('*', '/slow/{n}', slow)
+    app.router.add_route('*', '/hang', hang)
+    # Anything else falls through to aiohttp's 404
+    return app
+
+
+async def run() -> None:
+    stats = {'in_flight': 0, 'max_in_flight': 0}
+    runner = web.AppRunner(make_app(stats))
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    base = f'http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}'
+
+    try:
+        async def head_fallback():
+            [result] = await LinkChecker(timeout=2).check_many([f'{base}/no-head'])
+            assert result.ok, result
+            assert (result.method, result.status_code) == ('GET', 200), result
+
+        async def follows_redirect():
+            [result] = await LinkChecker(timeout=2).check_many([f'{base}/redirect'])
+            assert result.ok and result.status_code == 200, result
+            assert result.final_url == f'{base}/ok', result
+
+        async def not_found():
+            [result] = await LinkChecker(timeout=2).check_many([f'{base}/missing'])
+            assert not result.ok, result
+            assert result.status_code == 404 and result.error is None, result
+
+        async def times_out():
+            [result] = await LinkChecker(timeout=0.5).check_many([f'{base}/hang'])
+            assert not result.ok and result.error == 'timeout', result
+
+        async def busy_host():
+            per_host, count, timeout = 4, 40, 1.0
+            # Serialized over per_host connections this takes twice the timeout
+            assert count / per_host * SLOW_SECONDS >= 2 * timeout
+            stats['max_in_flight'] = 0
+            results = await LinkChecker(per_host=per_host, timeout=timeout).check_many(
+                [f'{base}/slow/{n}' for n in range(count)])
+            failed = [(r.url, r.error or r.status_code) for r in results if not r.ok]
+            assert not failed, f'{len(failed)} of {count} failed, e.g. {failed[:3]}'
+            assert stats['max_in_flight'] <= per_host, \
+                f"{stats['max_in_flight']} concurrent requests to one host (limit {per_host})"
+            assert max(r.elapsed_ms for r in results) < timeout * 1000, \
+                'elapsed_ms includes time spent waiting for a host slot'
+
+        await check('HEAD 405 is retried with GET', head_fallback)
+        await check('redirects are followed to the final URL', follows_redirect)
+        await check('404 is reported as broken without an error', not_found)
+        await check('a hanging request times out', times_out)
+        await check('queued requests on a busy host do not time out', busy_host)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    print('🧪 Link checker\n')
+    asyncio.run(run())
+    print('\n✅ Link checker OK' if failures == 0 else f'\n❌ {failures} check(s) failed')
+    sys.exit(0 if failures == 0 else 1)
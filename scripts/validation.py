@@ -5,18 +5,39 @@ This module provides validation functions for data before database operations,
 ensuring data integrity and consistency across the application.
 """
 
+import multiprocessing
+import os
 import re
+import time as _time
 import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field as dataclass_field
 from datetime import date, time, datetime
-from typing import Optional, List, Dict, Any, Union, Tuple
+from functools import lru_cache
+from typing import Optional, Iterable, List, Dict, Any, NamedTuple, Union, Tuple
 from urllib.parse import urlparse
-import phonenumbers
 from pydantic import ValidationError
 
 from models import (
     Event, EventStaged, Location, Organization, Tag, Announcement, SourceSite,
     EventStatus, AnnouncementStatus, ImportFrequency
 )
+from phone_normalizer import default_normalizer
+
+
+# Control characters removed by sanitize_string (everything below 0x20 except \t \n \r, and DEL)
+CONTROL_CHARS = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+CONTROL_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
+
+def _sanitize_text(value: str) -> str:
+    """Remove control characters and collapse whitespace runs to single spaces."""
+    # Most values have no control characters; skip the translate pass for them
+    if CONTROL_CHARS.search(value):
+        value = value.translate(CONTROL_TABLE)
+    # str.split() breaks on the same Unicode whitespace as \s and drops both ends
+    return ' '.join(value.split())
 
 
 class ValidationError(Exception):
@@ -50,16 +71,9 @@ class DataValidator:
         """Validate phone number format."""
         if not phone:
             return True  # Phone is optional
-        
-        try:
-            # Try to parse with phonenumbers library
-            parsed = phonenumbers.parse(phone, "US")
-            return phonenumbers.is_valid_number(parsed)
-        except:
-            # Fallback to simple regex validation
-            pattern = r'^[\+]?[1-9][\d]{0,15}$'
-            cleaned = re.sub(r'[\s\-\(\)]', '', phone)
-            return bool(re.match(pattern, cleaned))
+
+        # phonenumbers with a regex fallback for unparseable values; results are memoized
+        return default_normalizer().is_valid(phone)
     
     @staticmethod
     def validate_url(url: str) -> bool:
@@ -104,11 +118,19 @@ class DataValidator:
         """Sanitize string input."""
         if not value:
             return ""
-        # Remove control characters except newlines and tabs
-        sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', value)
-        # Normalize whitespace
-        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
-        return sanitized
+        return _sanitize_text(value)
+    
+    @staticmethod
+    def sanitize_column(values: Iterable[Optional[str]]) -> List[str]:
+        """Sanitize a whole text column; repeated values are cleaned once."""
+        cleaned: Dict[Optional[str], str] = {}
+        result = []
+        for value in values:
+            text = cleaned.get(value)
+            if text is None:
+                text = cleaned[value] = _sanitize_text(value) if value else ""
+            result.append(text)
+        return result
     
     @staticmethod
     def validate_event_data(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -419,6 +441,26 @@ def sanitize_input(data: Dict[str, Any]) -> Dict[str, Any]:
     return sanitized
 
 
+def sanitize_records(rows: List[Dict[str, Any]], columns: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Sanitize string values in many records at once, column by column.
+
+    Same result as sanitize_input on each row, but every column is cleaned
+    with DataValidator.sanitize_column so repeated values (addresses,
+    organization names, ...) are processed once. `columns` limits which keys
+    are cleaned; by default every key holding a string is.
+    """
+    sanitized = [dict(row) for row in rows]
+    if columns is None:
+        columns = {key for row in rows for key, value in row.items() if isinstance(value, str)}
+    for column in columns:
+        positions = [i for i, row in enumerate(rows) if isinstance(row.get(column), str)]
+        cleaned = DataValidator.sanitize_column(rows[i][column] for i in positions)
+        for i, value in zip(positions, cleaned):
+            sanitized[i][column] = value
+    return sanitized
+
+
 def validate_required_string(value: str, max_length: int) -> Tuple[bool, str]:
     """Validate required string field."""
     if not value or not value.strip():
@@ -515,17 +557,17 @@ def validate_event_data(data: Dict) -> Tuple[bool, List[str]]:
         errors.append(f"Description: {desc_error}")
     
     # Email validation
-    if not validate_email(data.get('email', '')):
+    if not DataValidator.validate_email(data.get('email', '')):
         errors.append("Email: Invalid email format")
     
     # URL validations
-    if not validate_url(data.get('website', '')):
+    if not DataValidator.validate_url(data.get('website', '')):
         errors.append("Website: Invalid URL format")
     
-    if not validate_url(data.get('registration_link', '')):
+    if not DataValidator.validate_url(data.get('registration_link', '')):
         errors.append("Registration link: Invalid URL format")
     
-    if not validate_url(data.get('external_image_url', '')):
+    if not DataValidator.validate_url(data.get('external_image_url', '')):
         errors.append("External image URL: Invalid URL format")
     
     # Cost validation
@@ -569,7 +611,7 @@ def validate_location_data(data: Dict) -> Tuple[bool, List[str]]:
         errors.append(f"Phone: {phone_error}")
     
     # URL validation
-    if not validate_url(data.get('website', '')):
+    if not DataValidator.validate_url(data.get('website', '')):
         errors.append("Website: Invalid URL format")
     
     # Coordinate validation
@@ -601,11 +643,11 @@ def validate_organization_data(data: Dict) -> Tuple[bool, List[str]]:
         errors.append(f"Phone: {phone_error}")
     
     # Email validation
-    if not validate_email(data.get('email', '')):
+    if not DataValidator.validate_email(data.get('email', '')):
         errors.append("Email: Invalid email format")
     
     # URL validation
-    if not validate_url(data.get('website', '')):
+    if not DataValidator.validate_url(data.get('website', '')):
         errors.append("Website: Invalid URL format")
     
     return len(errors) == 0, errors
@@ -630,11 +672,11 @@ def validate_announcement_data(data: Dict) -> Tuple[bool, List[str]]:
         errors.append(f"Author: {author_error}")
     
     # Email validation
-    if not validate_email(data.get('email', '')):
+    if not DataValidator.validate_email(data.get('email', '')):
         errors.append("Email: Invalid email format")
     
     # URL validation
-    if not validate_url(data.get('link', '')):
+    if not DataValidator.validate_url(data.get('link', '')):
         errors.append("Link: Invalid URL format")
     
     # Date validation for show_at and expires_at
@@ -661,9 +703,21 @@ def validate_announcement_data(data: Dict) -> Tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
+# Record types whose CSV rows carry a phone column
+PHONE_DATA_TYPES = ('locations', 'organizations')
+PHONE_FORMAT_ERROR = "Phone: Invalid phone number format"
+
+
+def invalid_phone_rows(data_list: List[Dict]) -> List[bool]:
+    """Flag rows whose phone fails DataValidator.validate_phone, normalizing the column in one batch."""
+    phones = [str(data.get('phone') or '').strip() for data in data_list]
+    return [not result.valid for result in default_normalizer().normalize_many(phones)]
+
+
 def validate_csv_data(data_list: List[Dict], data_type: str) -> Tuple[bool, List[str]]:
     """Validate a list of CSV data records."""
     all_errors = []
+    bad_phones = invalid_phone_rows(data_list) if data_type in PHONE_DATA_TYPES else None
     
     for i, data in enumerate(data_list, 1):
         row_errors = []
@@ -680,10 +734,167 @@ def validate_csv_data(data_list: List[Dict], data_type: str) -> Tuple[bool, List
             all_errors.append(f"Row {i}: Unknown data type '{data_type}'")
             continue
         
+        if bad_phones and bad_phones[i - 1]:
+            valid = False
+            errors.append(PHONE_FORMAT_ERROR)
+        
         if not valid:
             for error in errors:
                 row_errors.append(f"Row {i}: {error}")
         
         all_errors.extend(row_errors)
     
-    return len(all_errors) == 0, all_errors 
\ No newline at end of file
+    return len(all_errors) == 0, all_errors 
+
+# Structured, parallel CSV validation
+
+ROW_VALIDATORS = {
+    'events': validate_event_data,
+    'locations': validate_location_data,
+    'organizations': validate_organization_data,
+    'announcements': validate_announcement_data,
+}
+
+# (message fragment, code) - first match wins
+ISSUE_CODES = (
+    ('is required', 'required'),
+    ('characters or less', 'too_long'),
+    ('invalid', 'invalid_format'),
+    ('in the future', 'in_past'),
+    ('must be after', 'out_of_order'),
+    ('must be between', 'out_of_range'),
+)
+
+
+class ValidationIssue(NamedTuple):
+    """One validation failure: 1-based row, field (from the message label), code and message."""
+    row: int
+    field: str
+    code: str
+    message: str
+
+
+@dataclass
+class ValidationSummary:
+    """Aggregate result of validate_csv_data_parallel."""
+    data_type: str
+    rows: int = 0
+    invalid_rows: int = 0
+    issue_count: int = 0
+    field_counts: Dict[str, int] = dataclass_field(default_factory=dict)
+    code_counts: Dict[str, int] = dataclass_field(default_factory=dict)
+    samples: List[ValidationIssue] = dataclass_field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def valid(self) -> bool:
+        return self.issue_count == 0
+
+    def format(self) -> str:
+        lines = [f"{self.data_type}: {self.rows} rows, {self.invalid_rows} invalid, "
+                 f"{self.issue_count} issues ({self.seconds:.2f}s)"]
+        for field, count in sorted(self.field_counts.items(), key=lambda item: -item[1]):
+            lines.append(f"  {field}: {count}")
+        for issue in self.samples:
+            lines.append(f"  Row {issue.row}: {issue.message}")
+        return '\n'.join(lines)
+
+
+@lru_cache(maxsize=4096)
+def _classify(error: str) -> Tuple[str, str]:
+    label, _, message = error.partition(': ')
+    lowered = message.lower()
+    code = next((code for fragment, code in ISSUE_CODES if fragment in lowered), 'invalid')
+    return label.lower().replace(' ', '_'), code
+
+
+def to_issue(row: int, error: str) -> ValidationIssue:
+    """Structure a 'Label: message' error string from the row validators."""
+    field, code = _classify(error)
+    return ValidationIssue(row, field, code, error)
+
+
+# Rows shared with forked workers (copy-on-write) instead of pickling every shard
+_shared_rows: Optional[List[Dict]] = None
+
+
+def _validate_chunk(args: Tuple[str, int, Optional[List[Dict]], int, int]) -> Tuple[int, Counter, Counter, Dict[str, List[ValidationIssue]]]:
+    """Validate one shard; returns invalid rows, field/code counts and the first samples per field."""
+    data_type, start, rows, end, samples_per_field = args
+    if rows is None:
+        rows = _shared_rows[start:end]
+    validator = ROW_VALIDATORS[data_type]
+    invalid_rows = 0
+    field_counts: Counter = Counter()
+    code_counts: Counter = Counter()
+    samples: Dict[str, List[ValidationIssue]] = {}
+    bad_phones = invalid_phone_rows(rows) if data_type in PHONE_DATA_TYPES else None
+    for offset, data in enumerate(rows):
+        valid, errors = validator(data)
+        if bad_phones and bad_phones[offset]:
+            valid = False
+            errors.append(PHONE_FORMAT_ERROR)
+        if valid:
+            continue
+        invalid_rows += 1
+        for error in errors:
+            issue = to_issue(start + offset + 1, error)
+            field_counts[issue.field] += 1
+            code_counts[issue.code] += 1
+            field_samples = samples.setdefault(issue.field, [])
+            if len(field_samples) < samples_per_field:
+                field_samples.append(issue)
+    return invalid_rows, field_counts, code_counts, samples
+
+
+def validate_csv_data_parallel(data_list: List[Dict], data_type: str, workers: Optional[int] = None,
+                               chunk_size: int = 5000, samples_per_field: int = 5,
+                               max_samples: int = 100) -> ValidationSummary:
+    """
+    Validate CSV records across worker processes and return a compact summary.
+
+    Rows are sharded into `chunk_size` slices; each worker returns counts and
+    at most `samples_per_field` example issues per field, so the result stays
+    small however many rows fail. Samples are the earliest failing rows, at
+    most `max_samples` in total. Inputs that fit in one chunk (or workers=1)
+    are validated in-process.
+    """
+    if data_type not in ROW_VALIDATORS:
+        raise ValueError(f"Unknown data type '{data_type}'")
+    started = _time.perf_counter()
+    global _shared_rows
+    bounds = [(start, min(start + chunk_size, len(data_list))) for start in range(0, len(data_list), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(bounds) <= 1:
+        results = [_validate_chunk((data_type, start, data_list[start:end], end, samples_per_field))
+                   for start, end in bounds]
+    else:
+        # Forked workers read the rows from memory; other start methods get pickled slices
+        forked = multiprocessing.get_start_method() == 'fork'
+        chunks = [(data_type, start, None if forked else data_list[start:end], end, samples_per_field)
+                  for start, end in bounds]
+        _shared_rows = data_list if forked else None
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+                results = list(executor.map(_validate_chunk, chunks))
+        finally:
+            _shared_rows = None
+
+    summary = ValidationSummary(data_type=data_type, rows=len(data_list))
+    field_counts: Counter = Counter()
+    code_counts: Counter = Counter()
+    samples: Dict[str, List[ValidationIssue]] = {}
+    for invalid_rows, chunk_fields, chunk_codes, chunk_samples in results:
+        summary.invalid_rows += invalid_rows
+        field_counts.update(chunk_fields)
+        code_counts.update(chunk_codes)
+        for field, issues in chunk_samples.items():
+            kept = samples.setdefault(field, [])
+            kept.extend(issues[:samples_per_field - len(kept)])
+    summary.issue_count = sum(field_counts.values())
+    summary.field_counts = dict(field_counts)
+    summary.code_counts = dict(code_counts)
+    summary.samples = sorted((issue for issues in samples.values() for issue in issues),
+                             key=lambda issue: issue.row)[:max_samples]
+    summary.seconds = _time.perf_counter() - started
+    return summary
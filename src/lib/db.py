@@ -0,0 +1,143 @@
+"""
+Direct PostgreSQL access for data scripts that bypass PostgREST.
+
+Provides a shared connection pool, server-side cursors for streaming large
+result sets, execute_values-based batched writes and COPY bulk loads.
+"""
+
+import io
+import os
+import uuid
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+from psycopg2 import pool, sql
+from psycopg2.extensions import make_dsn
+from psycopg2.extras import execute_values
+
+_pool: Optional[pool.ThreadedConnectionPool] = None
+
+
+def get_database_url() -> str:
+    """Get the database DSN (DATABASE_URL, else PG* variables with local Supabase defaults)."""
+    url = os.environ.get("DATABASE_URL")
+    if url:
+        return url
+    return make_dsn(
+        host=os.environ.get("PGHOST", "localhost"),
+        port=os.environ.get("PGPORT", "54322"),
+        dbname=os.environ.get("PGDATABASE", "postgres"),
+        user=os.environ.get("PGUSER", "postgres"),
+        password=os.environ.get("PGPASSWORD", "postgres"),
+    )
+
+
+def get_pool(minconn: int = 1, maxconn: int = 4) -> pool.ThreadedConnectionPool:
+    """Get the shared connection pool, creating it on first use."""
+    global _pool
+    if _pool is None or _pool.closed:
+        _pool = pool.ThreadedConnectionPool(minconn, maxconn, get_database_url())
+    return _pool
+
+
+def close_pool() -> None:
+    """Close every pooled connection."""
+    global _pool
+    if _pool is not None and not _pool.closed:
+        _pool.closeall()
+    _pool = None
+
+
+@contextmanager
+def get_connection() -> Iterator[Any]:
+    """Borrow a pooled connection; commits on success, rolls back on error."""
+    db_pool = get_pool()
+    conn = db_pool.getconn()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        db_pool.putconn(conn)
+
+
+@contextmanager
+def get_cursor(cursor_factory=None) -> Iterator[Any]:
+    """Borrow a pooled connection and yield a cursor inside one transaction."""
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=cursor_factory) as cur:
+            yield cur
+
+
+def stream_rows(conn, query: str, params: Optional[Sequence] = None,
+                itersize: int = 2000, cursor_factory=None) -> Iterator[Any]:
+    """
+    Stream a large result set through a named server-side cursor.
+
+    Rows are fetched from the server `itersize` at a time instead of being
+    materialized client-side. The connection must stay in its transaction
+    until iteration finishes.
+    """
+    with conn.cursor(name=f"stream_{uuid.uuid4().hex}", cursor_factory=cursor_factory) as cur:
+        cur.itersize = itersize
+        cur.execute(query, params)
+        yield from cur
+
+
+def insert_values(cur, table: str, columns: Sequence[str], rows: Iterable[Sequence],
+                  on_conflict: Optional[str] = None, returning: Optional[str] = None,
+                  page_size: int = 1000) -> List[tuple]:
+    """
+    Insert many rows with multi-row VALUES statements.
+
+    `on_conflict` is appended verbatim (e.g. "ON CONFLICT (id) DO NOTHING").
+    With ON CONFLICT ... DO UPDATE, rows must be unique on the conflict key:
+    PostgreSQL rejects a statement that updates the same row twice ("cannot
+    affect row a second time"), so callers de-duplicate first.
+    When `returning` is given, the returned rows are collected in input order.
+    """
+    query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s"
+    if on_conflict:
+        query += f" {on_conflict}"
+    if returning:
+        query += f" RETURNING {returning}"
+    result = execute_values(cur, query, rows, page_size=page_size, fetch=bool(returning))
+    return result or []
+
+
+def execute_batch_values(cur, query: str, rows: Iterable[Sequence], page_size: int = 1000,
+                         fetch: bool = False) -> List[tuple]:
+    """Run a statement containing a single VALUES %s placeholder over many rows."""
+    result = execute_values(cur, query, rows, page_size=page_size, fetch=fetch)
+    return result or []
+
+
+def _csv_field(value: Any) -> str:
+    """One CSV field for COPY: None unquoted (read as NULL), every other value quoted."""
+    if value is None:
+        return ''
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def copy_rows(cur, table: str, columns: Sequence[str], rows: Iterable[Sequence]) -> int:
+    """
+    Bulk load rows with COPY FROM STDIN (CSV format).
+
+    None is written as an unquoted empty field, which COPY reads as NULL;
+    every other value is quoted, so empty strings load as ''. Table and
+    column names are quoted as identifiers. Returns the number of rows copied.
+    """
+    buffer = io.StringIO()
+    count = 0
+    for row in rows:
+        buffer.write(','.join(_csv_field(value) for value in row))
+        buffer.write('\n')
+        count += 1
+    buffer.seek(0)
+    statement = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+        sql.Identifier(table), sql.SQL(', ').join(sql.Identifier(column) for column in columns)
+    )
+    cur.copy_expert(statement.as_string(cur), buffer)
+    return count
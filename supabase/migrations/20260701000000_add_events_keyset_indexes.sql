@@ -0,0 +1,5 @@
+-- Composite indexes for keyset pagination (scripts/event_query.py).
+-- Pages are ordered by (sort column, id) and continue with a row comparison
+-- such as (start_date, id) > ($1, $2), which these indexes serve directly.
+CREATE INDEX IF NOT EXISTS idx_events_start_date_id ON public.events (start_date, id);
+CREATE INDEX IF NOT EXISTS idx_events_created_at_id ON public.events (created_at, id);
@@ -0,0 +1,33 @@
+-- =============================================================================
+-- link_checks: latest HTTP health check for each URL referenced by events
+-- (website, registration_link, external_image_url) and organizations (website).
+--
+-- Written in bulk by scripts/link_checker.py. Rows are keyed by URL, so join
+-- on the URL columns to find events and organizations with dead links.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS public.link_checks (
+  url          text        PRIMARY KEY,
+  ok           boolean     NOT NULL,
+  status_code  integer,
+  final_url    text,
+  method       text,
+  error        text,
+  elapsed_ms   integer     NOT NULL DEFAULT 0,
+  checked_at   timestamptz NOT NULL DEFAULT now()
+);
+
+-- Admin dead-link listings only look at failures
+CREATE INDEX IF NOT EXISTS link_checks_broken_idx
+  ON public.link_checks (checked_at DESC)
+  WHERE NOT ok;
+
+ALTER TABLE public.link_checks ENABLE ROW LEVEL SECURITY;
+
+-- Only admins can read or write link checks; the checker uses a direct
+-- database connection and is not subject to RLS
+CREATE POLICY "link_checks_admin"
+  ON public.link_checks
+  FOR ALL
+  USING (has_admin_access())
+  WITH CHECK (has_admin_access());
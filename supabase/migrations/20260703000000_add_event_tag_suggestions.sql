@@ -0,0 +1,36 @@
+-- =============================================================================
+-- event_tag_suggestions: ranked tag suggestions for events without a primary
+-- tag, with the classifier's confidence (softmax probability).
+--
+-- Written in bulk by scripts/tag_classifier.py, which replaces the rows of
+-- every event it scores. model_version identifies the training set the
+-- suggestion came from.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS public.event_tag_suggestions (
+  event_id       uuid        NOT NULL REFERENCES public.events (id) ON DELETE CASCADE,
+  tag_id         uuid        NOT NULL REFERENCES public.tags (id) ON DELETE CASCADE,
+  rank           smallint    NOT NULL,
+  confidence     real        NOT NULL CHECK (confidence >= 0 AND confidence <= 1),
+  model_version  text        NOT NULL,
+  created_at     timestamptz NOT NULL DEFAULT now(),
+  PRIMARY KEY (event_id, tag_id)
+);
+
+-- Admin review lists the most confident suggestions first
+CREATE INDEX IF NOT EXISTS event_tag_suggestions_confidence_idx
+  ON public.event_tag_suggestions (confidence DESC)
+  WHERE rank = 1;
+
+CREATE INDEX IF NOT EXISTS event_tag_suggestions_tag_idx
+  ON public.event_tag_suggestions (tag_id);
+
+ALTER TABLE public.event_tag_suggestions ENABLE ROW LEVEL SECURITY;
+
+-- Only admins can read or write suggestions; the classifier uses a direct
+-- database connection and is not subject to RLS
+CREATE POLICY "event_tag_suggestions_admin"
+  ON public.event_tag_suggestions
+  FOR ALL
+  USING (has_admin_access())
+  WITH CHECK (has_admin_access());